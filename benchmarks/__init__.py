@@ -0,0 +1,13 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Performance benchmarks for `set_game_demo`.
+
+Run the regression suite with `python -m benchmarks`. The other modules in this package print comparison tables, and
+can be run on their own (e.g., `python -m benchmarks.engines`).
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
@@ -0,0 +1,92 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Runs the regression suite, and exits with a non-zero status if a hot path has regressed beyond the threshold.
+
+    python -m benchmarks                  # Compare against benchmarks/baseline.json
+    python -m benchmarks --save           # Record a new baseline
+    python -m benchmarks --scale 0.1      # A quicker, noisier run
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import argparse
+import os
+import sys
+from benchmarks import suite
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def main():
+    """
+    This function is run when the suite is executed from the command-line.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Time the hot paths of SetGame and compare them against a baseline.",
+    )
+
+    parser.add_argument(
+        "-b", "--baseline",
+        dest="baseline",
+        default=BASELINE,
+        help="The baseline JSON file. The default value is `benchmarks/baseline.json`.")
+
+    parser.add_argument(
+        "-t", "--threshold",
+        dest="threshold",
+        type=float,
+        default=0.25,
+        help="How much slower than the baseline a case may be before it fails, as a fraction. "
+        "The default value is `0.25`.")
+
+    parser.add_argument(
+        "--scale",
+        dest="scale",
+        type=float,
+        default=1.0,
+        help="Scales the size of every fixture. The default value is `1.0`.")
+
+    parser.add_argument(
+        "--repeat",
+        dest="repeat",
+        type=int,
+        default=3,
+        help="The number of times to run each case. The default value is `3`.")
+
+    parser.add_argument(
+        "--only",
+        dest="only",
+        help="Only run the cases whose name starts with this prefix.")
+
+    parser.add_argument(
+        "--save",
+        dest="save",
+        action="store_true",
+        help="Record the results as the new baseline instead of comparing against it.")
+
+    flags = parser.parse_args()
+    results = suite.measure(scale=flags.scale, repeat=flags.repeat, only=flags.only)
+
+    if flags.save or not os.path.exists(flags.baseline):
+        suite.save(flags.baseline, results)
+        print("Saved a baseline of {} cases to {}.".format(len(results), flags.baseline))
+        return 0
+
+    regressions = suite.compare(results, suite.load(flags.baseline), flags.threshold)
+
+    if regressions:
+        print()
+        print("{} regressed by more than {:.0%}: {}".format(len(regressions), flags.threshold, ", ".join(regressions)))
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
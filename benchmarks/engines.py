@@ -0,0 +1,57 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Reports the time per _Game_ of `SetGame.play_quiet()` for each engine. Every engine plays the same shuffled decks.
+
+    python -m benchmarks.engines
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import timeit
+from set_game_demo import SetGame
+from set_game_demo.finders import FINDERS
+from benchmarks.fixtures import game_seeds
+
+
+def play(engine, seeds):
+    """
+    Plays one quiet _Game_ per seed.
+
+    `engine (string)`: The name of the engine.
+
+    `seeds (integer[])`: The seeds for shuffling each deck.
+
+    `return (void)`
+    """
+
+    for seed in seeds:
+        SetGame(engine=engine, seed=seed).play_quiet()
+
+
+def run(games=500, repeat=3):
+    """
+    Runs the benchmark and prints the best time per game, in microseconds.
+
+    `games (integer)`: The number of games per engine. The default value is `500`.
+
+    `repeat (integer)`: The number of times to repeat each measurement. The default value is `3`.
+
+    `return (void)`
+    """
+
+    seeds = game_seeds(games)
+
+    print("{:<14}{:>16}".format("engine", "per game"))
+
+    for engine in sorted(FINDERS):
+        best = min(timeit.repeat(lambda engine=engine: play(engine, seeds), number=1, repeat=repeat))
+        print("{:<14}{:>14.1f}us".format(engine, best / games * 1e6))
+
+
+if __name__ == "__main__":
+    run()
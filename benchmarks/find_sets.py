@@ -0,0 +1,54 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Compares every _Set_ finder on boards of 12, 15, 18 and 21 cards, plus a 20-card board with no _Sets_ on it (the
+worst case for any finder).
+
+    python -m benchmarks.find_sets
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import timeit
+from set_game_demo.finders import FINDERS
+from benchmarks.fixtures import BOARD_SIZES, CAP_SET, boards
+
+
+def run(count=200, repeat=5):
+    """
+    Runs the benchmark and prints a table of the best time per board, in microseconds.
+
+    `count (integer)`: The number of boards of each size. The default value is `200`.
+
+    `repeat (integer)`: The number of times to repeat each measurement. The default value is `5`.
+
+    `return (void)`
+    """
+
+    engines = sorted(FINDERS)
+    cases = [("{} cards".format(size), boards(size, count)) for size in BOARD_SIZES]
+    cases.append(("20-card cap set", [list(CAP_SET) for _ in range(count)]))
+
+    print("{:<18}".format("board") + "".join("{:>14}".format(engine) for engine in engines))
+
+    for label, cards in cases:
+        timings = []
+
+        for engine in engines:
+            # Finders remove Sets from the board, so each run gets fresh copies.
+            best = min(timeit.repeat(
+                lambda finder=FINDERS[engine]: [finder(list(board)) for board in cards],
+                number=1,
+                repeat=repeat,
+            ))
+            timings.append(best / len(cards) * 1e6)
+
+        print("{:<18}".format(label) + "".join("{:>12.1f}us".format(t) for t in timings))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,68 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Seeded inputs shared by the benchmarks. The same seed always produces the same boards and games.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+import random
+from set_game_demo.cards import DECK
+
+SEED = 20161018
+
+# A 20-card board with no Sets on it (the largest possible), which is the worst case for any finder.
+CAP_SET = tuple(DECK[i] for i in (0, 1, 3, 4, 9, 10, 12, 13, 27, 28, 32, 35, 38, 47, 59, 65, 66, 67, 71, 77))
+
+BOARD_SIZES = (12, 15, 18, 21)
+
+
+def boards(size, count=200, seed=SEED):
+    """
+    Deals random boards of a given size.
+
+    `size (integer)`: The number of cards on each board.
+
+    `count (integer)`: The number of boards. The default value is `200`.
+
+    `seed (integer)`: The seed for dealing. The default value is `SEED`.
+
+    `return (cards[][])`: A list of boards.
+    """
+
+    rng = random.Random(seed + size)
+
+    return [rng.sample(DECK, size) for _ in range(count)]
+
+
+def triples(count=10000, seed=SEED):
+    """
+    Deals random groups of 3 distinct cards.
+
+    `count (integer)`: The number of groups. The default value is `10000`.
+
+    `seed (integer)`: The seed for dealing. The default value is `SEED`.
+
+    `return (cards[][])`: A list of 3-card groups.
+    """
+
+    rng = random.Random(seed)
+
+    return [rng.sample(DECK, 3) for _ in range(count)]
+
+
+def game_seeds(count=10000, seed=SEED):
+    """
+    Lists the seeds for a number of full games.
+
+    `count (integer)`: The number of games. The default value is `10000`.
+
+    `seed (integer)`: The first seed. The default value is `SEED`.
+
+    `return (integer[])`: One seed per game.
+    """
+
+    return list(range(seed, seed + count))
@@ -0,0 +1,109 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Reports how many _Sets_ per second each format of `set_game_demo.render` writes, next to drawing a new PrettyTable for
+every _Set_ (what `set-game-demo --quiet` used to do). The _Sets_ come from seeded _Games_, and are written to
+`os.devnull`.
+
+    python -m benchmarks.render --sets 100000
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import argparse
+import os
+import timeit
+from prettytable import PrettyTable
+from set_game_demo import SetGame
+from set_game_demo.render import FORMATS, clear_tables, write_sets
+from benchmarks.fixtures import game_seeds
+
+# Drawing a new PrettyTable for every Set is slow, so it is timed over this many Sets, and scaled up.
+SAMPLE = 2000
+
+
+def played_sets(count):
+    """
+    Plays seeded _Games_ until enough _Sets_ have been found.
+
+    `count (integer)`: The number of Sets.
+
+    `return (sets[])`: The Sets.
+    """
+
+    sets = []
+
+    for seed in game_seeds(count):
+        sets += SetGame(seed=seed).play_quiet()[1]
+
+        if len(sets) >= count:
+            break
+
+    return sets[:count]
+
+
+def each_table(sets, out):
+    """
+    Draws a new PrettyTable for every _Set_, and writes it on its own.
+
+    `sets (sets[])`: The Sets.
+
+    `out (file)`: Where to write them.
+
+    `return (void)`
+    """
+
+    for i, sset in enumerate(sets):
+        table = PrettyTable(["Number", "Color", "Shape", "Shading"])
+
+        for card in sset:
+            table.add_row([card["number"], card["color"], card["shape"], card["shading"]])
+
+        out.write("\nSet #{}\n".format(i + 1))
+        out.write("{}\n".format(table))
+
+
+def run(count=100000, repeat=3):
+    """
+    Runs the benchmark and prints the best time of each format.
+
+    `count (integer)`: The number of Sets to write. The default value is `100000`.
+
+    `repeat (integer)`: The number of times to write them in each format. The default value is `3`.
+
+    `return (void)`
+    """
+
+    sets = played_sets(count)
+    sample = sets[:SAMPLE]
+
+    def timed(write, sets):
+        """Writes the Sets to `os.devnull`, starting without any saved tables."""
+        with open(os.devnull, "w") as out:
+            clear_tables()
+            start = timeit.default_timer()
+            write(sets, out)
+
+            return timeit.default_timer() - start
+
+    print("{:<20}{:>14}{:>16}".format("format", "sets/sec", "secs for all"))
+
+    best = min(timed(each_table, sample) for _ in range(repeat)) * len(sets) / len(sample)
+    print("{:<20}{:>14.0f}{:>16.2f}".format("prettytable each", len(sets) / best, best))
+
+    for fmt in FORMATS:
+        best = min(timed(lambda sets, out, fmt=fmt: write_sets(sets, out, fmt), sets) for _ in range(repeat))
+        print("{:<20}{:>14.0f}{:>16.2f}".format(fmt, len(sets) / best, best))
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(description="Time writing Sets in each format.")
+    PARSER.add_argument("-n", "--sets", dest="sets", type=int, default=100000, help="The number of Sets to write.")
+    PARSER.add_argument("-r", "--repeat", dest="repeat", type=int, default=3, help="The number of runs per format.")
+    FLAGS = PARSER.parse_args()
+
+    run(FLAGS.sets, FLAGS.repeat)
@@ -0,0 +1,49 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Reports _Games_ per second when playing by the rules (`SetGame.play_rules()`), for each way of keeping the _Board_,
+next to the greedy `SetGame.play_quiet()` loop. Every row plays the same shuffled decks.
+
+    python -m benchmarks.rules
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import timeit
+from set_game_demo import SetGame
+from benchmarks.fixtures import game_seeds
+
+LOOPS = (
+    ("play_quiet", lambda seed: SetGame(seed=seed).play_quiet()),
+    ("play_rules", lambda seed: SetGame(seed=seed).play_rules()),
+    ("rules[incremental]", lambda seed: list(SetGame(seed=seed).play_rules_iter("incremental"))),
+    ("rules[pairs]", lambda seed: list(SetGame(seed=seed).play_rules_iter("pairs"))),
+)
+
+
+def run(games=1000, repeat=3):
+    """
+    Runs the benchmark and prints the best number of games per second.
+
+    `games (integer)`: The number of games per row. The default value is `1000`.
+
+    `repeat (integer)`: The number of times to repeat each measurement. The default value is `3`.
+
+    `return (void)`
+    """
+
+    seeds = game_seeds(games)
+
+    print("{:<20}{:>16}".format("loop", "games/sec"))
+
+    for name, play in LOOPS:
+        best = min(timeit.repeat(lambda play=play: [play(seed) for seed in seeds], number=1, repeat=repeat))
+        print("{:<20}{:>16.0f}".format(name, games / best))
+
+
+if __name__ == "__main__":
+    run()
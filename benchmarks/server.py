@@ -0,0 +1,196 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Load-tests `set_game_demo.server`: plays many _Games_ at once over localhost, with several players racing to claim
+each _Set_, and reports claims per second and the latency of each claim (from sending `CLAIM` to reading the reply).
+
+    python -m benchmarks.server --games 1000 --players 2
+
+A server is started in a child process, unless `--port` points at one which is already running. Requires Python 3.7
+or newer.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import division, print_function
+import argparse
+import asyncio
+import multiprocessing
+import time
+from set_game_demo import SetGame
+from set_game_demo.cards import DECK
+from set_game_demo.server import DEFAULT_HOST, GameServer
+from benchmarks.fixtures import game_seeds
+
+
+async def play(host, port, seed, joined, latencies, replies):
+    """
+    Plays one player's side of a _Game_: reads the _Board_, and claims the first _Set_ on it, until the _Game_ is over.
+
+    `host (string)`: The address of the server.
+
+    `port (integer)`: The port of the server.
+
+    `seed (integer)`: The seed to start the game with, or `None` to join the game started by another player.
+
+    `joined (asyncio.Future)`: Resolves to the ID of the game, once it has been started.
+
+    `latencies (float[])`: The number of seconds taken by each claim is added to this list.
+
+    `replies (Counter)`: The first word of each reply to a claim is counted here.
+
+    `return (void)`
+    """
+
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async def ask(line):
+        writer.write(line.encode("ascii") + b"\n")
+        return (await reader.readline()).decode("ascii").split()
+
+    if seed is not None:
+        reply = await ask("NEW {}".format(seed))
+        joined.set_result(reply[1])
+    else:
+        reply = await ask("JOIN {}".format(await joined))
+
+    while True:
+        reply = await ask("BOARD")
+
+        if reply[0] == "OVER":
+            break
+
+        sset = SetGame.first_set([DECK[int(card)] for card in reply[1:]])
+        start = time.perf_counter()
+        reply = await ask("CLAIM {} {} {}".format(*[int(card) for card in sset]))
+        latencies.append(time.perf_counter() - start)
+        replies[reply[0]] = replies.get(reply[0], 0) + 1
+
+    await ask("QUIT")
+    writer.close()
+
+
+async def load(host, port, games, players):
+    """
+    Plays every _Game_ at once.
+
+    `host (string)`: The address of the server.
+
+    `port (integer)`: The port of the server.
+
+    `games (integer)`: The number of games.
+
+    `players (integer)`: The number of players in each game.
+
+    `return (tuple(float, float[], dict))`: The number of seconds it took, the latency of each claim, and the number
+        of each reply to a claim.
+    """
+
+    latencies = []
+    replies = {}
+    tasks = []
+
+    for seed in game_seeds(games):
+        joined = asyncio.get_running_loop().create_future()
+
+        for player in range(players):
+            tasks.append(play(host, port, seed if player == 0 else None, joined, latencies, replies))
+
+    start = time.perf_counter()
+    await asyncio.gather(*tasks)
+
+    return (time.perf_counter() - start, latencies, replies)
+
+
+def percentile(values, fraction):
+    """
+    Picks a percentile from a list of values (nearest rank).
+
+    `values (float[])`: The values, in any order.
+
+    `fraction (float)`: The percentile, from `0` to `1` (e.g., `0.99`).
+
+    `return (float)`: The value.
+    """
+
+    ordered = sorted(values)
+
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(games=1000, players=2, host=DEFAULT_HOST, port=None):
+    """
+    Runs the load test, and prints the results.
+
+    `games (integer)`: The number of games to play at once. The default value is `1000`.
+
+    `players (integer)`: The number of players in each game. The default value is `2`.
+
+    `host (string)`: The address of the server. The default value is `127.0.0.1`.
+
+    `port (integer)`: The port of a server which is already running. The default value is `None`, which starts one in
+        a child process.
+
+    `return (void)`
+    """
+
+    child = None
+
+    if port is None:
+        receive, send = multiprocessing.Pipe(duplex=False)
+        child = multiprocessing.Process(target=_serve, args=(host, send))
+        child.daemon = True
+        child.start()
+        port = receive.recv()
+
+    try:
+        seconds, latencies, replies = asyncio.run(load(host, port, games, players))
+    finally:
+        if child is not None:
+            child.terminate()
+            child.join()
+
+    print("{:<20}{:>16}".format("games", games))
+    print("{:<20}{:>16}".format("connections", games * players))
+
+    for reply in sorted(replies):
+        print("{:<20}{:>16}".format("claims[{}]".format(reply), replies[reply]))
+
+    print("{:<20}{:>16.0f}".format("claims/sec", len(latencies) / seconds))
+    print("{:<20}{:>16.3f}".format("p50 latency (ms)", percentile(latencies, 0.5) * 1000))
+    print("{:<20}{:>16.3f}".format("p99 latency (ms)", percentile(latencies, 0.99) * 1000))
+
+
+def _serve(host, send):  # pragma: no cover
+    """
+    Runs a server on a free port, and sends the port back to the parent process.
+
+    `host (string)`: The address to listen on.
+
+    `send (Connection)`: One end of a pipe to the parent process.
+
+    `return (void)`
+    """
+
+    async def serve():
+        server = await GameServer().start(host, 0)
+        send.send(server.sockets[0].getsockname()[1])
+
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(description="Load-test the Set game server.")
+    PARSER.add_argument("-g", "--games", dest="games", type=int, default=1000, help="The number of games at once.")
+    PARSER.add_argument("-p", "--players", dest="players", type=int, default=2, help="The number of players per game.")
+    PARSER.add_argument("--host", dest="host", default=DEFAULT_HOST, help="The address of the server.")
+    PARSER.add_argument("--port", dest="port", type=int, help="The port of a server which is already running.")
+    FLAGS = PARSER.parse_args()
+
+    run(FLAGS.games, FLAGS.players, FLAGS.host, FLAGS.port)
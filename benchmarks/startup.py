@@ -0,0 +1,75 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Reports how long a new Python process takes to import `set_game_demo`, and to play a quiet _Game_ from the command
+line, next to a bare interpreter. Start-up time adds up in short-lived processes, such as pool workers.
+
+    python -m benchmarks.startup
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import division, print_function
+import os
+import subprocess
+import sys
+import timeit
+
+COMMANDS = (
+    ("python", ("-c", "pass")),
+    ("import set_game_demo", ("-c", "import set_game_demo")),
+    ("set-game-demo --quiet", ("-m", "set_game_demo", "--quiet")),
+)
+
+
+def measure(args, repeat=20):
+    """
+    Times a Python command in new processes.
+
+    `args (tuple)`: The arguments to the interpreter.
+
+    `repeat (integer)`: The number of processes to run. The default value is `20`.
+
+    `return (float[])`: The number of seconds taken by each process, fastest first.
+    """
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times = []
+
+    with open(os.devnull, "w") as devnull:
+        for _ in range(repeat):
+            start = timeit.default_timer()
+            subprocess.check_call((sys.executable,) + args, cwd=root, stdout=devnull)
+            times.append(timeit.default_timer() - start)
+
+    return sorted(times)
+
+
+def run(repeat=20):
+    """
+    Runs the benchmark and prints the best and median time of each command, and how much longer than a bare
+    interpreter it took.
+
+    `repeat (integer)`: The number of processes to run per command. The default value is `20`.
+
+    `return (void)`
+    """
+
+    print("{:<24}{:>12}{:>12}{:>14}".format("command", "best (ms)", "median (ms)", "over python"))
+    bare = None
+
+    for name, args in COMMANDS:
+        times = measure(args, repeat)
+        best = times[0]
+        bare = best if bare is None else bare
+
+        print("{:<24}{:>12.1f}{:>12.1f}{:>14.1f}".format(
+            name, best * 1000, times[len(times) // 2] * 1000, (best - bare) * 1000
+        ))
+
+
+if __name__ == "__main__":
+    run()
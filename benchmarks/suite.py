@@ -0,0 +1,217 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+The regression suite: times the hot paths of `SetGame`, and compares them against a stored baseline.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import division, print_function
+import json
+import platform
+import timeit
+from set_game_demo import SetGame
+from benchmarks.fixtures import BOARD_SIZES, CAP_SET, boards, game_seeds, triples
+
+
+def cases(scale=1.0):
+    """
+    Lists the benchmarks in the suite.
+
+    Each case is a `(name, setup, run, operations)` tuple. `setup()` builds fresh inputs for one measurement (and is
+    not timed), `run(inputs)` is the part that is timed, and `operations` is how many operations one run performs.
+
+    `scale (float)`: Scales the size of every fixture. Results are reported per operation, so a smaller scale is
+        faster but noisier. The default value is `1.0`.
+
+    `return (list)`: The cases.
+    """
+
+    def size(count):
+        """Scales a fixture size, keeping at least one item."""
+        return max(1, int(count * scale))
+
+    out = []
+
+    groups = triples(size(10000))
+    dicts = [[card.as_dict() for card in group] for group in groups]
+
+    out.append(("is_a_set[cards]", lambda: groups, _is_a_set, len(groups)))
+    out.append(("is_a_set[dicts]", lambda: dicts, _is_a_set, len(dicts)))
+
+    for count in BOARD_SIZES:
+        fixture = boards(count, size(200))
+        out.append((
+            "find_sets[{}]".format(count),
+            lambda fixture=fixture: [list(board) for board in fixture],
+            _find_sets,
+            len(fixture),
+        ))
+
+    caps = size(200)
+    out.append(("find_sets[cap20]", lambda: [list(CAP_SET) for _ in range(caps)], _find_sets, caps))
+
+    twelves = boards(12, size(200))
+    out.append(("has_set[12]", lambda: twelves, _has_set, len(twelves)))
+    out.append(("has_set[cap20]", lambda: [CAP_SET] * caps, _has_set, caps))
+
+    seeds = game_seeds(size(10000))
+    out.append(("deal", lambda: [SetGame(seed=seed) for seed in seeds[:size(1000)]], _deal, size(1000)))
+    out.append(("play_quiet", lambda: seeds, _play_quiet, len(seeds)))
+    out.append(("play_rules", lambda: seeds, _play_rules, len(seeds)))
+
+    return out
+
+
+def _is_a_set(groups):
+    """Checks each group of 3 cards."""
+    for card1, card2, card3 in groups:
+        SetGame.is_a_set(card1, card2, card3)
+
+
+def _find_sets(fixture):
+    """Finds the Sets on each board."""
+    for board in fixture:
+        SetGame.find_sets(board)
+
+
+def _has_set(fixture):
+    """Checks each board for a Set."""
+    for board in fixture:
+        SetGame.has_set(board)
+
+
+def _deal(games):
+    """Deals every card of each game, 12 and then 3 at a time."""
+    for game in games:
+        game.deal(12)
+
+        while len(game.deck) > 0:
+            game.deal(3)
+
+
+def _play_quiet(seeds):
+    """Plays one quiet game per seed."""
+    for seed in seeds:
+        SetGame(seed=seed).play_quiet()
+
+
+def _play_rules(seeds):
+    """Plays one game by the rules per seed."""
+    for seed in seeds:
+        SetGame(seed=seed).play_rules()
+
+
+def measure(scale=1.0, repeat=3, only=None, min_time=0.2):
+    """
+    Runs the suite.
+
+    `scale (float)`: Scales the size of every fixture. The default value is `1.0`.
+
+    `repeat (integer)`: The number of times to measure each case. The best time is kept. The default value is `3`.
+
+    `only (string)`: Only run cases whose name starts with this prefix. The default value is `None`, which runs them
+        all.
+
+    `min_time (float)`: Short cases are run again (on fresh inputs) until each measurement covers at least this many
+        seconds. The default value is `0.2`.
+
+    `return (dict)`: The best time per operation, in seconds, keyed by case name.
+    """
+
+    results = {}
+
+    for name, setup, run, operations in cases(scale):
+        if only and not name.startswith(only):
+            continue
+
+        best = None
+
+        for _ in range(repeat):
+            elapsed = 0.0
+            done = 0
+
+            while done == 0 or elapsed < min_time:
+                inputs = setup()
+                start = timeit.default_timer()
+                run(inputs)
+                elapsed += timeit.default_timer() - start
+                done += operations
+
+            best = elapsed / done if best is None else min(best, elapsed / done)
+
+        results[name] = best
+
+    return results
+
+
+def save(path, results):
+    """
+    Writes results as a baseline.
+
+    `path (string)`: The JSON file to write.
+
+    `results (dict)`: The results from `measure()`.
+
+    `return (void)`
+    """
+
+    with open(path, "w") as handle:
+        json.dump({
+            "python": "{} {}".format(platform.python_implementation(), platform.python_version()),
+            "results": results,
+        }, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def load(path):
+    """
+    Reads a baseline written by `save()`.
+
+    `path (string)`: The JSON file to read.
+
+    `return (dict)`: The baseline time per operation, in seconds, keyed by case name.
+    """
+
+    with open(path) as handle:
+        return json.load(handle)["results"]
+
+
+def compare(results, baseline, threshold):
+    """
+    Compares results against a baseline, and prints a report.
+
+    `results (dict)`: The results from `measure()`.
+
+    `baseline (dict)`: The results from `load()`.
+
+    `threshold (float)`: How much slower than the baseline a case may be before it counts as a regression. A value of
+        `0.25` allows 25%.
+
+    `return (string[])`: The names of the cases that regressed.
+    """
+
+    regressions = []
+
+    print("{:<20}{:>14}{:>14}{:>10}".format("case", "baseline", "current", "change"))
+
+    for name in sorted(results):
+        current = results[name]
+
+        if name not in baseline:
+            print("{:<20}{:>14}{:>12.2f}us{:>10}".format(name, "-", current * 1e6, "new"))
+            continue
+
+        change = current / baseline[name] - 1
+        flag = ""
+
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSED"
+
+        print("{:<20}{:>12.2f}us{:>12.2f}us{:>+9.0%}{}".format(name, baseline[name] * 1e6, current * 1e6, change, flag))
+
+    return regressions
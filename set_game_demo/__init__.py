@@ -10,12 +10,17 @@ Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
 """
 
 from __future__ import print_function
-import argparse
-import collections
-import itertools
 import random
-import six
-from prettytable import PrettyTable
+from set_game_demo import _compat
+from set_game_demo.board import RulesBoard
+from set_game_demo.cards import COLORS, DECK, NUMBERS, SHADINGS, SHAPES, THIRD
+from set_game_demo.deck import Deck
+from set_game_demo.events import DEAL, GAME_OVER, NO_SET_EXTRA_DEAL, SET_FOUND, Event
+from set_game_demo import finders
+from set_game_demo.finders import DEFAULT_ENGINE, get_finder, new_board
+from set_game_demo.solver import DEFAULT_MAX_NODES, Solver
+from set_game_demo.state import GameState
+from set_game_demo.stats import Stats, active_stats
 
 
 class SetGame(object):
@@ -75,51 +80,89 @@ class SetGame(object):
 
     """
 
-    def __init__(self):
+    def __init__(self, engine=DEFAULT_ENGINE, seed=None, rng=None, stats=False, shared=False):
         """
         Constructs a new instance of this class.
-        """
 
-        self.colors = ["red", "green", "purple"]
-        self.shapes = ["diamond", "squiggle", "oval"]
-        self.shadings = ["solid", "empty", "striped"]
-        self.numbers = ["one", "two", "three"]
+        `engine (string)`: How _Sets_ are found during a _Game_. One of `pairs`, `bitboard`, `incremental`, `table`,
+            `cached` or `combinations`. Every engine finds the same _Sets_. The default value is `pairs`.
+
+        `seed (integer)`: A seed for this game's own random number generator. The same seed always produces the same
+            _Game_, whichever engine is used. The default value is `None`, which draws a seed from the `random`
+            module.
+
+        `rng (random.Random)`: A random number generator to shuffle the _Deck_ with, instead of creating one. Takes
+            precedence over `seed`. The default value is `None`.
 
-        deck = []
+        `stats (boolean|Stats)`: Whether to record counters and timers while the _Game_ is played, in `self.stats`
+            (see `set_game_demo.stats`). A `Stats` object is used as it is, so that several _Games_ can share one.
+            The default value is `False`.
+
+        `shared (boolean)`: Whether other threads will read this _Game_ while it is played. If so, a new `GameState`
+            is published after every event of `play_iter()` and `play_rules_iter()`, for `snapshot()` to hand out
+            without locking, and moves are made while holding `self.lock`. The default value is `False`.
+        """
 
-        for color in self.colors:
-            for shape in self.shapes:
-                for shading in self.shadings:
-                    for number in self.numbers:
-                        card = {}
-                        card["color"] = color
-                        card["shape"] = shape
-                        card["shading"] = shading
-                        card["number"] = number
+        # Fail early on a bad engine name.
+        get_finder(engine)
+        self.engine = engine
 
-                        deck.append(card)
+        self.colors = list(COLORS)
+        self.shapes = list(SHAPES)
+        self.shadings = list(SHADINGS)
+        self.numbers = list(NUMBERS)
 
-        random.shuffle(deck)
+        if rng is None:
+            rng = random.Random(seed if seed is not None else random.getrandbits(64))
 
-        self.deck = collections.deque(deck)
+        # Cards are shared, integer-backed `Card` objects (see `set_game_demo.cards`). The deck only stores their
+        # shuffled order, and is dealt by moving a cursor (see `set_game_demo.deck`).
+        self.rng = rng
+        self.deck = Deck(DECK, self.rng)
         self.board = []
         self.sets = []
 
+        # The number of times that no Set could be found, and more cards had to be dealt.
+        self.stalls = 0
+
+        if stats is True:
+            stats = Stats()
+
+        self.stats = stats or None
+
+        # Readers take the published state without locking: it is only ever replaced, never changed.
+        self.lock = None
+        self.__state = None
+
+        if shared:
+            # Lazy: `threading` is slow to import, and most games are only played by one thread.
+            import threading
+
+            self.lock = threading.RLock()
+            self.__state = GameState(self.__dealing_order())
+
     def deal(self, cards=12):
         """
         Deals a given number of cards from the top (front) of the deck.
 
+        Nothing is copied: the cards come back as a read-only view of the deck. Use `list()` on it for a board which
+        can be changed (e.g., by `find_sets()`).
+
         `cards (integer)`: The number of cards to deal out to the board. The default value is `12`.
 
-        `return (cards[])`: A list (i.e., array) of objects representing cards.
+        `return (DeckSlice)`: A sequence of objects representing cards. Raises an `IndexError` if the deck does not
+            have that many cards left.
         """
 
-        out = []
+        stats = active_stats()
+
+        if stats is None:
+            return self.deck.deal(cards)
 
-        for _ in six.moves.range(cards):
-            out.append(self.deck.popleft())
+        dealt = stats.time("deal", self.deck.deal, cards)
+        stats.count("deal.cards", len(dealt))
 
-        return out
+        return dealt
 
     def play(self):  # pragma: no cover
         """
@@ -132,23 +175,23 @@ class SetGame(object):
         # Introduction
         print("Welcome to a game of Set.")
         print()
-        six.moves.input("=> Press any key to continue...")
+        _compat.input("=> Press any key to continue...")
 
         # First deal
         print()
         print("Dealing 12 cards onto the board.")
-        self.board = self.deal(12)
+        self.board = list(self.deal(12))
         SetGame.display_cards(self.board)
         print()
         print("Cards on the board: {}".format(len(self.board)))
         print("Cards in the deck:  {}".format(len(self.deck)))
         print("Sets discovered:    {}".format(len(self.sets)))
-        six.moves.input("=> Press any key to continue...")
+        _compat.input("=> Press any key to continue...")
 
         while len(self.deck) > 0:
             # Find sets
             print()
-            sets = self.find_sets(self.board)
+            sets = self.find_sets(self.board, self.engine)
             print("Discovered {quantity}.".format(
                 quantity=SetGame.plural(len(sets), "set", "sets")
             ))
@@ -165,7 +208,7 @@ class SetGame(object):
             SetGame.display_cards(self.board)
             print()
             self.sets += sets
-            six.moves.input("=> Press any key to continue...")
+            _compat.input("=> Press any key to continue...")
 
             # Deal 3 more cards
             print()
@@ -178,11 +221,11 @@ class SetGame(object):
             print("Cards on the board: {}".format(len(self.board)))
             print("Cards in the deck:  {}".format(len(self.deck)))
             print("Sets discovered:    {}".format(len(self.sets)))
-            six.moves.input("=> Press any key to continue...")
+            _compat.input("=> Press any key to continue...")
 
         # Find the very last set(s)
         print()
-        sets = self.find_sets(self.board)
+        sets = self.find_sets(self.board, self.engine)
         print("Discovered {quantity}.".format(
             quantity=SetGame.plural(len(sets), "set", "sets")
         ))
@@ -199,7 +242,7 @@ class SetGame(object):
         SetGame.display_cards(self.board)
         print()
         self.sets += sets
-        six.moves.input("=> Press any key to continue...")
+        _compat.input("=> Press any key to continue...")
 
         # No more cards in the deck.
         print()
@@ -210,7 +253,7 @@ class SetGame(object):
         ))
         SetGame.display_cards(self.board)
         print()
-        six.moves.input("=> Congratulations! You have completed the game. Press any key to see the results.")
+        _compat.input("=> Congratulations! You have completed the game. Press any key to see the results.")
 
         # Final score.
         print()
@@ -235,19 +278,257 @@ class SetGame(object):
         `return (tuple(integer, sets[]))`: Returns a tuple where the first item is the number of Sets discovered. The
             second item is the complete list of Sets.
         """
-        self.board = self.deal(12)
+
+        for event in self.play_iter():
+            if event.kind == SET_FOUND:
+                self.sets.append(event.cards)
+            elif event.kind == NO_SET_EXTRA_DEAL:
+                self.stalls += 1
+
+        # Return a tuple
+        return (len(self.sets), self.sets)
+
+    def play_iter(self):
+        """
+        Play a (quiet) game of Set, one event at a time.
+
+        Unlike `play_quiet()`, nothing is accumulated: the Sets are handed over as they are found, and are not kept in
+        `self.sets`. The cards left over are stored in `self.board` when the game is over.
+
+        `return (generator)`: Yields an `Event` for each deal (`DEAL`, or `NO_SET_EXTRA_DEAL` when no Set could be found
+            first), for each Set found (`SET_FOUND`), and finally `GAME_OVER` with the cards left on the board. See
+            `set_game_demo.events`.
+        """
+
+        events = self.__play_iter()
+
+        if self.lock is not None:
+            events = self.__publish(events)
+
+        return events if self.stats is None else self.stats.wrap(events)
+
+    def __play_iter(self):
+        """
+        Plays the _Game_ behind `play_iter()`.
+
+        `return (generator)`: Yields an `Event` for each thing that happens.
+        """
+
+        cards = self.deal(12)
+        board = new_board(self.engine, cards)
+        yield Event(DEAL, cards)
 
         # Find sets and re-deal until we are out of cards.
         while len(self.deck) > 0:
-            self.sets += self.find_sets(self.board)
-            self.board += self.deal(3)
+            found = False
+
+            for sset in SetGame.__take_sets(board):
+                found = True
+                yield Event(SET_FOUND, sset)
+
+            cards = self.deal(3)
+            board.add(cards)
+            yield Event(DEAL if found else NO_SET_EXTRA_DEAL, cards)
 
         # Find the very last set(s).
-        self.sets += self.find_sets(self.board)
+        for sset in SetGame.__take_sets(board):
+            yield Event(SET_FOUND, sset)
+
+        self.board = board.cards
+        yield Event(GAME_OVER, self.board)
+
+    def play_rules(self):
+        """
+        Play a (quiet) game of Set by the rules, one _Set_ at a time.
+
+        `return (tuple(integer, sets[]))`: Returns a tuple where the first item is the number of Sets discovered. The
+            second item is the complete list of Sets.
+        """
+
+        for event in self.play_rules_iter():
+            if event.kind == SET_FOUND:
+                self.sets.append(event.cards)
+            elif event.kind == NO_SET_EXTRA_DEAL:
+                self.stalls += 1
 
         # Return a tuple
         return (len(self.sets), self.sets)
 
+    def play_rules_iter(self, engine=None):
+        """
+        Play a (quiet) game of Set by the rules, one event at a time.
+
+        Unlike `play_iter()`, the game follows the rules in the class docstring: one _Set_ is taken at a time (the
+        earliest, in board order), and the _Board_ is refilled to 12 cards. Three extra cards are only dealt when there
+        is no _Set_ on the _Board_. The game is over when the _Deck_ is empty and no _Set_ is left.
+
+        `engine (string)`: How the _Board_ is kept. The default value is `None`, which keeps a `RulesBoard` that
+            only searches what has changed since the last move. `incremental` keeps a `BoardIndex`, and any other
+            engine searches the whole _Board_ with `first_set()` on every move. Every engine plays the same game.
+
+        `return (generator)`: Yields the same `Event`s as `play_iter()`. `DEAL` follows a Set which was taken,
+            `NO_SET_EXTRA_DEAL` follows a Board with no Set on it.
+        """
+
+        events = self.__play_rules_iter(engine)
+
+        if self.lock is not None:
+            events = self.__publish(events)
+
+        return events if self.stats is None else self.stats.wrap(events)
+
+    def __play_rules_iter(self, engine):
+        """
+        Plays the _Game_ behind `play_rules_iter()`.
+
+        `engine (string)`: How the _Board_ is kept.
+
+        `return (generator)`: Yields an `Event` for each thing that happens.
+        """
+
+        cards = self.deal(12)
+        board = RulesBoard(cards) if engine is None else new_board(engine, cards)
+        yield Event(DEAL, cards)
+
+        while True:
+            stats = active_stats()
+            sset = board.take_set() if stats is None else stats.time("take_set", board.take_set)
+
+            if sset is not None:
+                yield Event(SET_FOUND, sset)
+
+                # Refill to 12, but don't replace the cards taken from a board which had extras dealt onto it.
+                if len(board) < 12 and len(self.deck) > 0:
+                    cards = self.deal(3)
+                    board.add(cards)
+                    yield Event(DEAL, cards)
+
+            elif len(self.deck) > 0:
+                cards = self.deal(3)
+                board.add(cards)
+                yield Event(NO_SET_EXTRA_DEAL, cards)
+
+            else:
+                break
+
+        self.board = board.cards
+        yield Event(GAME_OVER, self.board)
+
+    def __publish(self, events):
+        """
+        Makes each move of a shared _Game_ while holding `self.lock`, and publishes the state which follows it.
+
+        `events (generator)`: The events of the Game.
+
+        `return (generator)`: Yields the same events.
+        """
+
+        while True:
+            with self.lock:
+                event = next(events, None)
+
+                if event is None:
+                    return
+
+                self.__state = self.__state.apply(event)
+
+            yield event
+
+    def snapshot(self):
+        """
+        Takes an immutable snapshot of this _Game_, which can be read, and explored (see `GameState.futures()`), from
+        any thread while the _Game_ goes on.
+
+        A shared _Game_ (see `shared`) hands out the state published after its latest event, without locking. Cards
+        dealt by calling `deal()` directly, and _Games_ played by `solve()`, are not published. Any other _Game_ is
+        read from its fields, so it must not be played by another thread at the same time.
+
+        `return (GameState)`: The state of the Game.
+        """
+
+        state = self.__state
+
+        if state is not None:
+            return state
+
+        return GameState(self.__dealing_order(), self.deck.cursor, self.board, self.sets, self.stalls)
+
+    def commit(self, state, expected=None):
+        """
+        Moves this _Game_ to a state, such as one of the futures found by a solver (see `GameState.futures()`).
+
+        The fields of the _Game_ (`board`, `sets`, `stalls` and the _Deck_) are moved, but a `play_iter()` or
+        `play_rules_iter()` which is already under way keeps its own _Board_, and should not be resumed.
+
+        `state (GameState)`: The new state. It must come from this Game's deck.
+
+        `expected (GameState)`: The state that the Game must still be in, as returned by `snapshot()`. If another
+            thread has moved the Game on since, nothing is changed. The default value is `None`, which always moves
+            the Game.
+
+        `return (boolean)`: Whether the Game was moved to the new state.
+        """
+
+        if self.lock is None:
+            return self.__commit(state, expected)
+
+        with self.lock:
+            return self.__commit(state, expected)
+
+    def __commit(self, state, expected):
+        """
+        Moves this _Game_ to a state, behind `commit()`.
+
+        `return (boolean)`: Whether the Game was moved to the new state.
+        """
+
+        if state.cards != self.__dealing_order():
+            raise ValueError("The state does not come from this game's deck.")
+
+        if expected is not None and self.snapshot() != expected:
+            return False
+
+        self.deck.cursor = state.cursor
+        self.board = list(state.board)
+        self.sets = [list(sset) for sset in state.sets]
+        self.stalls = state.stalls
+
+        if self.__state is not None:
+            self.__state = state
+
+        return True
+
+    def __dealing_order(self):
+        """
+        Lists every card of the _Deck_, in the order they are dealt.
+
+        `return (Card[])`: The cards.
+        """
+
+        return tuple(map(self.deck.cards.__getitem__, self.deck.order))
+
+    def solve(self, rules=False, max_nodes=DEFAULT_MAX_NODES):
+        """
+        Play the best possible (quiet) game of Set with this deck, choosing which Sets to take to find the most.
+
+        See `set_game_demo.solver` for how the search works.
+
+        `rules (boolean)`: Whether to play like `play_rules()` instead of `play_quiet()`. The default value is `False`.
+
+        `max_nodes (integer)`: The number of game states to search before settling for the best game found so far.
+            The default value is `200000`.
+
+        `return (tuple(integer, sets[]))`: Returns a tuple where the first item is the number of Sets discovered. The
+            second item is the complete list of Sets.
+        """
+
+        solver = Solver(self.deal(len(self.deck)), rules=rules, max_nodes=max_nodes)
+        discovered, self.sets = solver.solve()
+        self.board = solver.board
+
+        # Return a tuple
+        return (discovered, self.sets)
+
     @staticmethod
     def display_cards(cards):  # pragma: no cover
         """
@@ -258,12 +539,10 @@ class SetGame(object):
         `return (void)`
         """
 
-        table = PrettyTable(["Number", "Color", "Shape", "Shading"])
+        # Only load the renderer (and PrettyTable) when something is displayed.
+        from set_game_demo.render import card_table
 
-        for card in cards:
-            table.add_row([card["number"], card["color"], card["shape"], card["shading"]])
-
-        print(table)
+        print(card_table(cards))
 
     @staticmethod
     def is_a_set(card1, card2, card3):
@@ -280,6 +559,10 @@ class SetGame(object):
             a set. A value of `False` means that the group is _not_ a set.
         """
 
+        # Integer-backed cards can be checked with a single table lookup.
+        if isinstance(card1, int) and isinstance(card2, int) and isinstance(card3, int):
+            return THIRD[card1][card2] == card3
+
         for attribute in ["color", "shape", "shading", "number"]:
             if (SetGame.__all_unique([
                     card1[attribute],
@@ -299,57 +582,80 @@ class SetGame(object):
         return True
 
     @staticmethod
-    def find_sets(board):
+    def find_sets(board, engine=DEFAULT_ENGINE):
         """
         Given a _Board_ of cards, determines whether or not it contains a _Set_.
 
+        Each _Set_ that is found is removed from the _Board_. See `set_game_demo.finders` for how they are found, and
+        `GameState.find_sets()` for a search which leaves the _Board_ alone.
+
         `board (cards[])`: A list (i.e., array) of Cards that are on the Board.
 
+        `engine (string)`: The name of the engine to search with. The default value is `pairs`.
+
         `return (sets[])`: A list (i.e., array) of Sets. Each Set contains 3 Cards.
         """
 
-        sets = []
-
-        # Calculate the initial set of combinations.
-        combinations = itertools.combinations(six.moves.range(len(board)), 3)
+        stats = active_stats()
 
-        # Run until we explicitly break.
-        while True:
+        if stats is None:
+            return get_finder(engine)(board)
 
-            # Grab the combination.
-            combination = next(combinations, None)
+        stats.count("find_sets.cards", len(board))
+        sets = stats.time("find_sets", get_finder(engine), board)
+        stats.count("find_sets.sets", len(sets))
 
-            # As long as we didn't get a `None` back...
-            while combination is not None:
+        return sets
 
-                # Check to see if the three cards we got back for this combination are a Set.
-                if SetGame.is_a_set(board[combination[0]], board[combination[1]], board[combination[2]]) is True:
+    @staticmethod
+    def __take_sets(board):
+        """
+        Removes _Sets_ from a _Board_ until none are left, recording them if stats are active.
 
-                    # If so, save them.
-                    sets.append([board[combination[0]], board[combination[1]], board[combination[2]]])
+        `board (BoardIndex|ListBoard)`: The Board.
 
-                    # After we save the Set, remove the cards from the Board.
-                    # Python list indexes collapse automatically, so remove from the end first.
-                    del board[combination[2]]
-                    del board[combination[1]]
-                    del board[combination[0]]
+        `return (sets[])`: A list (i.e., array) of the Sets that were removed. Each Set contains 3 Cards.
+        """
 
-                    # This means that we now need to recalculate the Board, and start our loop over again.
-                    combinations = itertools.combinations(six.moves.range(len(board)), 3)
-                    break
+        stats = active_stats()
 
-                else:
-                    # Move on to the next combination in the list.
-                    combination = next(combinations, None)
-                    continue
+        if stats is None:
+            return board.take_sets()
 
-            # If we have reached the end of the list of combinations, quit.
-            if combination is None:
-                break
+        stats.count("find_sets.cards", len(board))
+        sets = stats.time("find_sets", board.take_sets)
+        stats.count("find_sets.sets", len(sets))
 
-        # Return all matching sets.
         return sets
 
+    @staticmethod
+    def has_set(board):
+        """
+        Given a _Board_ of cards, determines whether or not it contains a _Set_, stopping at the first one.
+
+        The _Board_ is left untouched. This is much cheaper than `find_sets()` when only a yes or no is needed.
+
+        `board (cards[])`: A list (i.e., array) of Cards that are on the Board.
+
+        `return (boolean)`: Whether or not the board contains a Set.
+        """
+
+        return finders.has_set(board)
+
+    @staticmethod
+    def first_set(board):
+        """
+        Given a _Board_ of cards, finds the first _Set_ on it (the one `find_sets()` would take first).
+
+        The _Board_ is left untouched.
+
+        `board (cards[])`: A list (i.e., array) of Cards that are on the Board.
+
+        `return (cards[]|None)`: A Set of 3 Cards, or `None` if there are no Sets on the Board.
+        """
+
+        return finders.first_set(board)
+
     @staticmethod
     def __all_unique(arr):
         """
@@ -403,38 +709,13 @@ class SetGame(object):
 
 def main():  # pragma: no cover
     """
-    This function is run when the script is executed from the command-line.
+    This function is run when the script is executed from the command-line. See `set_game_demo.cli`, which is only
+    loaded when it is needed.
     """
 
-    # Available CLI flags.
-    parser = argparse.ArgumentParser(
-        description="Play a game of Set.",
-    )
-
-    parser.add_argument(
-        "-q", "--quiet",
-        dest="quiet",
-        action="store_true",
-        help="By default, the game will play in chatty, interactive mode. "
-        "This will enable a quieter, results-only mode.")
-
-    parser.set_defaults(quiet=False)
-    flags = parser.parse_args()
-    game = SetGame()
-
-    if flags.quiet:
-        discovered, sets = game.play_quiet()
-        print("You discovered {quantity}.".format(
-            quantity=SetGame.plural(discovered, "set", "sets")
-        ))
-
-        for i, sset in enumerate(sets):
-            print()
-            print("Set #{index}".format(index=(i + 1)))
-            SetGame.display_cards(sset)
+    from set_game_demo.cli import main as run
 
-    else:
-        game.play()
+    run()
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,28 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+The few differences between Python 2 and 3 that the modules loaded by `import set_game_demo` rely on.
+
+`six` covers the same ground (and the rest of the package still uses it), but it takes several milliseconds to import,
+which is a large part of the start-up time of a short-lived process.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+# pylint: disable=E0602,W0622
+
+import sys
+
+if sys.version_info[0] == 2:  # pragma: no cover
+    import itertools
+
+    input = raw_input
+    map = itertools.imap
+    range = xrange
+else:
+    input = input
+    map = map
+    range = range
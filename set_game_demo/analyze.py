@@ -0,0 +1,289 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Analyzes recorded _Boards_ in bulk, streaming them from a file (or `stdin`) and writing one result per _Board_.
+
+Two input formats are understood:
+
+* `jsonl`: One _Board_ per line, as a JSON array of cards (card IDs, or dicts with `color`, `shape`, `shading` and
+  `number` keys), or as an object with a `board` array and an optional `id`, which is copied into the result.
+  Blank lines are skipped.
+* `binary`: One _Board_ after another, each as a byte holding the number of cards, followed by one byte per card ID.
+  `write_binary()` writes this format.
+
+Results are written as JSON lines, in the same order as the _Boards_:
+
+* `find` mode (the default) removes _Sets_ like `SetGame.find_sets()`:
+  `{"index": 0, "has_set": true, "sets": [[0, 1, 2]], "leftover": [40, 80]}`
+* `has` mode only checks for a _Set_, like `SetGame.has_set()`: `{"index": 0, "has_set": true}`
+
+A _Board_ which can't be read gets `{"index": 0, "error": "..."}` instead, and the rest carry on.
+
+_Boards_ are read and analyzed in batches. With a pool of workers, only a few batches per worker are in flight at any
+time, and results are written as soon as the oldest batch is done, so memory use does not grow with the size of the
+input.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+import collections
+import itertools
+import json
+import multiprocessing
+import struct
+from set_game_demo.cards import to_card
+from set_game_demo.finders import DEFAULT_ENGINE, get_finder, has_set
+
+FORMATS = ("jsonl", "binary")
+MODES = ("find", "has")
+
+# The number of Boards handed to a worker at a time.
+DEFAULT_BATCH_SIZE = 1000
+
+
+def analyze(source, sink, fmt="jsonl", mode="find", engine=DEFAULT_ENGINE, workers=1,
+            batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Analyzes every _Board_ in a stream, and writes the results as they are ready.
+
+    `source (file)`: Where to read the Boards from. Opened in binary mode for `binary`, and either mode for `jsonl`.
+
+    `sink (file)`: Where to write the results, as JSON lines. Opened in text mode.
+
+    `fmt (string)`: The input format. One of `jsonl` or `binary`. The default value is `jsonl`.
+
+    `mode (string)`: What to work out. One of `find` or `has`. The default value is `find`.
+
+    `engine (string)`: How _Sets_ are found in `find` mode. The default value is `pairs`.
+
+    `workers (integer)`: The number of processes to use. A value of `1` analyzes every Board in this process. The
+        default value is `1`. `None` uses one process per CPU.
+
+    `batch_size (integer)`: The number of Boards handed to a worker at a time. The default value is `1000`.
+
+    `return (dict)`: Totals: the number of `boards`, how many of them had a Set (`with_sets`), and how many `errors`
+        there were.
+    """
+
+    if fmt not in FORMATS:
+        raise ValueError("Unknown format {!r}. Choose one of: {}.".format(fmt, ", ".join(FORMATS)))
+
+    if mode not in MODES:
+        raise ValueError("Unknown mode {!r}. Choose one of: {}.".format(mode, ", ".join(MODES)))
+
+    # Fail early on a bad engine name.
+    get_finder(engine)
+
+    records = read_records(source, fmt)
+    tasks = (
+        (fmt, mode, engine, start, batch)
+        for start, batch in _batches(records, batch_size)
+    )
+    totals = {"boards": 0, "with_sets": 0, "errors": 0}
+
+    if workers == 1:
+        for task in tasks:
+            _write(sink, _analyze_batch(task), totals)
+
+        return totals
+
+    pool = multiprocessing.Pool(workers)
+    pending = collections.deque()
+
+    # Keep every worker busy, with one batch waiting for each, but read no further ahead than that.
+    ahead = 2 * (workers or multiprocessing.cpu_count())
+
+    try:
+        for task in tasks:
+            pending.append(pool.apply_async(_analyze_batch, (task,)))
+
+            if len(pending) >= ahead:
+                _write(sink, pending.popleft().get(), totals)
+
+        while pending:
+            _write(sink, pending.popleft().get(), totals)
+    except BaseException:
+        pool.terminate()
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+
+    return totals
+
+
+def read_records(source, fmt="jsonl"):
+    """
+    Splits a stream into the raw records of each _Board_, without decoding them.
+
+    `source (file)`: Where to read the Boards from.
+
+    `fmt (string)`: The input format. One of `jsonl` or `binary`. The default value is `jsonl`.
+
+    `return (generator)`: Yields one line (for `jsonl`) or one string of card IDs (for `binary`) per Board.
+    """
+
+    if fmt == "jsonl":
+        for line in source:
+            if line.strip():
+                yield line
+
+        return
+
+    while True:
+        header = source.read(1)
+
+        if not header:
+            return
+
+        length = struct.unpack("B", header)[0]
+        cards = source.read(length)
+
+        if len(cards) != length:
+            raise ValueError("The binary input ends in the middle of a board.")
+
+        yield cards
+
+
+def write_binary(boards, sink):
+    """
+    Writes _Boards_ in the compact binary format.
+
+    `boards (cards[][])`: The Boards. Each card is a card ID, or a dict-shaped card.
+
+    `sink (file)`: Where to write them. Opened in binary mode.
+
+    `return (integer)`: The number of Boards written.
+    """
+
+    count = 0
+
+    for board in boards:
+        cards = [to_card(card) for card in board]
+
+        if len(cards) > 255:
+            raise ValueError("A board in the binary format holds at most 255 cards.")
+
+        sink.write(struct.pack("B{}B".format(len(cards)), len(cards), *cards))
+        count += 1
+
+    return count
+
+
+def _batches(records, size):
+    """
+    Groups records into batches, numbering them as they go.
+
+    `records (iterable)`: The records.
+
+    `size (integer)`: The number of records per batch.
+
+    `return (generator)`: Yields the index of the first record of each batch, and the batch itself.
+    """
+
+    records = iter(records)
+    start = 0
+
+    while True:
+        batch = list(itertools.islice(records, size))
+
+        if not batch:
+            return
+
+        yield (start, batch)
+        start += len(batch)
+
+
+def _analyze_batch(task):
+    """
+    Analyzes one batch of _Boards_.
+
+    `task (tuple)`: The input format, the mode, the engine name, the index of the first Board, and the raw records.
+
+    `return (tuple[])`: For each Board, its result as a line of JSON, whether it had a Set, and whether it failed.
+    """
+
+    fmt, mode, engine, start, batch = task
+    finder = get_finder(engine)
+    results = []
+
+    for index, record in enumerate(batch, start):
+        result = {"index": index}
+
+        try:
+            board = _decode(record, fmt, result)
+
+            if mode == "has":
+                result["has_set"] = has_set(board)
+            else:
+                sets = finder(board)
+                result["has_set"] = bool(sets)
+                result["sets"] = [[int(card) for card in sset] for sset in sets]
+                result["leftover"] = [int(card) for card in board]
+        except (KeyError, TypeError, ValueError) as error:
+            result = {"index": index, "error": "{}: {}".format(type(error).__name__, error)}
+
+        results.append((json.dumps(result, sort_keys=True), result.get("has_set", False), "error" in result))
+
+    return results
+
+
+def _decode(record, fmt, result):
+    """
+    Reads one _Board_ from its raw record.
+
+    `record (string)`: A line of JSON, or a string of card IDs.
+
+    `fmt (string)`: The input format.
+
+    `result (dict)`: The result of this Board, which the Board's `id` is copied into.
+
+    `return (Card[])`: The cards on the Board.
+    """
+
+    if fmt == "binary":
+        cards = struct.unpack("{}B".format(len(record)), record)
+    else:
+        if isinstance(record, bytes):
+            record = record.decode("utf-8")
+
+        cards = json.loads(record)
+
+        if isinstance(cards, dict):
+            if "id" in cards:
+                result["id"] = cards["id"]
+
+            cards = cards["board"]
+
+        if not isinstance(cards, list):
+            raise ValueError("A board must be a list of cards.")
+
+    for card in cards:
+        if isinstance(card, int) and not 0 <= card < 81:
+            raise ValueError("Card IDs go from 0 to 80, not {}.".format(card))
+
+    return [to_card(card) for card in cards]
+
+
+def _write(sink, results, totals):
+    """
+    Writes the results of one batch, and adds them to the totals.
+
+    `sink (file)`: Where to write the results.
+
+    `results (tuple[])`: The results, from `_analyze_batch()`.
+
+    `totals (dict)`: The totals so far.
+
+    `return (void)`
+    """
+
+    for line, found, failed in results:
+        sink.write(line + "\n")
+        totals["boards"] += 1
+        totals["with_sets"] += found
+        totals["errors"] += failed
@@ -0,0 +1,114 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Checks large numbers of 3-card groups at once.
+
+NumPy is optional. Install it with `pip install skyzyx-set-game-demo[numpy]` to get vectorized checks; without it, the
+same functions fall back to plain Python and return lists instead of arrays.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+import numbers
+from set_game_demo.cards import THIRD
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+_THIRD_ARRAY = None
+
+
+def is_a_set_batch(triples, use_numpy=True):
+    """
+    Determines which groups of 3 cards are _Sets_.
+
+    Three cards are a _Set_ when, for every attribute, their digits add up to a multiple of 3.
+
+    `triples (array)`: Either an `(N, 3)` array of card IDs, or an `(N, 3, 4)` array of attribute digits (color,
+        shape, shading, number; each `0`–`2`). Nested lists are accepted too.
+
+    `use_numpy (boolean)`: Whether to use NumPy when it is installed. The default value is `True`.
+
+    `return (boolean[])`: A mask with one entry per group. A value of `True` means that the group is a set. This is a
+        NumPy array when NumPy is used, or a list otherwise.
+    """
+
+    if numpy is not None and use_numpy:
+        return _is_a_set_numpy(triples)
+
+    return _is_a_set_python(triples)
+
+
+def _is_a_set_numpy(triples):
+    """
+    The vectorized implementation of `is_a_set_batch()`.
+
+    `triples (array)`: An `(N, 3)` array of card IDs, or an `(N, 3, 4)` array of attribute digits.
+
+    `return (ndarray)`: A boolean mask with one entry per group.
+    """
+
+    values = numpy.asarray(triples)
+
+    if values.size == 0:
+        return numpy.zeros(0, dtype=bool)
+
+    # Card IDs only need a gather from the third-card table, which is much cheaper than splitting them into digits.
+    if values.ndim == 2 and values.shape[1] == 3:
+        # Out-of-range IDs would otherwise wrap around (or fail) inside the gather.
+        low, high = values.min(), values.max()
+
+        if low < 0 or high > 80:
+            raise ValueError("Card IDs go from 0 to 80, not {}.".format(low if low < 0 else high))
+
+        return _third_array()[values[:, 0], values[:, 1]] == values[:, 2]
+
+    if values.ndim != 3 or values.shape[1:] != (3, 4):
+        raise ValueError("Expected an (N, 3) array of card IDs or an (N, 3, 4) array of digits, not {}.".format(
+            values.shape
+        ))
+
+    return (values.sum(axis=1, dtype=numpy.int16) % 3 == 0).all(axis=-1)
+
+
+def _third_array():
+    """
+    Builds (once) a NumPy copy of the third-card table.
+
+    `return (ndarray)`: An `(81, 81)` array, where `[a, b]` is the card which completes a Set with `a` and `b`.
+    """
+
+    global _THIRD_ARRAY  # pylint: disable=W0603
+
+    if _THIRD_ARRAY is None:
+        _THIRD_ARRAY = numpy.array(THIRD, dtype=numpy.int8)
+
+    return _THIRD_ARRAY
+
+
+def _is_a_set_python(triples):
+    """
+    The pure-Python implementation of `is_a_set_batch()`.
+
+    `triples (array)`: A sequence of 3-card groups, as card IDs or as attribute digits.
+
+    `return (boolean[])`: A list with one entry per group.
+    """
+
+    out = []
+
+    for card1, card2, card3 in triples:
+        if isinstance(card1, numbers.Integral):
+            if not 0 <= min(card1, card2, card3) <= max(card1, card2, card3) <= 80:
+                raise ValueError("Card IDs go from 0 to 80, not {}.".format([card1, card2, card3]))
+
+            out.append(THIRD[card1][card2] == card3)
+        else:
+            out.append(all((a + b + c) % 3 == 0 for a, b, c in zip(card1, card2, card3)))
+
+    return out
@@ -0,0 +1,390 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Boards which remember what they know about their own _Sets_, so that a change to the _Board_ only costs a search of
+the cards that changed.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from set_game_demo import _compat
+from set_game_demo.cards import DECK, THIRD, to_card
+
+
+class BoardIndex(object):
+    """
+    A _Board_ which keeps track of its own _Sets_ as cards are added and removed.
+
+    For every pair of cards on the _Board_, the index knows which card would complete it. Adding or removing a card
+    only touches the pairs that card is part of, so dealing 3 cards onto a _Board_ of `n` costs `3n` lookups instead
+    of a fresh search, and "is there a _Set_ now?" is answered without any search at all.
+
+    Cards keep the order in which they were added, and `take_sets()` makes the same choices as
+    `SetGame.find_sets()` does for a list in that order.
+    """
+
+    def __init__(self, cards=()):
+        """
+        Constructs a new instance of this class.
+
+        `cards (cards[])`: The cards to start with. The default value is an empty _Board_.
+        """
+
+        # Card IDs in board order, and the original card objects keyed by ID.
+        self.__order = []
+        self.__cards = {}
+
+        # An ever-increasing counter which records the board order of each card ID (or `-1` if it is not here).
+        self.__serial = 0
+        self.__position = [-1] * 81
+
+        # For each card ID, the number of pairs on the board which it would complete.
+        self.__needed = [0] * 81
+
+        # Every Set on the board, as a frozenset of card IDs.
+        self.__sets = set()
+
+        self.add(cards)
+
+    def __len__(self):
+        return len(self.__order)
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def __contains__(self, card):
+        return self.__position[to_card(card)] != -1
+
+    @property
+    def cards(self):
+        """
+        `return (cards[])`: A list (i.e., array) of the cards on the board, in the order they were added.
+        """
+
+        return [self.__cards[card] for card in self.__order]
+
+    def add(self, cards):
+        """
+        Adds cards to the board, recording every _Set_ they complete.
+
+        `cards (cards[])`: A list (i.e., array) of cards to add.
+
+        `return (void)`
+        """
+
+        order = self.__order
+        position = self.__position
+        needed = self.__needed
+
+        for card in cards:
+            new = to_card(card)
+
+            if position[new] != -1:
+                raise ValueError("{!r} is already on the board.".format(new))
+
+            completes = THIRD[new]
+
+            for other in order:
+                third = completes[other]
+                needed[third] += 1
+
+                # Each new Set is seen from both of its older cards; only record it from the first of them.
+                if position[third] > position[other]:
+                    self.__sets.add(frozenset((new, other, third)))
+
+            order.append(new)
+            self.__cards[new] = card
+            position[new] = self.__serial
+            self.__serial += 1
+
+    def remove(self, cards):
+        """
+        Removes cards from the board, forgetting every _Set_ they were part of.
+
+        `cards (cards[])`: A list (i.e., array) of cards to remove.
+
+        `return (void)`
+        """
+
+        for card in cards:
+            old = to_card(card)
+
+            if self.__position[old] == -1:
+                raise ValueError("{!r} is not on the board.".format(old))
+
+            self.__discard(old)
+
+    def has_set(self):
+        """
+        Determines whether there is at least one _Set_ on the board.
+
+        `return (boolean)`: Whether or not the board contains a _Set_.
+        """
+
+        return len(self.__sets) > 0
+
+    def completions(self):
+        """
+        Lists the cards that would complete a _Set_ if they were added to the board.
+
+        `return (cards[])`: A list (i.e., array) of cards, in deck order.
+        """
+
+        return [DECK[card] for card, count in enumerate(self.__needed) if count > 0 and self.__position[card] == -1]
+
+    def sets(self):
+        """
+        Lists every _Set_ on the board. _Sets_ may share cards.
+
+        `return (sets[])`: A list (i.e., array) of Sets, in board order. Each Set contains 3 Cards.
+        """
+
+        return [
+            [self.__cards[card] for card in self.__ordered(triple)]
+            for triple in sorted(self.__sets, key=self.__key)
+        ]
+
+    def take_sets(self):
+        """
+        Removes _Sets_ from the board until none are left, taking the earliest _Set_ (in board order) each time.
+
+        `return (sets[])`: A list (i.e., array) of the Sets that were removed. Each Set contains 3 Cards.
+        """
+
+        sets = []
+
+        while self.__sets:
+            triple = self.__ordered(min(self.__sets, key=self.__key))
+            sets.append([self.__cards[card] for card in triple])
+
+            for card in triple:
+                self.__discard(card)
+
+        return sets
+
+    def take_set(self):
+        """
+        Removes the earliest _Set_ (in board order) from the board.
+
+        `return (cards[]|None)`: The Set that was removed, or `None` if there are no Sets on the board.
+        """
+
+        if not self.__sets:
+            return None
+
+        triple = self.__ordered(min(self.__sets, key=self.__key))
+        sset = [self.__cards[card] for card in triple]
+
+        for card in triple:
+            self.__discard(card)
+
+        return sset
+
+    def __discard(self, old):
+        """
+        Removes a card which is known to be on the board.
+
+        `old (integer)`: The ID of the card to remove.
+
+        `return (void)`
+        """
+
+        order = self.__order
+        position = self.__position
+        needed = self.__needed
+
+        order.remove(old)
+        del self.__cards[old]
+        position[old] = -1
+
+        completes = THIRD[old]
+
+        for other in order:
+            third = completes[other]
+            needed[third] -= 1
+
+            if position[third] != -1:
+                self.__sets.discard(frozenset((old, other, third)))
+
+    def __ordered(self, triple):
+        """
+        Sorts the cards of a _Set_ by board order.
+
+        `triple (frozenset)`: The card IDs of a Set.
+
+        `return (tuple)`: The card IDs, in board order.
+        """
+
+        return tuple(sorted(triple, key=self.__position.__getitem__))
+
+    def __key(self, triple):
+        """
+        Ranks a _Set_ by the board positions of its cards, so that `min()` finds the earliest one.
+
+        `triple (frozenset)`: The card IDs of a Set.
+
+        `return (tuple)`: The board positions of the cards, in ascending order.
+        """
+
+        return tuple(sorted(self.__position[card] for card in triple))
+
+
+class RulesBoard(object):
+    """
+    A _Board_ for playing by the rules: one _Set_ is taken at a time, and new cards are added to the end.
+
+    The _Board_ is a plain list, searched for the earliest _Set_ in board order (like `first_set()`), but it remembers
+    how far the last search got. When a search takes the _Set_ at positions `(i, j, k)`, no _Set_ starts before `i`
+    among the cards which were there. Taking cards away cannot create a _Set_, so the next search only has to check
+    whether the cards dealt since then complete one from there, which is one lookup per new card instead of one per
+    card on the board. Everything from `i` on is searched as usual.
+    """
+
+    def __init__(self, cards=()):
+        """
+        Constructs a new instance of this class.
+
+        `cards (cards[])`: The cards to start with. The default value is an empty _Board_.
+        """
+
+        self.cards = []
+
+        # The position of each card on the board, indexed by card ID.
+        self.__where = [-1] * 81
+
+        # No Set starts in `cards[:clean]` using only `cards[:seen]`.
+        self.__clean = 0
+        self.__seen = 0
+
+        self.add(cards)
+
+    def __len__(self):
+        return len(self.cards)
+
+    def add(self, cards):
+        """
+        Adds cards to the end of the board.
+
+        `cards (cards[])`: A list (i.e., array) of cards to add.
+
+        `return (void)`
+        """
+
+        where = self.__where
+
+        for card in cards:
+            new = to_card(card)
+
+            if where[new] != -1:
+                raise ValueError("{!r} is already on the board.".format(new))
+
+            where[new] = len(self.cards)
+            self.cards.append(new)
+
+    def take_set(self):
+        """
+        Removes the earliest _Set_ (in board order) from the board.
+
+        `return (cards[]|None)`: The Set that was removed, or `None` if there are no Sets on the board.
+        """
+
+        cards = self.cards
+        where = self.__where
+        length = len(cards)
+        found = self.__search_clean(length) or self.__search_rest(length)
+
+        if found is None:
+            self.__clean = self.__seen = length
+            return None
+
+        i, j, k = found
+        sset = [cards[i], cards[j], cards[k]]
+
+        # Python list indexes collapse automatically, so remove from the end first.
+        del cards[k]
+        del cards[j]
+        del cards[i]
+
+        for card in sset:
+            where[card] = -1
+
+        for position in _compat.range(i, len(cards)):
+            where[cards[position]] = position
+
+        self.__clean = i
+        self.__seen = length - 3
+
+        return sset
+
+    def take_sets(self):
+        """
+        Removes _Sets_ from the board until none are left, taking the earliest _Set_ (in board order) each time.
+
+        `return (sets[])`: A list (i.e., array) of the Sets that were removed. Each Set contains 3 Cards.
+        """
+
+        sets = []
+        sset = self.take_set()
+
+        while sset is not None:
+            sets.append(sset)
+            sset = self.take_set()
+
+        return sets
+
+    def __search_clean(self, length):
+        """
+        Finds the earliest _Set_ which starts in the clean part of the board. It must use a card added since then.
+
+        `length (integer)`: The number of cards on the board.
+
+        `return (tuple|None)`: The board positions of the Set, in ascending order.
+        """
+
+        cards = self.cards
+        where = self.__where
+        fresh = _compat.range(self.__seen, length)
+
+        for i in _compat.range(self.__clean):
+            completes = THIRD[cards[i]]
+            best = None
+
+            for new in fresh:
+                other = where[completes[cards[new]]]
+
+                if other > i:
+                    pair = (other, new) if other < new else (new, other)
+
+                    if best is None or pair < best:
+                        best = pair
+
+            if best is not None:
+                return (i,) + best
+
+        return None
+
+    def __search_rest(self, length):
+        """
+        Finds the earliest _Set_ which starts after the clean part of the board.
+
+        `length (integer)`: The number of cards on the board.
+
+        `return (tuple|None)`: The board positions of the Set, in ascending order.
+        """
+
+        cards = self.cards
+        where = self.__where
+
+        for i in _compat.range(self.__clean, length - 2):
+            completes = THIRD[cards[i]]
+
+            for j in _compat.range(i + 1, length - 1):
+                k = where[completes[cards[j]]]
+
+                if k > j:
+                    return (i, j, k)
+
+        return None
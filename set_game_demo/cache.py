@@ -0,0 +1,311 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A cache of the _Sets_ on each _Board_ that has been seen before.
+
+A _Board_ is keyed by a bitmask of its cards (bit `c` for card `c`), so the same cards give the same key in any
+order. Each entry holds every _Set_ on that _Board_. The greedy choice of which _Sets_ to take depends on the order of
+the cards, so it is made again on every lookup from the cached _Sets_, which is cheap.
+
+Recent entries are kept in a bounded least-recently-used cache. Entries can also be written to a file with `dump()`
+and read back with `load()` into a read-only table, which is never evicted. Worker processes can all load the same
+table (see `set_game_demo.simulate.simulate()`).
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from set_game_demo import _compat
+from set_game_demo.cards import THIRD, to_card
+
+# The number of Boards kept in the least-recently-used part of the cache.
+DEFAULT_MAXSIZE = 65536
+
+# BITS[c] is the key of a Board holding only card `c`.
+BITS = tuple(1 << card for card in range(81))
+
+_CACHE = None
+
+
+class SetCache(object):
+    """
+    A bounded, least-recently-used cache of the _Sets_ on each _Board_.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, third=None):
+        """
+        Constructs a new instance of this class.
+
+        `maxsize (integer)`: The number of Boards to keep, not counting the read-only table. The default value is
+            `65536`.
+
+        `third (callable)`: Works out the card which completes a Set with two others, for decks other than the
+            standard one (e.g., `set_game_demo.hyper.SetSpace(3).third`). Cards are then used as they are. The default
+            value is `None`, which uses the standard deck.
+        """
+
+        self.maxsize = maxsize
+        self.third = third
+
+        # Read-only entries, loaded from a file.
+        self.table = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Loaded here rather than with the module, which `import set_game_demo` always loads.
+        import collections
+
+        self.__recent = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self.table) + len(self.__recent)
+
+    def sets_on(self, cards):
+        """
+        Lists every _Set_ made up of the given cards. _Sets_ may share cards.
+
+        `cards (integer[])`: A list of distinct card IDs (or packed cards, with `third`).
+
+        `return (tuple[])`: Every Set, as a tuple of 3 card IDs in ascending order.
+        """
+
+        key = 0
+
+        for card in cards:
+            key |= 1 << card
+
+        return self.__lookup(cards, key)
+
+    def find_sets(self, board):
+        """
+        Removes _Sets_ from a _Board_ until none are left, using the cached _Sets_ of the _Board_.
+
+        The earliest _Set_ (in board order) is taken each time, just like `SetGame.find_sets()`.
+
+        `board (cards[])`: A list (i.e., array) of Cards that are on the Board. Sets are removed from it.
+
+        `return (sets[])`: A list (i.e., array) of Sets. Each Set contains 3 Cards.
+        """
+
+        cards = board
+
+        try:
+            if self.third is None:
+                key = sum(_compat.map(BITS.__getitem__, cards))
+            else:
+                key = sum(1 << card for card in cards)
+        except (IndexError, TypeError):
+            # Not a card ID; probably a dict-shaped card.
+            key = None
+
+        if key is None and self.third is None:
+            try:
+                cards = [to_card(card) for card in board]
+                key = sum(_compat.map(BITS.__getitem__, cards))
+            except KeyError:
+                pass
+
+        # Adding up the bits only matches the number of cards if no card is there twice.
+        if key is None or bin(key).count("1") != len(cards):
+            if self.third is not None:
+                raise ValueError("A board cannot hold the same card twice.")
+
+            # Avoid a circular import; the finders use this cache.
+            from set_game_demo.finders import find_sets_combinations
+
+            # Not a card from the standard deck, or the same card twice.
+            return find_sets_combinations(board)
+
+        found = self.__lookup(cards, key)
+
+        if not found:
+            return []
+
+        position = dict((card, index) for index, card in enumerate(cards)).__getitem__
+
+        # Taking the earliest Set each time is the same as walking every Set in order of board positions, and taking
+        # those which don't share a card with one already taken.
+        used = set()
+        sets = []
+
+        for triple in sorted([sorted(_compat.map(position, triple)) for triple in found]):
+            if used.isdisjoint(triple):
+                used.update(triple)
+                sets.append([board[index] for index in triple])
+
+        board[:] = [card for index, card in enumerate(board) if index not in used]
+
+        return sets
+
+    def stats(self):
+        """
+        Summarizes how well the cache is doing.
+
+        `return (dict)`: The number of hits, misses and evictions, the hit rate, and the number of entries.
+        """
+
+        lookups = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": float(self.hits) / lookups if lookups else 0.0,
+            "size": len(self.__recent),
+            "table": len(self.table),
+        }
+
+    def clear(self):
+        """
+        Empties the least-recently-used part of the cache, and resets the counters. The read-only table is kept.
+
+        `return (void)`
+        """
+
+        self.__recent.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def dump(self, path):
+        """
+        Writes every entry (including the read-only table) to a JSON file, to be read back with `load()`.
+
+        `path (string)`: The file to write.
+
+        `return (void)`
+        """
+
+        import json
+
+        entries = dict(self.table)
+        entries.update(self.__recent)
+
+        with open(path, "w") as handle:
+            json.dump({"boards": [[key, [list(triple) for triple in found]] for key, found in entries.items()]}, handle)
+
+    def load(self, path):
+        """
+        Adds the entries in a file written by `dump()` to the read-only table.
+
+        `path (string)`: The file to read.
+
+        `return (void)`
+        """
+
+        import json
+
+        with open(path) as handle:
+            for key, found in json.load(handle)["boards"]:
+                self.table[key] = tuple(tuple(triple) for triple in found)
+
+    def __lookup(self, cards, key):
+        """
+        Looks up the _Sets_ of a _Board_ in the table and then the recent entries, or works them out and keeps them.
+
+        `cards (integer[])`: A list of distinct card IDs (or packed cards, with `third`).
+
+        `key (integer)`: The bitmask of the cards.
+
+        `return (tuple[])`: Every Set, as a tuple of 3 card IDs in ascending order.
+        """
+
+        found = self.table.get(key)
+
+        if found is not None:
+            self.hits += 1
+            return found
+
+        recent = self.__recent
+        found = recent.get(key)
+
+        if found is not None:
+            self.hits += 1
+            _move_to_end(recent, key)
+            return found
+
+        self.misses += 1
+        found = self.__compute(cards, key)
+
+        if self.maxsize > 0:
+            if len(recent) >= self.maxsize:
+                recent.popitem(last=False)
+                self.evictions += 1
+
+            recent[key] = found
+
+        return found
+
+    def __compute(self, cards, key):
+        """
+        Lists every _Set_ made up of the given cards, by looking up the third card of each pair.
+
+        `cards (integer[])`: A list of distinct card IDs (or packed cards, with `third`).
+
+        `key (integer)`: The bitmask of the cards.
+
+        `return (tuple[])`: Every Set, as a tuple of 3 card IDs in ascending order.
+        """
+
+        third = self.third or (lambda card1, card2: THIRD[card1][card2])
+        ordered = sorted(int(card) for card in cards)
+        found = []
+
+        for i, card1 in enumerate(ordered):
+            for card2 in ordered[i + 1:]:
+                card3 = int(third(card1, card2))
+
+                if card3 > card2 and key >> card3 & 1:
+                    found.append((card1, card2, card3))
+
+        return tuple(found)
+
+
+def _move_to_end(recent, key):
+    """
+    Marks an entry as the most recently used.
+
+    `recent (OrderedDict)`: The recent entries.
+
+    `key (integer)`: The key of the entry.
+
+    `return (void)`
+    """
+
+    if hasattr(recent, "move_to_end"):
+        recent.move_to_end(key)
+    else:  # pragma: no cover
+        # Python 2's OrderedDict only moves an entry to the end when it is inserted again.
+        recent[key] = recent.pop(key)
+
+
+def get_cache():
+    """
+    Returns the shared cache of the standard deck, creating it the first time.
+
+    `return (SetCache)`: The cache.
+    """
+
+    global _CACHE  # pylint: disable=W0603
+
+    if _CACHE is None:
+        _CACHE = SetCache()
+
+    return _CACHE
+
+
+def load_cache(path):
+    """
+    Adds the entries in a file written by `SetCache.dump()` to the read-only table of the shared cache.
+
+    `path (string)`: The file to read.
+
+    `return (SetCache)`: The cache.
+    """
+
+    cache = get_cache()
+    cache.load(path)
+
+    return cache
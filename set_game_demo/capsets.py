@@ -0,0 +1,324 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Counts exactly how many _Boards_ of each size have no _Set_ on them (known as cap sets), up to the largest possible
+size of 20 cards. Dividing by the number of _Boards_ of that size gives the probability that a random _Board_ has no
+_Set_:
+
+    python -m set_game_demo.capsets --workers 8 --checkpoint caps.json
+
+Counting every _Board_ one at a time would take far too long (there are trillions of them), so only one _Board_ of each
+class is kept, where a class is every _Board_ which a symmetry of the _Deck_ maps onto another (see
+`set_game_demo.symmetry`), along with the size of its class. Classes of size `k + 1` are found by adding each card
+which doesn't complete a _Set_ to each class of size `k`, and canonicalizing the result.
+
+The sizes follow from counting the same things twice. Every _Board_ of size `k + 1` can be made in exactly `k + 1`
+ways, by adding one of its cards to the others. So if the class of `B` has `size(B)` _Boards_, then for each class `C`
+of size `k + 1`:
+
+    size(C) = sum(size(B) × (the number of cards which turn B into a Board in C)) / (k + 1)
+
+taken over every class `B` of size `k`. No symmetry ever has to be counted.
+
+Each size is split into chunks of classes, which can be spread across a pool of processes. Progress can be saved to a
+checkpoint file, and a search which was stopped picks up from the last chunk saved.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import division, print_function
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+import six
+from set_game_demo.cards import THIRD
+from set_game_demo.symmetry import canonical_form
+
+# The largest Board with no Set on it.
+MAX_CAP = 20
+
+# The number of classes handed to a worker at a time.
+DEFAULT_CHUNK_SIZE = 50
+
+# The number of seconds between saves of the checkpoint, in the middle of a size.
+DEFAULT_SAVE_EVERY = 60.0
+
+
+def count_caps(max_size=MAX_CAP, workers=1, checkpoint=None, chunk_size=DEFAULT_CHUNK_SIZE,
+               save_every=DEFAULT_SAVE_EVERY, progress=None):
+    """
+    Counts the _Boards_ of each size which have no _Set_ on them.
+
+    `max_size (integer)`: The largest Board to count. The default value is `20`.
+
+    `workers (integer)`: The number of processes to use. A value of `1` does everything in this process. The default
+        value is `1`. `None` uses one process per CPU.
+
+    `checkpoint (string)`: A JSON file to save progress to. If it already exists, the search resumes from it. The
+        default value is `None`, which saves nothing.
+
+    `chunk_size (integer)`: The number of classes handed to a worker at a time. The default value is `50`.
+
+    `save_every (float)`: The number of seconds between saves of the checkpoint, in the middle of a size. The
+        checkpoint is always saved when a size is finished. The default value is `60.0`.
+
+    `progress (callable)`: Called with each size and its count, as soon as it is known (including those read from the
+        checkpoint). The default value is `None`.
+
+    `return (integer[])`: The number of Boards with no Set, indexed by size (from `0` to `max_size`).
+    """
+
+    state = _load(checkpoint) if checkpoint is not None and os.path.exists(checkpoint) else _start()
+    pool = multiprocessing.Pool(workers) if workers != 1 else None
+
+    if progress is not None:
+        for size, count in enumerate(state["counts"][:max_size + 1]):
+            progress(size, count)
+
+    try:
+        while len(state["counts"]) <= max_size:
+            _grow(state, pool, checkpoint, chunk_size, save_every)
+
+            if progress is not None:
+                progress(len(state["counts"]) - 1, state["counts"][-1])
+    except BaseException:
+        # Don't wait for the rest of the work on an error or Ctrl-C; the checkpoint has what is done.
+        if pool is not None:
+            pool.terminate()
+        raise
+    else:
+        if pool is not None:
+            pool.close()
+    finally:
+        if pool is not None:
+            pool.join()
+
+    return state["counts"][:max_size + 1]
+
+
+def no_set_probabilities(counts):
+    """
+    Works out the probability that a random _Board_ of each size has no _Set_ on it.
+
+    `counts (integer[])`: The number of Boards with no Set, indexed by size (from `count_caps()`).
+
+    `return (float[])`: The probabilities, indexed by size.
+    """
+
+    return [count / _binomial(81, size) for size, count in enumerate(counts)]
+
+
+def _start():
+    """
+    Builds the state of a new search: the empty _Board_, which is a class of its own.
+
+    `return (dict)`: The state.
+    """
+
+    return {"counts": [1], "classes": [[[], 1]], "done": 0, "next": {}}
+
+
+def _grow(state, pool, checkpoint, chunk_size, save_every):
+    """
+    Finds the classes one card larger than the current ones, and counts them.
+
+    `state (dict)`: The state of the search. Updated in place.
+
+    `pool (multiprocessing.Pool)`: The worker pool, or `None` to work in this process.
+
+    `checkpoint (string)`: The file to save progress to, or `None`.
+
+    `chunk_size (integer)`: The number of classes per chunk.
+
+    `save_every (float)`: The number of seconds between saves.
+
+    `return (void)`
+    """
+
+    # Resume after the classes which were already done.
+    classes = state["classes"]
+    chunks = [
+        classes[start:start + chunk_size]
+        for start in six.moves.range(state["done"], len(classes), chunk_size)
+    ]
+    found = state["next"]
+    saved = time.time()
+
+    results = pool.imap(_extend, chunks) if pool is not None else six.moves.map(_extend, chunks)
+
+    for chunk, result in zip(chunks, results):
+        for key, weight in result:
+            found[key] = found.get(key, 0) + weight
+
+        state["done"] += len(chunk)
+
+        if checkpoint is not None and time.time() - saved >= save_every:
+            _save(checkpoint, state)
+            saved = time.time()
+
+    size = len(state["counts"])
+    grown = []
+
+    for key in sorted(found):
+        orbit, remainder = divmod(found[key], size)
+
+        if remainder:
+            raise ArithmeticError("The class sizes of {} cards did not divide evenly.".format(size))
+
+        grown.append([list(_unpack(key)), orbit])
+
+    state["counts"].append(sum(orbit for _, orbit in grown))
+    state["classes"] = grown
+    state["done"] = 0
+    state["next"] = {}
+
+    if checkpoint is not None:
+        _save(checkpoint, state)
+
+
+def _extend(chunk):
+    """
+    Adds every card which doesn't complete a _Set_ to each class in a chunk, and canonicalizes the results.
+
+    `chunk (list)`: Pairs of a canonical Board and the size of its class.
+
+    `return (list)`: Pairs of the key of each larger canonical Board, and the total size of the classes it came from.
+    """
+
+    found = {}
+
+    for board, orbit in chunk:
+        # Every card which would complete a Set with two cards already on the Board.
+        blocked = set(board)
+
+        for i, card in enumerate(board):
+            row = THIRD[card]
+            blocked.update(row[other] for other in board[i + 1:])
+
+        for card in six.moves.range(81):
+            if card not in blocked:
+                key = _pack(canonical_form(board + [card]))
+                found[key] = found.get(key, 0) + orbit
+
+    return list(found.items())
+
+
+def _pack(cards):
+    """
+    Turns a canonical _Board_ into a compact key (a string of card IDs, one character each).
+
+    `cards (integer[])`: The card IDs.
+
+    `return (string)`: The key.
+    """
+
+    return u"".join(six.unichr(48 + card) for card in cards)
+
+
+def _unpack(key):
+    """
+    Turns a key back into a canonical _Board_.
+
+    `key (string)`: The key.
+
+    `return (integer[])`: The card IDs.
+    """
+
+    return [ord(character) - 48 for character in key]
+
+
+def _save(path, state):
+    """
+    Writes the state of the search to a checkpoint file. A new file is written first and then moved into place, so
+    the checkpoint is never left half-written.
+
+    `path (string)`: The checkpoint file.
+
+    `state (dict)`: The state of the search.
+
+    `return (void)`
+    """
+
+    temporary = path + ".tmp"
+
+    with open(temporary, "w") as handle:
+        json.dump(state, handle)
+
+    if os.path.exists(path):
+        os.remove(path)
+
+    os.rename(temporary, path)
+
+
+def _load(path):
+    """
+    Reads the state of the search from a checkpoint file.
+
+    `path (string)`: The checkpoint file.
+
+    `return (dict)`: The state of the search.
+    """
+
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def _binomial(n, k):
+    """
+    Counts the ways to choose `k` things from `n`.
+
+    `n (integer)`: The number of things.
+
+    `k (integer)`: The number to choose.
+
+    `return (integer)`: The number of ways.
+    """
+
+    return math.factorial(n) // (math.factorial(k) * math.factorial(n - k))
+
+
+def main():  # pragma: no cover
+    """
+    This function is run when the module is executed from the command-line.
+    """
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Count the boards of each size with no Set on them.")
+
+    parser.add_argument(
+        "-k", "--max-size",
+        dest="max_size",
+        type=int,
+        default=MAX_CAP,
+        help="The largest board to count. The default value is `{}`.".format(MAX_CAP))
+
+    parser.add_argument(
+        "-w", "--workers",
+        dest="workers",
+        type=int,
+        help="The number of processes to use. The default value is one per CPU.")
+
+    parser.add_argument(
+        "-c", "--checkpoint",
+        dest="checkpoint",
+        help="A JSON file to save progress to, and to resume from if it exists.")
+
+    flags = parser.parse_args()
+
+    def report(size, count):
+        print("{:>4}{:>24}{:>24.12g}".format(size, count, count / _binomial(81, size)))
+        sys.stdout.flush()
+
+    print("{:>4}{:>24}{:>24}".format("k", "boards with no Set", "probability"))
+    count_caps(flags.max_size, workers=flags.workers, checkpoint=flags.checkpoint, progress=report)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,171 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A compact, integer-encoded representation of the 81 _Cards_ in a _Deck_.
+
+Every _Card_ is an integer from `0` to `80`. Read in base 3, its four digits are the indexes of its color, shape,
+shading and number (in that order, most-significant first). This matches the order in which `SetGame` has always
+built its _Deck_, so card `0` is "one red solid diamond" and card `80` is "three purple striped ovals".
+
+Because the encoding is plain arithmetic, attribute extraction works just as well on a NumPy array of card IDs as it
+does on a single `int`.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+COLORS = ("red", "green", "purple")
+SHAPES = ("diamond", "squiggle", "oval")
+SHADINGS = ("solid", "empty", "striped")
+NUMBERS = ("one", "two", "three")
+
+ATTRIBUTES = ("color", "shape", "shading", "number")
+VALUES = {
+    "color": COLORS,
+    "shape": SHAPES,
+    "shading": SHADINGS,
+    "number": NUMBERS,
+}
+PLACES = {
+    "color": 27,
+    "shape": 9,
+    "shading": 3,
+    "number": 1,
+}
+
+# Reverse lookups from a string value to its digit, for converting dict-shaped cards.
+_INDEXES = dict((attribute, dict((value, i) for i, value in enumerate(VALUES[attribute]))) for attribute in ATTRIBUTES)
+
+
+class Card(int):
+    """
+    A single _Card_, stored as its integer ID.
+
+    A `Card` behaves like the dict-shaped cards that `SetGame` has always used (`card["color"]` returns `"red"`),
+    but it is an `int` underneath: it carries no per-instance dictionary, it compares and hashes as its ID, and it
+    can be used directly as an index into lookup tables. There are only 81 of them, shared through `DECK`.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, attribute):
+        return VALUES[attribute][self // PLACES[attribute] % 3]
+
+    def __repr__(self):
+        return "Card({id}: {number} {color} {shading} {shape})".format(
+            id=int(self),
+            number=self["number"],
+            color=self["color"],
+            shading=self["shading"],
+            shape=self["shape"],
+        )
+
+    def get(self, attribute, default=None):
+        """
+        Reads an attribute of this card, like `dict.get()`.
+
+        `attribute (string)`: The name of the attribute (e.g., `color`).
+
+        `default (mixed)`: The value to return if the attribute does not exist. The default value is `None`.
+
+        `return (string)`: The value of the attribute.
+        """
+
+        return self[attribute] if attribute in PLACES else default
+
+    @staticmethod
+    def keys():
+        """
+        Lists the attribute names of a card, like `dict.keys()`.
+
+        `return (string[])`: The attribute names.
+        """
+
+        return list(ATTRIBUTES)
+
+    def as_dict(self):
+        """
+        Expands this card into the dict shape that `SetGame` has always used.
+
+        `return (card)`: A dict with `color`, `shape`, `shading` and `number` keys.
+        """
+
+        return dict((attribute, self[attribute]) for attribute in ATTRIBUTES)
+
+
+DECK = tuple(Card(i) for i in range(81))
+
+
+def digits(cards):
+    """
+    Splits one or more card IDs into their attribute digits.
+
+    Only arithmetic is used, so `cards` may be a single card or a NumPy array of card IDs, in which case each digit
+    is an array of the same shape.
+
+    `cards (integer|ndarray)`: A card ID, or an array of card IDs.
+
+    `return (tuple)`: The color, shape, shading and number digits, each in the range `0`–`2`.
+    """
+
+    return (cards // 27 % 3, cards // 9 % 3, cards // 3 % 3, cards % 3)
+
+
+def encode(color, shape, shading, number):
+    """
+    Builds a card from its attribute digits.
+
+    `color (integer)`: The color digit.
+
+    `shape (integer)`: The shape digit.
+
+    `shading (integer)`: The shading digit.
+
+    `number (integer)`: The number digit.
+
+    `return (Card)`: The matching card.
+    """
+
+    return DECK[color * 27 + shape * 9 + shading * 3 + number]
+
+
+def to_card(card):
+    """
+    Converts a dict-shaped card (or a card ID) into a `Card`.
+
+    `card (card|integer)`: A dict with `color`, `shape`, `shading` and `number` keys, or a card ID.
+
+    `return (Card)`: The matching card.
+    """
+
+    if isinstance(card, int):
+        return DECK[card]
+
+    return DECK[sum(_INDEXES[attribute][card[attribute]] * PLACES[attribute] for attribute in ATTRIBUTES)]
+
+
+def _third_row(card):
+    """
+    Computes the IDs of the cards which complete a _Set_ with one card and each of the 81 others.
+
+    For each attribute, the three digits of a _Set_ add up to a multiple of 3, so the missing digit is
+    `(-a - b) mod 3`. Each digit of the row only depends on one digit of the other card, so the row is built from
+    those (already multiplied by their place), rather than card by card.
+
+    `card (integer)`: The card ID.
+
+    `return (Card[])`: The third card for each other card, in card ID order.
+    """
+
+    color, shape, shading, number = (
+        [(-(card // place % 3) - digit) % 3 * place for digit in range(3)]
+        for place in (27, 9, 3, 1)
+    )
+
+    return tuple([DECK[w + x + y + z] for w in color for x in shape for y in shading for z in number])
+
+
+# THIRD[a][b] is the card which completes a Set with cards `a` and `b`.
+THIRD = tuple(_third_row(card) for card in range(81))
@@ -0,0 +1,210 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+The `set-game-demo` command-line interface.
+
+It lives apart from `set_game_demo`, so that importing the library doesn't load `argparse`, and each sub-command only
+loads the modules it needs.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import argparse
+from set_game_demo import SetGame
+from set_game_demo.finders import DEFAULT_ENGINE, FINDERS
+from set_game_demo.render import DEFAULT_FORMAT, FORMATS
+
+
+def build_parser():
+    """
+    Describes the command-line flags and sub-commands.
+
+    `return (argparse.ArgumentParser)`: The parser.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Play a game of Set.",
+    )
+
+    parser.add_argument(
+        "-q", "--quiet",
+        dest="quiet",
+        action="store_true",
+        help="By default, the game will play in chatty, interactive mode. "
+        "This will enable a quieter, results-only mode.")
+
+    parser.add_argument(
+        "-e", "--engine",
+        dest="engine",
+        choices=sorted(FINDERS),
+        default=DEFAULT_ENGINE,
+        help="The strategy for finding Sets. The default value is `{}`.".format(DEFAULT_ENGINE))
+
+    parser.add_argument(
+        "-f", "--format",
+        dest="format",
+        choices=FORMATS,
+        default=DEFAULT_FORMAT,
+        help="How the Sets are printed in quiet mode: a table per Set, a line of text per Set, tab-separated values "
+        "with a row per card, or a JSON object per Set. The default value is `table`.")
+
+    # Sub-commands. Without one, a single game is played.
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    simulate_parser = commands.add_parser(
+        "simulate",
+        help="Play many quiet games in parallel, and print statistics about them as JSON.")
+
+    simulate_parser.add_argument(
+        "games",
+        type=int,
+        help="The number of games to play.")
+
+    simulate_parser.add_argument(
+        "-w", "--workers",
+        dest="workers",
+        type=int,
+        help="The number of processes to use. The default value is one per CPU.")
+
+    simulate_parser.add_argument(
+        "-s", "--seed",
+        dest="seed",
+        type=int,
+        help="The master seed, for reproducible results.")
+
+    # Kept apart from the top-level `--engine`, which is used when this one is left out.
+    simulate_parser.add_argument(
+        "-e", "--engine",
+        dest="command_engine",
+        choices=sorted(FINDERS),
+        help="The strategy for finding Sets. The default value is the top-level `--engine`, which defaults to "
+        "`{}`.".format(DEFAULT_ENGINE))
+
+    simulate_parser.add_argument(
+        "--stats",
+        dest="stats",
+        action="store_true",
+        help="Also record counters and timers for the hot paths, and include them in the output.")
+
+    analyze_parser = commands.add_parser(
+        "analyze",
+        help="Find the Sets on recorded boards, read from a file or stdin, and print one JSON result per board.")
+
+    analyze_parser.add_argument(
+        "path",
+        nargs="?",
+        default="-",
+        help="The file to read. The default value is `-`, which reads stdin.")
+
+    analyze_parser.add_argument(
+        "-f", "--format",
+        dest="input_format",
+        choices=("jsonl", "binary"),
+        default="jsonl",
+        help="The input format: a JSON array of cards per line, or a length byte followed by card ID bytes per board. "
+        "The default value is `jsonl`.")
+
+    analyze_parser.add_argument(
+        "-m", "--mode",
+        dest="mode",
+        choices=("find", "has"),
+        default="find",
+        help="Whether to find and remove every Set, or only check for one. The default value is `find`.")
+
+    analyze_parser.add_argument(
+        "-w", "--workers",
+        dest="workers",
+        type=int,
+        default=1,
+        help="The number of processes to use. The default value is `1`.")
+
+    analyze_parser.add_argument(
+        "-b", "--batch-size",
+        dest="batch_size",
+        type=int,
+        default=1000,
+        help="The number of boards handed to a process at a time. The default value is `1000`.")
+
+    analyze_parser.add_argument(
+        "-e", "--engine",
+        dest="command_engine",
+        choices=sorted(FINDERS),
+        help="The strategy for finding Sets. The default value is the top-level `--engine`, which defaults to "
+        "`{}`.".format(DEFAULT_ENGINE))
+
+    parser.set_defaults(quiet=False, command=None)
+
+    return parser
+
+
+def command_engine(flags):
+    """
+    Picks the engine for a sub-command: its own `--engine`, or else the top-level one.
+
+    `flags (argparse.Namespace)`: The parsed flags.
+
+    `return (string)`: The name of the engine.
+    """
+
+    return flags.command_engine or flags.engine
+
+
+def main():  # pragma: no cover
+    """
+    This function is run when the script is executed from the command-line.
+    """
+
+    flags = build_parser().parse_args()
+
+    if flags.command == "simulate":
+        # Only load the process pool when it is needed.
+        import json
+        from set_game_demo.simulate import simulate
+
+        summary = simulate(flags.games, workers=flags.workers, seed=flags.seed, engine=command_engine(flags),
+                           stats=flags.stats)
+        print(json.dumps(summary.as_dict(), indent=2, sort_keys=True))
+        return
+
+    if flags.command == "analyze":
+        import sys
+        from set_game_demo.analyze import analyze
+
+        mode = "rb" if flags.input_format == "binary" else "r"
+        options = (flags.input_format, flags.mode, command_engine(flags), flags.workers, flags.batch_size)
+
+        if flags.path == "-":
+            source = sys.stdin if mode == "r" else getattr(sys.stdin, "buffer", sys.stdin)
+            analyze(source, sys.stdout, *options)
+        else:
+            with open(flags.path, mode) as source:
+                analyze(source, sys.stdout, *options)
+
+        return
+
+    game = SetGame(engine=flags.engine)
+
+    if flags.quiet:
+        import sys
+        from set_game_demo.render import write_sets
+
+        discovered, sets = game.play_quiet()
+
+        # Only people read the count; the other formats are for programs.
+        if flags.format in ("table", "text"):
+            print("You discovered {quantity}.".format(
+                quantity=SetGame.plural(discovered, "set", "sets")
+            ))
+
+        write_sets(sets, sys.stdout, flags.format)
+
+    else:
+        game.play()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
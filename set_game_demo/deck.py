@@ -0,0 +1,161 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A _Deck_ stored as a shuffled array of card indexes, which deals views instead of copies.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from set_game_demo import _compat
+
+
+class Deck(object):
+    """
+    A shuffled _Deck_ of cards.
+
+    The order of the _Deck_ is one compact array of indexes into `cards`. Dealing only moves a cursor forward, and
+    hands back a `DeckSlice` over that array, so nothing is copied or allocated per card. Cards are looked up from
+    `cards` as they are read.
+    """
+
+    def __init__(self, cards, rng):
+        """
+        Constructs a new instance of this class.
+
+        `cards (sequence)`: Every card in the deck, in a fixed order (e.g., `set_game_demo.cards.DECK`).
+
+        `rng (random.Random)`: The random number generator to shuffle with.
+        """
+
+        # `array` imports `collections`, which is slow to import; put it off until a deck is needed.
+        import array
+
+        order = list(_compat.range(len(cards)))
+        rng.shuffle(order)
+
+        self.cards = cards
+        self.order = array.array(_typecode(len(cards)), order)
+        self.cursor = 0
+
+    def __len__(self):
+        return len(self.order) - self.cursor
+
+    def __iter__(self):
+        return iter(DeckSlice(self, self.cursor, len(self.order)))
+
+    def deal(self, count):
+        """
+        Deals cards from the top (front) of the deck.
+
+        `count (integer)`: The number of cards to deal.
+
+        `return (DeckSlice)`: A read-only view of the cards that were dealt.
+        """
+
+        if count < 0:
+            raise ValueError("Cannot deal {} cards.".format(count))
+
+        start = self.cursor
+        stop = start + count
+
+        if stop > len(self.order):
+            raise IndexError("Cannot deal {} cards; only {} are left.".format(count, len(self)))
+
+        self.cursor = stop
+
+        return DeckSlice(self, start, stop)
+
+    def popleft(self):
+        """
+        Deals a single card from the top (front) of the deck.
+
+        `return (card)`: The card.
+        """
+
+        return self.deal(1)[0]
+
+
+class DeckSlice(object):
+    """
+    A read-only view of a run of cards in a `Deck`. Use `list()` on it to get a board that can be changed.
+    """
+
+    __slots__ = ("deck", "start", "stop")
+
+    def __init__(self, deck, start, stop):
+        """
+        Constructs a new instance of this class.
+
+        `deck (Deck)`: The deck to view.
+
+        `start (integer)`: The position of the first card in the view.
+
+        `stop (integer)`: The position after the last card in the view.
+        """
+
+        self.deck = deck
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __iter__(self):
+        return _compat.map(self.deck.cards.__getitem__, self.deck.order[self.start:self.stop])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in _compat.range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("Index {} is out of range.".format(index))
+
+        return self.deck.cards[self.deck.order[self.start + index]]
+
+    def __eq__(self, other):
+        if isinstance(other, (DeckSlice, list, tuple)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "DeckSlice({!r})".format(list(self))
+
+    @property
+    def indexes(self):
+        """
+        `return (memoryview)`: The indexes of these cards into the deck's `cards`, without copying them.
+        """
+
+        return memoryview(self.deck.order)[self.start:self.stop]
+
+
+def _typecode(size):
+    """
+    Picks the smallest array type that can index a deck.
+
+    `size (integer)`: The number of cards in the deck.
+
+    `return (string)`: An `array` type code.
+    """
+
+    import array
+
+    for typecode in ("B", "H", "I", "L"):
+        if size <= 1 << (8 * array.array(typecode).itemsize):
+            return typecode
+
+    return "Q"  # pragma: no cover
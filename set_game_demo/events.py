@@ -0,0 +1,53 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+The events produced by `SetGame.play_iter()`.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+# Cards were dealt onto the board.
+DEAL = "deal"
+
+# A Set was found and removed from the board.
+SET_FOUND = "set_found"
+
+# No Set could be found, so more cards were dealt onto the board.
+NO_SET_EXTRA_DEAL = "no_set_extra_deal"
+
+# The deck is empty and no Sets are left. The event's cards are the ones left on the board.
+GAME_OVER = "game_over"
+
+
+class Event(object):
+    """
+    Something that happened during a _Game_.
+    """
+
+    __slots__ = ("kind", "cards")
+
+    def __init__(self, kind, cards):
+        """
+        Constructs a new instance of this class.
+
+        `kind (string)`: One of `DEAL`, `SET_FOUND`, `NO_SET_EXTRA_DEAL` or `GAME_OVER`.
+
+        `cards (cards[])`: The cards involved. Dealt cards, the 3 cards of a Set, or the cards left over.
+        """
+
+        self.kind = kind
+        self.cards = cards
+
+    def __repr__(self):
+        return "Event({!r}, {!r})".format(self.kind, self.cards)
+
+    def __eq__(self, other):
+        return isinstance(other, Event) and (self.kind, self.cards) == (other.kind, other.cards)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
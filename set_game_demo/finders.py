@@ -0,0 +1,509 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Strategies for finding _Sets_ on a _Board_.
+
+Every finder accepts a _Board_ (a list of cards), removes the _Sets_ it finds from that list, and returns them as a
+list of 3-card lists. They all make the same greedy choice: the first _Set_ in lexicographic order of board
+positions is taken, and the search continues over the cards that remain. Given the same _Board_, every finder
+therefore returns the same _Sets_ in the same order.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+import itertools
+import operator
+from set_game_demo import _compat
+from set_game_demo.board import BoardIndex
+from set_game_demo.cache import get_cache
+from set_game_demo.cards import THIRD, to_card
+from set_game_demo.stats import active_stats
+from set_game_demo.table import get_table
+
+DEFAULT_ENGINE = "pairs"
+
+
+def find_sets_combinations(board):
+    """
+    Finds _Sets_ by checking every combination of 3 cards, starting over after each removal.
+
+    This is the original brute-force finder. It accepts any dict-shaped cards, but runs in `O(n³)` per removal.
+
+    `board (cards[])`: A list (i.e., array) of Cards that are on the Board.
+
+    `return (sets[])`: A list (i.e., array) of Sets. Each Set contains 3 Cards.
+    """
+
+    # Avoid a circular import; `SetGame` owns `is_a_set`.
+    from set_game_demo import SetGame
+
+    stats = active_stats()
+    is_a_set = SetGame.is_a_set if stats is None else stats.is_a_set()
+    sets = []
+
+    # Calculate the initial set of combinations.
+    combinations = itertools.combinations(_compat.range(len(board)), 3)
+
+    # Run until we explicitly break.
+    while True:
+
+        # Grab the combination.
+        combination = next(combinations, None)
+
+        # As long as we didn't get a `None` back...
+        while combination is not None:
+
+            # Check to see if the three cards we got back for this combination are a Set.
+            if is_a_set(board[combination[0]], board[combination[1]], board[combination[2]]) is True:
+
+                # If so, save them.
+                sets.append([board[combination[0]], board[combination[1]], board[combination[2]]])
+
+                # After we save the Set, remove the cards from the Board.
+                # Python list indexes collapse automatically, so remove from the end first.
+                del board[combination[2]]
+                del board[combination[1]]
+                del board[combination[0]]
+
+                # This means that we now need to recalculate the Board, and start our loop over again.
+                combinations = itertools.combinations(_compat.range(len(board)), 3)
+
+                if stats is not None:
+                    stats.count("combinations.restarts")
+
+                break
+
+            else:
+                # Move on to the next combination in the list.
+                combination = next(combinations, None)
+                continue
+
+        # If we have reached the end of the list of combinations, quit.
+        if combination is None:
+            break
+
+    # Return all matching sets.
+    return sets
+
+
+def find_sets_pairs(board):
+    """
+    Finds _Sets_ by looking up the third card for every pair of cards.
+
+    Any two cards complete exactly one _Set_, so each pair costs a single table lookup and the search is `O(n²)`.
+    Removed cards are only marked as dead, so the search resumes where it left off instead of starting over.
+
+    `board (cards[])`: A list (i.e., array) of Cards that are on the Board.
+
+    `return (sets[])`: A list (i.e., array) of Sets. Each Set contains 3 Cards.
+    """
+
+    try:
+        cards = [to_card(card) for card in board]
+    except KeyError:
+        # Not a card from the standard deck.
+        return find_sets_combinations(board)
+
+    length = len(cards)
+
+    # The position of each card on the board, indexed by card ID.
+    where = [-1] * 81
+
+    for index, card in enumerate(cards):
+        if where[card] != -1:
+            # Duplicate cards only come from hand-built boards; let the brute-force finder sort them out.
+            return find_sets_combinations(board)
+
+        where[card] = index
+
+    alive = [True] * length
+    sets = []
+
+    for i in _compat.range(length - 2):
+        if not alive[i]:
+            continue
+
+        completes = THIRD[cards[i]]
+
+        for j in _compat.range(i + 1, length - 1):
+            if alive[j]:
+                k = where[completes[cards[j]]]
+
+                # Only look forward, so that each Set is found from its first two cards.
+                if k > j and alive[k]:
+                    sets.append([board[i], board[j], board[k]])
+                    alive[i] = alive[j] = alive[k] = False
+                    break
+
+        # Card `i` was either used, or it is in no Set with the cards which remain.
+
+    board[:] = [card for card, keep in zip(board, alive) if keep]
+
+    return sets
+
+
+# PARTNERS[a][b] is a mask with only the bit for the card which completes a Set with `a` and `b`.
+PARTNERS = tuple(tuple(1 << third for third in row) for row in THIRD)
+
+
+def find_sets_bitboard(board):
+    """
+    Finds _Sets_ by testing the third card of every pair against 81-bit masks.
+
+    The cards still on the _Board_ are the set bits of one integer, and so are the cards after each position. For any
+    pair, one AND of those two masks with the pair's precomputed partner mask says whether the _Set_ can be completed
+    from later on the _Board_.
+
+    `board (cards[])`: A list (i.e., array) of Cards that are on the Board.
+
+    `return (sets[])`: A list (i.e., array) of Sets. Each Set contains 3 Cards.
+    """
+
+    try:
+        cards = [to_card(card) for card in board]
+    except KeyError:
+        # Not a card from the standard deck.
+        return find_sets_combinations(board)
+
+    length = len(cards)
+
+    # later[i] holds the cards at positions after `i`.
+    later = [0] * length
+    live = 0
+
+    for index in _compat.range(length - 1, -1, -1):
+        later[index] = live
+        live |= 1 << cards[index]
+
+    if bin(live).count("1") != length:
+        # Duplicate cards only come from hand-built boards; let the brute-force finder sort them out.
+        return find_sets_combinations(board)
+
+    where = dict((card, index) for index, card in enumerate(cards))
+    sets = []
+
+    for i in _compat.range(length - 2):
+        card = cards[i]
+
+        if not live >> card & 1:
+            continue
+
+        partners = PARTNERS[card]
+
+        for j in _compat.range(i + 1, length - 1):
+            found = live & later[j] & partners[cards[j]]
+
+            if found and live >> cards[j] & 1:
+                k = where[THIRD[card][cards[j]]]
+                sets.append([board[i], board[j], board[k]])
+                live &= ~(1 << card | 1 << cards[j] | found)
+                break
+
+    board[:] = [board[index] for index in _compat.range(length) if live >> cards[index] & 1]
+
+    return sets
+
+
+def find_sets_table(board):
+    """
+    Finds _Sets_ by checking each card's 40 _Sets_ from the precomputed table against the _Board_.
+
+    `board (cards[])`: A list (i.e., array) of Cards that are on the Board.
+
+    `return (sets[])`: A list (i.e., array) of Sets. Each Set contains 3 Cards.
+    """
+
+    try:
+        cards = [to_card(card) for card in board]
+    except KeyError:
+        # Not a card from the standard deck.
+        return find_sets_combinations(board)
+
+    # The position of each live card on the board, indexed by card ID.
+    where = [-1] * 81
+
+    for index, card in enumerate(cards):
+        if where[card] != -1:
+            # Duplicate cards only come from hand-built boards; let the brute-force finder sort them out.
+            return find_sets_combinations(board)
+
+        where[card] = index
+
+    partners = get_table().partners
+    sets = []
+
+    for i, card in enumerate(cards):
+        if where[card] != i:
+            continue
+
+        # The earliest Set which starts with this card, as the positions of its other two cards.
+        best = None
+
+        for card2, card3 in partners[card]:
+            j = where[card2]
+            k = where[card3]
+
+            if j > i and k > i:
+                pair = (j, k) if j < k else (k, j)
+
+                if best is None or pair < best:
+                    best = pair
+
+        if best is not None:
+            j, k = best
+            sets.append([board[i], board[j], board[k]])
+            where[card] = where[cards[j]] = where[cards[k]] = -1
+
+    board[:] = [board[index] for index, card in enumerate(cards) if where[card] != -1]
+
+    return sets
+
+
+def find_sets_incremental(board):
+    """
+    Finds _Sets_ by building a `BoardIndex` over the _Board_.
+
+    `board (cards[])`: A list (i.e., array) of Cards that are on the Board.
+
+    `return (sets[])`: A list (i.e., array) of Sets. Each Set contains 3 Cards.
+    """
+
+    index = BoardIndex(board)
+    sets = index.take_sets()
+    board[:] = index.cards
+
+    return sets
+
+
+def find_sets_cached(board):
+    """
+    Finds _Sets_ through the shared `SetCache`, which remembers the _Sets_ on every _Board_ it has seen recently.
+
+    `board (cards[])`: A list (i.e., array) of Cards that are on the Board.
+
+    `return (sets[])`: A list (i.e., array) of Sets. Each Set contains 3 Cards.
+    """
+
+    return get_cache().find_sets(board)
+
+
+def first_set(board):
+    """
+    Finds the first _Set_ on a _Board_, and stops there.
+
+    This is the _Set_ every finder would take first. The _Board_ is left untouched.
+
+    `board (cards[])`: A list (i.e., array) of Cards that are on the Board.
+
+    `return (cards[]|None)`: A Set of 3 Cards, or `None` if there are no Sets on the Board.
+    """
+
+    cards = _card_ids(board)
+
+    if cards is None:
+        return _first_set_combinations(board)
+
+    length = len(cards)
+
+    # The position of each card on the board, indexed by card ID.
+    where = [-1] * 81
+
+    for index, card in enumerate(cards):
+        if where[card] != -1:
+            # Duplicate cards only come from hand-built boards; let the brute-force search sort them out.
+            return _first_set_combinations(board)
+
+        where[card] = index
+
+    for i in _compat.range(length - 2):
+        completes = THIRD[cards[i]]
+
+        for j in _compat.range(i + 1, length - 1):
+            k = where[completes[cards[j]]]
+
+            if k > j:
+                return [board[i], board[j], board[k]]
+
+    return None
+
+
+def has_set(board):
+    """
+    Determines whether a _Board_ contains at least one _Set_, without working out which one.
+
+    Each card looks up the third card for every card on the _Board_ at once (a single `itemgetter` call over its row of
+    `THIRD`), and tests them all against the cards after it with one set operation. A _Board_ with no _Sets_ has to
+    check every pair, so the whole search stays in C apart from one step per card.
+
+    `board (cards[])`: A list (i.e., array) of Cards that are on the Board.
+
+    `return (boolean)`: Whether or not the board contains a Set.
+    """
+
+    cards = _card_ids(board)
+
+    if cards is None:
+        return _first_set_combinations(board) is not None
+
+    if len(cards) < 3:
+        return False
+
+    later = set(cards)
+
+    if len(later) != len(cards):
+        # Duplicate cards only come from hand-built boards; let the brute-force search sort them out.
+        return _first_set_combinations(board) is not None
+
+    thirds = operator.itemgetter(*cards)
+
+    # A Set is found from its first card, while the other two are still in `later`. A card completes a Set with
+    # itself, so it leaves `later` before its own row is checked.
+    for card in cards[:-2]:
+        later.discard(card)
+
+        if not later.isdisjoint(thirds(THIRD[card])):
+            return True
+
+    return False
+
+
+def _card_ids(board):
+    """
+    Reads the card IDs of a _Board_ for the fast searches.
+
+    `board (cards[])`: A list (i.e., array) of Cards that are on the Board.
+
+    `return (Card[]|None)`: The cards, or `None` if the Board holds a card from outside the standard deck.
+    """
+
+    try:
+        return [to_card(card) for card in board]
+    except KeyError:
+        return None
+
+
+def _first_set_combinations(board):
+    """
+    Finds the first _Set_ on a _Board_ by checking every combination of 3 cards in order.
+
+    `board (cards[])`: A list (i.e., array) of Cards that are on the Board.
+
+    `return (cards[]|None)`: A Set of 3 Cards, or `None` if there are no Sets on the Board.
+    """
+
+    # Avoid a circular import; `SetGame` owns `is_a_set`.
+    from set_game_demo import SetGame
+
+    stats = active_stats()
+    is_a_set = SetGame.is_a_set if stats is None else stats.is_a_set()
+
+    for card1, card2, card3 in itertools.combinations(board, 3):
+        if is_a_set(card1, card2, card3):
+            return [card1, card2, card3]
+
+    return None
+
+
+FINDERS = {
+    "bitboard": find_sets_bitboard,
+    "cached": find_sets_cached,
+    "combinations": find_sets_combinations,
+    "incremental": find_sets_incremental,
+    "pairs": find_sets_pairs,
+    "table": find_sets_table,
+}
+
+
+def get_finder(engine=DEFAULT_ENGINE):
+    """
+    Looks up a finder by its engine name.
+
+    `engine (string)`: One of `bitboard`, `cached`, `combinations`, `incremental`, `pairs` or `table`. The default
+        value is `pairs`.
+
+    `return (callable)`: The finder.
+    """
+
+    try:
+        return FINDERS[engine]
+    except KeyError:
+        raise ValueError("Unknown engine {!r}. Choose one of: {}.".format(engine, ", ".join(sorted(FINDERS))))
+
+
+def new_board(engine=DEFAULT_ENGINE, cards=()):
+    """
+    Creates a _Board_ which finds its _Sets_ with the given engine.
+
+    The `incremental` engine keeps a `BoardIndex` for the whole game. Every other engine searches a plain list from
+    scratch each time.
+
+    `engine (string)`: The name of the engine. The default value is `pairs`.
+
+    `cards (cards[])`: The cards to start with. The default value is an empty _Board_.
+
+    `return (BoardIndex|ListBoard)`: An object with `add(cards)`, `take_sets()`, `take_set()` and `cards`.
+    """
+
+    if engine == "incremental":
+        return BoardIndex(cards)
+
+    return ListBoard(get_finder(engine), cards)
+
+
+class ListBoard(object):
+    """
+    A _Board_ kept as a plain list, which is searched from scratch by a finder each time _Sets_ are taken.
+    """
+
+    def __init__(self, finder, cards=()):
+        """
+        Constructs a new instance of this class.
+
+        `finder (callable)`: A finder from this module.
+
+        `cards (cards[])`: The cards to start with. The default value is an empty _Board_.
+        """
+
+        self.finder = finder
+        self.cards = list(cards)
+
+    def __len__(self):
+        return len(self.cards)
+
+    def add(self, cards):
+        """
+        Adds cards to the end of the board.
+
+        `cards (cards[])`: A list (i.e., array) of cards to add.
+
+        `return (void)`
+        """
+
+        self.cards += cards
+
+    def take_sets(self):
+        """
+        Removes _Sets_ from the board until none are left.
+
+        `return (sets[])`: A list (i.e., array) of the Sets that were removed. Each Set contains 3 Cards.
+        """
+
+        return self.finder(self.cards)
+
+    def take_set(self):
+        """
+        Removes the earliest _Set_ (in board order) from the board, with `first_set()`.
+
+        `return (cards[]|None)`: The Set that was removed, or `None` if there are no Sets on the board.
+        """
+
+        sset = first_set(self.cards)
+
+        if sset is not None:
+            for card in sset:
+                self.cards.remove(card)
+
+        return sset
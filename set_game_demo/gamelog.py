@@ -0,0 +1,430 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A compact, columnar file format for the results of many quiet _Games_, which can be read without loading it into
+memory.
+
+    with GameLogWriter("games.setlog") as log:
+        for seed in range(1000000):
+            log.record(SetGame(seed=seed).play_iter())
+
+    with GameLog("games.setlog") as log:
+        for game in log:
+            print(game.set_count, list(game.leftover))
+
+Every card is stored as a single byte holding its card ID. The file holds:
+
+* A header: a magic string, the format version, the number of _Games_, _Sets_ and leftover cards, and where each of
+  the columns below starts.
+* The _Sets_ of every _Game_, one after the other, 3 bytes per _Set_.
+* The cards left over at the end of every _Game_, one after the other.
+* Two offset indexes of little-endian 64-bit integers, with one more entry than there are _Games_: the number of
+  _Sets_, and of leftover cards, written before each _Game_ (so _Game_ `i` owns the entries from `index[i]` up to
+  `index[i + 1]`).
+
+A writer streams _Games_ to the file as they are played. The leftover cards and the indexes are held in temporary
+files until `close()`, which copies them after the _Sets_ and fills in the header, so memory use does not grow with
+the number of _Games_.
+
+A reader maps the file into memory. `GameLog.set_cards()`, and the `sets` and `leftover` of each `LoggedGame`, are
+views of the mapped file rather than copies, so only the pages which are used are ever read. The views are flat runs of
+card IDs (3 per _Set_), which NumPy can wrap without copying too:
+
+    sets = numpy.frombuffer(log.set_cards(), dtype=numpy.uint8).reshape(-1, 3)
+
+Views can still be read after the log is closed: the file stays mapped until the last of them is released. Python 2
+can't make views of a mapped file, so it gets copies instead.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+import six
+from set_game_demo.cards import to_card
+from set_game_demo.events import GAME_OVER, SET_FOUND
+
+# File header: a magic string, the version, the number of bytes per card, the number of Games, Sets and leftover cards,
+# and the offsets of the Set, leftover, Set index and leftover index columns.
+_MAGIC = b"SETLOG1\n"
+_VERSION = 1
+_HEADER = struct.Struct("<8sHHI3Q4Q")
+
+# One entry of an offset index.
+_INDEX = struct.Struct("<Q")
+
+
+class GameLogWriter(object):
+    """
+    Appends _Games_ to a new game log.
+    """
+
+    def __init__(self, path):
+        """
+        Constructs a new instance of this class, and creates the file (replacing any file which is already there).
+
+        `path (string)`: The file to write.
+        """
+
+        self.path = path
+        self.games = 0
+        self.sets = 0
+        self.leftover = 0
+
+        self.__handle = open(path, "wb")
+        self.__handle.write(b"\0" * _HEADER.size)
+
+        # The columns which follow the Sets are kept aside until the end.
+        scratch = os.path.dirname(os.path.abspath(path))
+        self.__leftover = tempfile.TemporaryFile(dir=scratch)
+        self.__set_index = tempfile.TemporaryFile(dir=scratch)
+        self.__leftover_index = tempfile.TemporaryFile(dir=scratch)
+
+        self.__set_index.write(_INDEX.pack(0))
+        self.__leftover_index.write(_INDEX.pack(0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+        return False
+
+    def append(self, sets, leftover):
+        """
+        Adds one _Game_ to the log.
+
+        `sets (sets[])`: The Sets found in the game, in order (e.g., the second item returned by
+            `SetGame.play_quiet()`). Each card is a card ID, or a dict-shaped card.
+
+        `leftover (cards[])`: The cards left on the board at the end of the game (e.g., `SetGame.board`).
+
+        `return (integer)`: The index of the game in the log.
+        """
+
+        cards = _pack([card for sset in sets for card in sset])
+
+        if len(cards) != 3 * len(sets):
+            raise ValueError("Every Set must have exactly 3 cards.")
+
+        remaining = _pack(leftover)
+
+        self.__handle.write(cards)
+        self.__leftover.write(remaining)
+
+        self.sets += len(sets)
+        self.leftover += len(remaining)
+        self.__set_index.write(_INDEX.pack(self.sets))
+        self.__leftover_index.write(_INDEX.pack(self.leftover))
+        self.games += 1
+
+        return self.games - 1
+
+    def record(self, events):
+        """
+        Adds one _Game_ to the log from its stream of events.
+
+        `events (Event[])`: The events of one game, as produced by `SetGame.play_iter()`.
+
+        `return (integer)`: The index of the game in the log.
+        """
+
+        # The game is only written once it is over, so that a game which fails part of the way through leaves
+        # nothing behind.
+        cards = bytearray()
+        leftover = b""
+
+        for event in events:
+            if event.kind == SET_FOUND:
+                cards += _pack(event.cards)
+            elif event.kind == GAME_OVER:
+                leftover = _pack(event.cards)
+
+        self.__handle.write(cards)
+        self.__leftover.write(leftover)
+
+        self.sets += len(cards) // 3
+        self.leftover += len(leftover)
+        self.__set_index.write(_INDEX.pack(self.sets))
+        self.__leftover_index.write(_INDEX.pack(self.leftover))
+        self.games += 1
+
+        return self.games - 1
+
+    def close(self):
+        """
+        Finishes the file: copies the leftover cards and the indexes after the _Sets_, and writes the header. Nothing
+        can be added afterwards.
+
+        `return (void)`
+        """
+
+        handle = self.__handle
+
+        if handle.closed:
+            return
+
+        try:
+            offsets = [_HEADER.size]
+
+            for column in (self.__leftover, self.__set_index, self.__leftover_index):
+                position = handle.tell()
+
+                # Keep the indexes aligned, so that they can be viewed as arrays of integers.
+                if column is not self.__leftover:
+                    handle.write(b"\0" * (-position % _INDEX.size))
+                    position = handle.tell()
+
+                offsets.append(position)
+                column.seek(0)
+                shutil.copyfileobj(column, handle)
+
+            handle.seek(0)
+            handle.write(_HEADER.pack(_MAGIC, _VERSION, 1, 0, self.games, self.sets, self.leftover, *offsets))
+        finally:
+            handle.close()
+
+            for column in (self.__leftover, self.__set_index, self.__leftover_index):
+                column.close()
+
+
+class LoggedGame(object):
+    """
+    One _Game_ read from a game log.
+    """
+
+    __slots__ = ("index", "sets", "leftover")
+
+    def __init__(self, index, sets, leftover):
+        """
+        Constructs a new instance of this class.
+
+        `index (integer)`: The index of the game in the log.
+
+        `sets (memoryview)`: The card IDs of the Sets found, in order, 3 per Set.
+
+        `leftover (memoryview)`: The card IDs left on the board at the end of the game.
+        """
+
+        self.index = index
+        self.sets = sets
+        self.leftover = leftover
+
+    @property
+    def set_count(self):
+        """
+        The number of _Sets_ found in this _Game_.
+        """
+
+        return len(self.sets) // 3
+
+    def iter_sets(self):
+        """
+        Walks through the _Sets_ found in this _Game_.
+
+        `return (generator)`: Yields each Set as a tuple of 3 card IDs.
+        """
+
+        return _triples(self.sets)
+
+
+class GameLog(object):
+    """
+    A game log, mapped into memory for reading.
+    """
+
+    def __init__(self, path):
+        """
+        Constructs a new instance of this class, and maps the file.
+
+        `path (string)`: A file written by `GameLogWriter`.
+        """
+
+        self.path = path
+
+        with open(path, "rb") as handle:
+            header = handle.read(_HEADER.size)
+
+            if len(header) < _HEADER.size or header[:len(_MAGIC)] != _MAGIC:
+                raise ValueError("{} is not a game log.".format(path))
+
+            fields = _HEADER.unpack(header)
+
+            if fields[1] != _VERSION or fields[2] != 1:
+                raise ValueError("{} is a game log of an unsupported version ({}).".format(path, fields[1]))
+
+            self.games, self.sets, self.leftover = fields[4:7]
+            sets_at, leftover_at, set_index_at, leftover_index_at = fields[7:]
+
+            if os.fstat(handle.fileno()).st_size < leftover_index_at + (self.games + 1) * _INDEX.size:
+                raise ValueError("{} is truncated.".format(path))
+
+            self.__map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.__whole = _whole_view(self.__map)
+        self.__sets_at = sets_at
+        self.__leftover_at = leftover_at
+        self.__set_index_at = set_index_at
+        self.__leftover_index_at = leftover_index_at
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+        return False
+
+    def __len__(self):
+        return self.games
+
+    def __getitem__(self, index):
+        """
+        Reads one _Game_.
+
+        `index (integer)`: The index of the game. Negative indexes count from the end.
+
+        `return (LoggedGame)`: The game.
+        """
+
+        if index < 0:
+            index += self.games
+
+        if not 0 <= index < self.games:
+            raise IndexError("game log index out of range")
+
+        if self.__map is None:
+            raise ValueError("The game log is closed.")
+
+        first_set, last_set = struct.unpack_from("<2Q", self.__map, self.__set_index_at + index * _INDEX.size)
+        first_card, last_card = struct.unpack_from("<2Q", self.__map, self.__leftover_index_at + index * _INDEX.size)
+
+        return LoggedGame(
+            index,
+            self.__bytes(self.__sets_at + 3 * first_set, self.__sets_at + 3 * last_set),
+            self.__bytes(self.__leftover_at + first_card, self.__leftover_at + last_card),
+        )
+
+    def __iter__(self):
+        for index in six.moves.range(self.games):
+            yield self[index]
+
+    def set_cards(self):
+        """
+        Views the _Sets_ of every _Game_ at once, for analysis across the whole log.
+
+        `return (memoryview)`: The card IDs of every Set in the log, in order, 3 per Set.
+        """
+
+        return self.__bytes(self.__sets_at, self.__sets_at + 3 * self.sets)
+
+    def leftover_cards(self):
+        """
+        Views the leftover cards of every _Game_ at once.
+
+        `return (memoryview)`: The card IDs left over at the end of every game, in order.
+        """
+
+        return self.__bytes(self.__leftover_at, self.__leftover_at + self.leftover)
+
+    def iter_sets(self):
+        """
+        Walks through the _Sets_ of every _Game_, in order.
+
+        `return (generator)`: Yields each Set as a tuple of 3 card IDs.
+        """
+
+        return _triples(self.set_cards())
+
+    def close(self):
+        """
+        Unmaps the file, or, if views of it are still in use, lets it be unmapped once the last of them is released.
+        Nothing more can be read from the log itself afterwards.
+
+        `return (void)`
+        """
+
+        if self.__map is None:
+            return
+
+        if self.__whole is not None:
+            self.__whole.release()
+            self.__whole = None
+
+        try:
+            self.__map.close()
+        except BufferError:
+            # The views which are still in use keep the mapping alive, until they are released too.
+            pass
+
+        self.__map = None
+
+    def __bytes(self, start, end):
+        """
+        Reads a range of bytes from the file: as a view, or (on Python 2) as a copy.
+
+        `start (integer)`: The offset of the first byte.
+
+        `end (integer)`: The offset after the last byte.
+
+        `return (memoryview|bytearray)`: The bytes, as integers.
+        """
+
+        if self.__whole is not None:
+            return self.__whole[start:end]
+
+        if self.__map is None:
+            raise ValueError("The game log is closed.")
+
+        return bytearray(self.__map[start:end])
+
+
+def _pack(cards):
+    """
+    Converts cards into bytes of card IDs.
+
+    `cards (cards[])`: Card IDs, or dict-shaped cards.
+
+    `return (bytearray)`: One byte per card.
+    """
+
+    packed = bytearray(card if isinstance(card, int) else to_card(card) for card in cards)
+
+    if packed and max(packed) > 80:
+        raise ValueError("Card IDs go from 0 to 80, not {}.".format(max(packed)))
+
+    return packed
+
+
+def _triples(cards):
+    """
+    Splits a flat run of card IDs into _Sets_.
+
+    `cards (memoryview)`: The card IDs, 3 per Set.
+
+    `return (iterator)`: Yields each Set as a tuple of 3 card IDs.
+    """
+
+    return six.moves.zip(cards[0::3], cards[1::3], cards[2::3])
+
+
+def _whole_view(mapped):
+    """
+    Views the whole of a mapped file.
+
+    `mapped (mmap)`: The mapped file.
+
+    `return (memoryview|None)`: The view, or `None` on Python 2, which can't view a mapped file.
+    """
+
+    try:
+        return memoryview(mapped)
+    except TypeError:  # pragma: no cover
+        return None
@@ -0,0 +1,272 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+"Set" with any number of attributes.
+
+The standard _Deck_ has 4 attributes with 3 values each (`3⁴ = 81` cards). A `SetSpace` works the same way for any
+dimension `d`, with `3ᵈ` cards: 243 for `d = 5`, 729 for `d = 6`, 2187 for `d = 7`, and so on.
+
+Cards are packed integers. Attribute `i` of a card is stored in bit `i` (set when the value is `1`) and bit `d + i`
+(set when the value is `2`), so the card which completes a _Set_ with two others is worked out for every attribute at
+once with a handful of bitwise operations, whatever the dimension.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+import random
+import six
+from set_game_demo.deck import Deck
+
+
+class SetSpace(object):
+    """
+    The cards, and the rules for _Sets_, of a _Deck_ with `dimension` attributes of 3 values each.
+    """
+
+    def __init__(self, dimension=4):
+        """
+        Constructs a new instance of this class.
+
+        `dimension (integer)`: The number of attributes on each card. The default value is `4`.
+        """
+
+        if dimension < 1:
+            raise ValueError("A deck needs at least 1 attribute, not {}.".format(dimension))
+
+        self.dimension = dimension
+        self.size = 3 ** dimension
+        self.__mask = (1 << dimension) - 1
+
+    def encode(self, digits):
+        """
+        Packs a card from its attribute values.
+
+        `digits (integer[])`: One value (`0`–`2`) per attribute.
+
+        `return (integer)`: The packed card.
+        """
+
+        if len(digits) != self.dimension:
+            raise ValueError("Expected {} attribute values, not {}.".format(self.dimension, len(digits)))
+
+        low = high = 0
+
+        for i, digit in enumerate(digits):
+            if digit == 1:
+                low |= 1 << i
+            elif digit == 2:
+                high |= 1 << i
+            elif digit != 0:
+                raise ValueError("Attribute values must be 0, 1 or 2, not {}.".format(digit))
+
+        return high << self.dimension | low
+
+    def decode(self, card):
+        """
+        Unpacks the attribute values of a card.
+
+        `card (integer)`: A packed card.
+
+        `return (tuple)`: One value (`0`–`2`) per attribute.
+        """
+
+        low = card & self.__mask
+        high = card >> self.dimension
+
+        return tuple((low >> i & 1) + 2 * (high >> i & 1) for i in six.moves.range(self.dimension))
+
+    def cards(self):
+        """
+        Lists every card in the _Deck_, in order.
+
+        `return (integer[])`: The packed cards.
+        """
+
+        out = []
+
+        for index in six.moves.range(self.size):
+            digits = []
+
+            for _ in six.moves.range(self.dimension):
+                index, digit = divmod(index, 3)
+                digits.append(digit)
+
+            out.append(self.encode(digits))
+
+        return out
+
+    def third(self, card1, card2):
+        """
+        Works out the only card which completes a _Set_ with two others.
+
+        For each attribute, the missing value is `(-a - b) mod 3`.
+
+        `card1 (integer)`: A packed card.
+
+        `card2 (integer)`: A packed card.
+
+        `return (integer)`: The packed card which completes the Set.
+        """
+
+        dimension = self.dimension
+        mask = self.__mask
+
+        low1 = card1 & mask
+        high1 = card1 >> dimension
+        zero1 = ~(low1 | high1) & mask
+        low2 = card2 & mask
+        high2 = card2 >> dimension
+        zero2 = ~(low2 | high2) & mask
+
+        low = zero1 & high2 | high1 & zero2 | low1 & low2
+        high = zero1 & low2 | low1 & zero2 | high1 & high2
+
+        return high << dimension | low
+
+    def is_a_set(self, card1, card2, card3):
+        """
+        Determines whether a group of 3 cards is a _Set_ or not.
+
+        `card1 (integer)`: A packed card.
+
+        `card2 (integer)`: A packed card.
+
+        `card3 (integer)`: A packed card.
+
+        `return (boolean)`: Whether or not the given cards represent a _Set_.
+        """
+
+        return self.third(card1, card2) == card3
+
+    def find_sets(self, board):
+        """
+        Removes _Sets_ from a _Board_ until none are left, looking up the third card of each pair.
+
+        The earliest _Set_ (in board order) is taken each time, just like `SetGame.find_sets()`.
+
+        `board (integer[])`: A list of distinct packed cards. _Sets_ are removed from it.
+
+        `return (sets[])`: A list (i.e., array) of Sets. Each Set contains 3 cards.
+        """
+
+        length = len(board)
+        where = dict((card, index) for index, card in enumerate(board))
+
+        if len(where) != length:
+            raise ValueError("A board cannot hold the same card twice.")
+
+        third = self.third
+        alive = [True] * length
+        sets = []
+
+        for i in six.moves.range(length - 2):
+            if not alive[i]:
+                continue
+
+            card = board[i]
+
+            for j in six.moves.range(i + 1, length - 1):
+                if alive[j]:
+                    k = where.get(third(card, board[j]), -1)
+
+                    if k > j and alive[k]:
+                        sets.append([card, board[j], board[k]])
+                        alive[i] = alive[j] = alive[k] = False
+                        break
+
+        board[:] = [card for card, keep in zip(board, alive) if keep]
+
+        return sets
+
+    def has_set(self, board):
+        """
+        Determines whether a _Board_ contains at least one _Set_.
+
+        `board (integer[])`: A list of distinct packed cards.
+
+        `return (boolean)`: Whether or not the board contains a Set.
+        """
+
+        present = set(board)
+        third = self.third
+
+        for i, card in enumerate(board):
+            for other in board[i + 1:]:
+                if third(card, other) in present:
+                    return True
+
+        return False
+
+
+class HyperSetGame(object):
+    """
+    A quiet _Game_ of "Set", played with a `SetSpace` of any dimension.
+
+    The _Game_ follows `SetGame.play_quiet()`: deal a _Board_, remove every _Set_ found, deal a few more cards, and
+    repeat until the _Deck_ is empty.
+    """
+
+    def __init__(self, dimension=4, seed=None, rng=None, board_size=12, extra=3, cache=None):
+        """
+        Constructs a new instance of this class.
+
+        `dimension (integer)`: The number of attributes on each card. The default value is `4`.
+
+        `seed (integer)`: A seed for this game's own random number generator. The default value is `None`.
+
+        `rng (random.Random)`: A random number generator to shuffle the _Deck_ with. Takes precedence over `seed`. The
+            default value is `None`.
+
+        `board_size (integer)`: The number of cards in the first deal. The default value is `12`.
+
+        `extra (integer)`: The number of cards dealt in each later round. The default value is `3`.
+
+        `cache (SetCache)`: A cache to find _Sets_ through, built with this dimension's `SetSpace.third` (see
+            `set_game_demo.cache`). It may be shared between games. The default value is `None`, which searches each
+            _Board_ from scratch.
+        """
+
+        self.space = SetSpace(dimension)
+        self.board_size = board_size
+        self.extra = extra
+        self.finder = self.space if cache is None else cache
+
+        if rng is None:
+            rng = random.Random(seed if seed is not None else random.getrandbits(64))
+
+        self.rng = rng
+        self.deck = Deck(self.space.cards(), rng)
+        self.board = []
+        self.sets = []
+
+    def deal(self, cards):
+        """
+        Deals a given number of cards from the top (front) of the deck, or as many as are left.
+
+        `cards (integer)`: The number of cards to deal out to the board.
+
+        `return (DeckSlice)`: A read-only view of the packed cards.
+        """
+
+        return self.deck.deal(min(cards, len(self.deck)))
+
+    def play_quiet(self):
+        """
+        Play a (quiet) game of Set.
+
+        `return (tuple(integer, sets[]))`: Returns a tuple where the first item is the number of Sets discovered. The
+            second item is the complete list of Sets.
+        """
+
+        self.board = list(self.deal(self.board_size))
+
+        while len(self.deck) > 0:
+            self.sets += self.finder.find_sets(self.board)
+            self.board += self.deal(self.extra)
+
+        self.sets += self.finder.find_sets(self.board)
+
+        return (len(self.sets), self.sets)
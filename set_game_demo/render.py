@@ -0,0 +1,167 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Writes _Sets_ out for people or for other programs, in bulk.
+
+Four formats are understood:
+
+* `table` (the default): A PrettyTable of each _Set_, as `set-game-demo --quiet` has always printed them.
+* `text`: One line per _Set_: `Set #1: one red solid diamond, two green empty squiggles, three purple striped ovals`.
+* `tsv`: Tab-separated values, with a header row and one row per card: `set`, `number`, `color`, `shape`, `shading`.
+* `jsonl`: One JSON object per _Set_, with its card IDs: `{"cards": [0, 40, 80], "set": 1}`.
+
+The text of each card is worked out once, for all 81 of them, so a _Set_ is formatted with a few lookups and joins.
+Tables are drawn by PrettyTable, which is far slower, so the table of each _Set_ is kept and reused whenever it comes up
+again (there are only 6480 _Sets_, counting every order of their cards). Output is written in chunks of many _Sets_
+at a time, rather than once per line.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from set_game_demo.cards import DECK
+
+FORMATS = ("table", "text", "tsv", "jsonl")
+DEFAULT_FORMAT = "table"
+
+# The number of Sets formatted before each write.
+DEFAULT_CHUNK_SIZE = 1000
+
+# The most tables of Sets to keep, which is room for every order of every Set and then some.
+MAX_TABLES = 65536
+
+_COLUMNS = ("number", "color", "shape", "shading")
+
+# The text of each card, by card ID.
+_NAMES = tuple(
+    "{} {} {} {}{}".format(card["number"], card["color"], card["shading"], card["shape"],
+                           "" if card["number"] == "one" else "s")
+    for card in DECK
+)
+_ROWS = tuple("\t".join(card[column] for column in _COLUMNS) for card in DECK)
+_IDS = tuple(str(card) for card in range(len(DECK)))
+
+_TABLES = {}
+
+
+def write_sets(sets, out, fmt=DEFAULT_FORMAT, start=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Writes _Sets_ to a stream.
+
+    `sets (iterable)`: The Sets. Each card is a `Card` or a card ID (see `set_game_demo.cards.to_card()` for dict-shaped
+        cards). Only the `table` format accepts dict-shaped cards as they are.
+
+    `out (file)`: Where to write them. Opened in text mode.
+
+    `fmt (string)`: The format. One of `table`, `text`, `tsv` or `jsonl`. The default value is `table`.
+
+    `start (integer)`: The number of the first Set. The default value is `1`.
+
+    `chunk_size (integer)`: The number of Sets formatted before each write. The default value is `1000`.
+
+    `return (integer)`: The number of Sets written.
+    """
+
+    if fmt not in FORMATS:
+        raise ValueError("Unknown format {!r}. Choose one of: {}.".format(fmt, ", ".join(FORMATS)))
+
+    if fmt == "tsv":
+        out.write("set\t" + "\t".join(_COLUMNS) + "\n")
+
+    if fmt == "table":
+        # PrettyTable accepts any kind of card.
+        def format_set(index, sset):
+            return "\nSet #{}\n{}\n".format(index, card_table(sset))
+    elif fmt == "text":
+        names = _NAMES.__getitem__
+
+        def format_set(index, sset):
+            return "Set #{}: {}\n".format(index, ", ".join(map(names, sset)))
+    elif fmt == "tsv":
+        rows = _ROWS.__getitem__
+
+        def format_set(index, sset):
+            prefix = "{}\t".format(index)
+            return prefix + ("\n" + prefix).join(map(rows, sset)) + "\n"
+    else:
+        ids = _IDS.__getitem__
+
+        def format_set(index, sset):
+            return '{{"cards": [{}], "set": {}}}\n'.format(", ".join(map(ids, sset)), index)
+
+    chunk = []
+    written = 0
+
+    for index, sset in enumerate(sets, start):
+        chunk.append(format_set(index, sset))
+        written += 1
+
+        if len(chunk) >= chunk_size:
+            out.write("".join(chunk))
+            del chunk[:]
+
+    if chunk:
+        out.write("".join(chunk))
+
+    return written
+
+
+def card_table(cards):
+    """
+    Draws cards as a table, with one row per card. Tables of _Sets_ which have been drawn before are reused. Any other
+    number of cards, such as a whole _Board_, hardly ever comes up twice, so it is drawn fresh every time.
+
+    `cards (cards[])`: A list (i.e., array) of objects representing cards.
+
+    `return (string)`: The table, without a trailing newline.
+    """
+
+    if len(cards) != 3:
+        return _draw(cards)
+
+    try:
+        key = tuple(int(card) for card in cards)
+    except TypeError:
+        # Dict-shaped cards can't be kept.
+        return _draw(cards)
+
+    table = _TABLES.get(key)
+
+    if table is None:
+        table = _draw(cards)
+
+        if len(_TABLES) < MAX_TABLES:
+            _TABLES[key] = table
+
+    return table
+
+
+def clear_tables():
+    """
+    Forgets every table which has been kept.
+
+    `return (void)`
+    """
+
+    _TABLES.clear()
+
+
+def _draw(cards):
+    """
+    Draws cards as a table with PrettyTable.
+
+    `cards (cards[])`: A list (i.e., array) of objects representing cards.
+
+    `return (string)`: The table.
+    """
+
+    from prettytable import PrettyTable
+
+    table = PrettyTable(["Number", "Color", "Shape", "Shading"])
+
+    for card in cards:
+        table.add_row([card["number"], card["color"], card["shape"], card["shading"]])
+
+    return str(table)
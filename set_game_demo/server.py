@@ -0,0 +1,483 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A line-based TCP server which hosts many _Games_ at once, with any number of players racing to claim _Sets_.
+
+Requires Python 3.7 or newer (it is built on `asyncio`), so it is not imported by `set_game_demo`.
+
+    python -m set_game_demo.server --port 7878
+
+Each connection is one player. Commands and replies are single lines of ASCII text, and cards are sent as card IDs
+(see `set_game_demo.cards`):
+
+* `NEW [seed]`: Starts a new _Game_ and joins it. Replies `GAME <game> <player>`.
+* `JOIN <game>`: Joins a _Game_ which is already running. Replies `GAME <game> <player>`. Joining the _Game_ a player
+  is already in changes nothing.
+* `BOARD`: Replies `BOARD <card> <card>...`, or `OVER` once the _Game_ is over.
+* `CLAIM <card> <card> <card>`: Claims a _Set_. Replies `SET <score>` if the claim stands, `MISS taken` if a card is no
+  longer on the _Board_ (another player got there first), `MISS invalid` if the cards are not a _Set_, or `OVER`.
+* `SCORES`: Replies `SCORES <player>:<score>...`.
+* `QUIT`: Replies `BYE`, and closes the connection.
+
+Anything else replies `ERROR <message>`. A _Game_ is forgotten once every player has left it.
+
+The _Board_ is kept by the rules: a claimed _Set_ is replaced from the _Deck_ while there are fewer than 12 cards, and
+3 more cards are dealt whenever the _Board_ has no _Set_ on it. The _Game_ is over when the _Deck_ is empty and no
+_Set_ is left. Commands are handled one at a time, without awaiting anything in between, so the first claim to
+arrive wins and every other player sees its result.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import argparse
+import asyncio
+import itertools
+from set_game_demo import SetGame
+from set_game_demo.cards import DECK
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7878
+
+# The longest command accepted, in bytes. Anything longer closes the connection.
+MAX_LINE = 1024
+
+
+class Table(object):
+    """
+    One hosted _Game_, and the scores of its players.
+    """
+
+    def __init__(self, game_id, seed=None):
+        """
+        Constructs a new instance of this class.
+
+        `game_id (integer)`: The ID of the game.
+
+        `seed (integer)`: A seed for the _Deck_. The default value is `None`, which picks one at random.
+        """
+
+        self.game_id = game_id
+        self.game = SetGame(seed=seed)
+        self.board = list(self.game.deal(12))
+        self.scores = []
+        self.over = False
+
+        # The number of connections playing this game right now.
+        self.connected = 0
+
+        self.__settle()
+
+    def join(self):
+        """
+        Adds a player.
+
+        `return (integer)`: The ID of the new player.
+        """
+
+        self.scores.append(0)
+        self.connected += 1
+
+        return len(self.scores) - 1
+
+    def claim(self, player, cards):
+        """
+        Claims a _Set_ for a player, and refills the _Board_ if the claim stands.
+
+        `player (integer)`: The ID of the player.
+
+        `cards (Card[])`: The 3 cards being claimed.
+
+        `return (string|None)`: `None` if the claim stands, otherwise why not: `taken` or `invalid`.
+        """
+
+        board = self.board
+
+        if not all(card in board for card in cards):
+            return "taken"
+
+        if len(set(cards)) != 3 or not SetGame.is_a_set(*cards):
+            return "invalid"
+
+        for card in cards:
+            board.remove(card)
+
+        self.game.sets.append(list(cards))
+        self.scores[player] += 1
+
+        if len(board) < 12 and len(self.game.deck) > 0:
+            board += self.game.deal(3)
+
+        self.__settle()
+
+        return None
+
+    def __settle(self):
+        """
+        Deals 3 more cards until the _Board_ has a _Set_ on it, or ends the _Game_ when the _Deck_ runs out first.
+
+        `return (void)`
+        """
+
+        while not SetGame.has_set(self.board):
+            if len(self.game.deck) == 0:
+                self.over = True
+                return
+
+            self.board += self.game.deal(3)
+            self.game.stalls += 1
+
+
+class Session(object):
+    """
+    The state of one connection: the _Game_ it joined, and its player ID.
+    """
+
+    __slots__ = ("table", "player")
+
+    def __init__(self):
+        """
+        Constructs a new instance of this class.
+        """
+
+        self.table = None
+        self.player = None
+
+
+class Connection(asyncio.Protocol):
+    """
+    One player's connection. Incoming data is split into lines, and every complete line is answered straight away,
+    with all of the replies sent in one write.
+    """
+
+    def __init__(self, server):
+        """
+        Constructs a new instance of this class.
+
+        `server (GameServer)`: The server which answers the commands.
+        """
+
+        self.server = server
+        self.session = Session()
+        self.transport = None
+
+        # The start of a line which hasn't been completed yet.
+        self.partial = b""
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def connection_lost(self, exc):
+        self.server.leave(self.session)
+
+    def data_received(self, data):
+        lines = (self.partial + data).split(b"\n")
+        self.partial = lines.pop()
+        replies = []
+
+        for line in lines:
+            line = line.decode("ascii", "replace").strip()
+
+            if line.upper() == "QUIT":
+                replies.append("BYE")
+                self.__send(replies)
+                self.transport.close()
+                return
+
+            replies.append(self.server.respond(self.session, line))
+
+        if len(self.partial) > MAX_LINE:
+            replies.append("ERROR line too long")
+            self.__send(replies)
+            self.transport.close()
+            return
+
+        if replies:
+            self.__send(replies)
+
+    def pause_writing(self):
+        # The client isn't reading its replies; stop reading its commands until it catches up.
+        self.transport.pause_reading()
+
+    def resume_writing(self):
+        self.transport.resume_reading()
+
+    def __send(self, replies):
+        """
+        Sends replies to the client.
+
+        `replies (string[])`: The replies, without their line endings.
+
+        `return (void)`
+        """
+
+        self.transport.write(("\n".join(replies) + "\n").encode("ascii", "replace"))
+
+
+class GameServer(object):
+    """
+    Hosts any number of _Games_, and answers the commands of every connection.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Constructs a new instance of this class.
+
+        `seed (integer)`: Seeds the _Deck_ of every _Game_ which is started without a seed, for reproducible runs. Each
+            _Game_ gets `seed + <game ID>`. The default value is `None`, which shuffles each _Deck_ at random.
+        """
+
+        self.seed = seed
+        self.tables = {}
+        self.claims = 0
+
+        self.__ids = itertools.count()
+        self.__commands = {
+            "NEW": self.__new,
+            "JOIN": self.__join,
+            "BOARD": self.__board,
+            "CLAIM": self.__claim,
+            "SCORES": self.__scores,
+        }
+
+    def respond(self, session, line):
+        """
+        Runs one command.
+
+        `session (Session)`: The connection that sent it.
+
+        `line (string)`: The command, without its line ending.
+
+        `return (string)`: The reply, without its line ending.
+        """
+
+        words = line.split()
+
+        if not words:
+            return "ERROR empty command"
+
+        command = self.__commands.get(words[0].upper())
+
+        if command is None:
+            return "ERROR unknown command {}".format(words[0])
+
+        try:
+            return command(session, words[1:])
+        except ValueError as error:
+            return "ERROR {}".format(error)
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Starts listening for connections.
+
+        `host (string)`: The address to listen on. The default value is `127.0.0.1`.
+
+        `port (integer)`: The port to listen on. A value of `0` picks a free port. The default value is `7878`.
+
+        `return (asyncio.AbstractServer)`: The listening server.
+        """
+
+        return await asyncio.get_running_loop().create_server(lambda: Connection(self), host, port)
+
+    def __new(self, session, args):
+        """
+        Runs `NEW [seed]`.
+        """
+
+        if len(args) > 1:
+            raise ValueError("usage: NEW [seed]")
+
+        game_id = next(self.__ids)
+
+        if args:
+            seed = int(args[0])
+        else:
+            seed = None if self.seed is None else self.seed + game_id
+
+        self.leave(session)
+        self.tables[game_id] = Table(game_id, seed)
+
+        return self.__enter(session, game_id)
+
+    def __join(self, session, args):
+        """
+        Runs `JOIN <game>`.
+        """
+
+        if len(args) != 1:
+            raise ValueError("usage: JOIN <game>")
+
+        game_id = int(args[0])
+        table = self.tables.get(game_id)
+
+        if table is None:
+            raise ValueError("no game {}".format(game_id))
+
+        # Already at this table: leaving first would forget the game (if this is its only player) or the score.
+        if session.table is table:
+            return "GAME {} {}".format(game_id, session.player)
+
+        self.leave(session)
+
+        return self.__enter(session, game_id)
+
+    def __board(self, session, args):
+        """
+        Runs `BOARD`.
+        """
+
+        table = self.__table(session)
+
+        if table.over:
+            return "OVER"
+
+        return "BOARD " + " ".join(str(int(card)) for card in table.board)
+
+    def __claim(self, session, args):
+        """
+        Runs `CLAIM <card> <card> <card>`.
+        """
+
+        table = self.__table(session)
+
+        if table.over:
+            return "OVER"
+
+        if len(args) != 3:
+            raise ValueError("usage: CLAIM <card> <card> <card>")
+
+        cards = [int(arg) for arg in args]
+
+        if not all(0 <= card < len(DECK) for card in cards):
+            raise ValueError("cards are numbered from 0 to {}".format(len(DECK) - 1))
+
+        self.claims += 1
+        reason = table.claim(session.player, [DECK[card] for card in cards])
+
+        if reason is not None:
+            return "MISS " + reason
+
+        return "SET {}".format(table.scores[session.player])
+
+    def __scores(self, session, args):
+        """
+        Runs `SCORES`.
+        """
+
+        table = self.__table(session)
+
+        return "SCORES " + " ".join("{}:{}".format(player, score) for player, score in enumerate(table.scores))
+
+    def __table(self, session):
+        """
+        Finds the _Game_ a connection has joined.
+
+        `session (Session)`: The connection.
+
+        `return (Table)`: The game.
+        """
+
+        if session.table is None:
+            raise ValueError("not in a game; send NEW or JOIN first")
+
+        return session.table
+
+    def __enter(self, session, game_id):
+        """
+        Joins a connection to a _Game_.
+
+        `session (Session)`: The connection.
+
+        `game_id (integer)`: The ID of the game.
+
+        `return (string)`: The reply to `NEW` or `JOIN`.
+        """
+
+        table = self.tables[game_id]
+        session.table = table
+        session.player = table.join()
+
+        return "GAME {} {}".format(game_id, session.player)
+
+    def leave(self, session):
+        """
+        Takes a connection out of its _Game_. The _Game_ is forgotten once every player has left, so that a
+        long-running server doesn't keep every _Game_ it has hosted.
+
+        `session (Session)`: The connection.
+
+        `return (void)`
+        """
+
+        table = session.table
+
+        if table is not None:
+            table.connected -= 1
+
+            if table.connected == 0:
+                self.tables.pop(table.game_id, None)
+
+        session.table = None
+        session.player = None
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, seed=None):  # pragma: no cover
+    """
+    Runs a server until it is interrupted.
+
+    `host (string)`: The address to listen on. The default value is `127.0.0.1`.
+
+    `port (integer)`: The port to listen on. The default value is `7878`.
+
+    `seed (integer)`: Seeds every _Game_ started without a seed. The default value is `None`.
+
+    `return (void)`
+    """
+
+    async def run():
+        server = await GameServer(seed).start(host, port)
+
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+def main():  # pragma: no cover
+    """
+    This function is run when the module is executed from the command-line.
+    """
+
+    parser = argparse.ArgumentParser(description="Host games of Set over TCP.")
+
+    parser.add_argument(
+        "--host",
+        dest="host",
+        default=DEFAULT_HOST,
+        help="The address to listen on. The default value is `{}`.".format(DEFAULT_HOST))
+
+    parser.add_argument(
+        "-p", "--port",
+        dest="port",
+        type=int,
+        default=DEFAULT_PORT,
+        help="The port to listen on. The default value is `{}`.".format(DEFAULT_PORT))
+
+    parser.add_argument(
+        "-s", "--seed",
+        dest="seed",
+        type=int,
+        help="Seeds every game started without a seed, for reproducible runs.")
+
+    flags = parser.parse_args()
+    serve(flags.host, flags.port, flags.seed)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
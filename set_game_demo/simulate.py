@@ -0,0 +1,210 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Plays large numbers of quiet _Games_ across a pool of processes, and summarizes them.
+
+Games are played in fixed-size chunks. Each chunk gets its own random number generator, seeded from one master
+seed, so a simulation gives the same answer no matter how many workers it is spread across. Workers send back
+histograms instead of the _Sets_ themselves.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import division
+import collections
+import multiprocessing
+import random
+import six
+from set_game_demo import SetGame
+from set_game_demo.cache import load_cache
+from set_game_demo.events import GAME_OVER, NO_SET_EXTRA_DEAL, SET_FOUND
+from set_game_demo.finders import DEFAULT_ENGINE
+from set_game_demo.stats import Stats
+
+
+class Summary(object):
+    """
+    Aggregate statistics over many _Games_.
+    """
+
+    def __init__(self):
+        """
+        Constructs a new instance of this class.
+        """
+
+        self.games = 0
+
+        # Histograms, keyed by the value seen in a single game.
+        self.sets = collections.Counter()
+        self.leftover = collections.Counter()
+        self.stalls = collections.Counter()
+
+        # Counters and timers from `set_game_demo.stats`, if they were recorded.
+        self.stats = None
+
+    def record(self, events):
+        """
+        Records a _Game_ from its stream of events.
+
+        `events (Event[])`: The events of one game, as produced by `SetGame.play_iter()`.
+
+        `return (void)`
+        """
+
+        sets = 0
+        stalls = 0
+
+        for event in events:
+            if event.kind == SET_FOUND:
+                sets += 1
+            elif event.kind == NO_SET_EXTRA_DEAL:
+                stalls += 1
+            elif event.kind == GAME_OVER:
+                self.leftover[len(event.cards)] += 1
+
+        self.games += 1
+        self.sets[sets] += 1
+        self.stalls[stalls] += 1
+
+    def merge(self, other):
+        """
+        Folds another summary into this one.
+
+        `other (Summary)`: The summary to add.
+
+        `return (Summary)`: This summary.
+        """
+
+        self.games += other.games
+        self.sets.update(other.sets)
+        self.leftover.update(other.leftover)
+        self.stalls.update(other.stalls)
+
+        if other.stats is not None:
+            self.stats = (self.stats or Stats()).merge(other.stats)
+
+        return self
+
+    @staticmethod
+    def mean(histogram):
+        """
+        Computes the mean of a histogram.
+
+        `histogram (Counter)`: Counts, keyed by value.
+
+        `return (float)`: The mean value, or `0.0` for an empty histogram.
+        """
+
+        total = sum(histogram.values())
+
+        return sum(value * count for value, count in histogram.items()) / total if total else 0.0
+
+    def as_dict(self):
+        """
+        Converts this summary into plain types, ready for `json.dumps()`.
+
+        `return (dict)`: The summary.
+        """
+
+        out = {
+            "games": self.games,
+            "mean_sets": self.mean(self.sets),
+            "mean_leftover": self.mean(self.leftover),
+            "mean_stalls": self.mean(self.stalls),
+            "sets": dict(sorted(self.sets.items())),
+            "leftover": dict(sorted(self.leftover.items())),
+            "stalls": dict(sorted(self.stalls.items())),
+        }
+
+        if self.stats is not None:
+            out["stats"] = self.stats.as_dict()
+
+        return out
+
+
+def simulate(n_games, workers=None, seed=None, engine=DEFAULT_ENGINE, chunk_size=1000, cache_table=None,
+             stats=False):
+    """
+    Plays many quiet _Games_ of Set, in parallel.
+
+    `n_games (integer)`: The number of games to play.
+
+    `workers (integer)`: The number of processes to use. A value of `1` plays every game in this process. The default
+        value is `None`, which uses one process per CPU.
+
+    `seed (integer)`: The master seed. The default value is `None`, which seeds from the operating system.
+
+    `engine (string)`: How _Sets_ are found. The default value is `pairs`.
+
+    `chunk_size (integer)`: The number of games played by a worker per task. The default value is `1000`.
+
+    `cache_table (string)`: A file written by `SetCache.dump()`, which every process loads into the read-only table of
+        its shared cache before playing (see `set_game_demo.cache`). Only the `cached` engine uses it. The default
+        value is `None`.
+
+    `stats (boolean)`: Whether to record counters and timers (see `set_game_demo.stats`) in `Summary.stats`, added up
+        over every game. The default value is `False`.
+
+    `return (Summary)`: The combined statistics of every game.
+    """
+
+    master = random.Random(seed)
+    tasks = []
+
+    for start in six.moves.range(0, n_games, chunk_size):
+        tasks.append((engine, master.getrandbits(64), min(chunk_size, n_games - start), stats))
+
+    summary = Summary()
+
+    if workers == 1:
+        if cache_table is not None:
+            load_cache(cache_table)
+
+        for task in tasks:
+            summary.merge(_play_chunk(task))
+
+        return summary
+
+    if cache_table is not None:
+        pool = multiprocessing.Pool(workers, initializer=load_cache, initargs=(cache_table,))
+    else:
+        pool = multiprocessing.Pool(workers)
+
+    try:
+        for result in pool.imap_unordered(_play_chunk, tasks):
+            summary.merge(result)
+    except BaseException:
+        # Don't wait for the rest of the games on an error or Ctrl-C.
+        pool.terminate()
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+
+    return summary
+
+
+def _play_chunk(task):
+    """
+    Plays one chunk of _Games_ from its own random number generator.
+
+    `task (tuple)`: The engine name, the seed for this chunk, the number of games to play, and whether to record stats.
+
+    `return (Summary)`: The statistics of the games in this chunk.
+    """
+
+    engine, seed, count, stats = task
+    rng = random.Random(seed)
+    summary = Summary()
+
+    if stats:
+        summary.stats = Stats()
+
+    for _ in six.moves.range(count):
+        summary.record(SetGame(engine=engine, rng=rng, stats=summary.stats).play_iter())
+
+    return summary
@@ -0,0 +1,194 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Searches for the most _Sets_ that can be taken from a _Deck_ dealt in a fixed order.
+
+`SetGame.find_sets()` always takes the earliest _Set_ it sees, but when _Sets_ overlap on the _Board_, which one is
+taken changes what can be found later. The `Solver` tries the alternatives.
+
+A state of the _Game_ is the number of cards dealt so far, plus a bitmask of which of those cards are still on the
+_Board_ (bit `i` is the `i`-th card dealt). The number of _Sets_ taken to get there follows from the two, so the same
+state is never worth searching twice, whichever order its _Sets_ were taken in. Each state is searched depth-first
+(greedy choice first), and is skipped when even taking every remaining card as _Sets_ could not beat the best
+_Game_ found so far.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from set_game_demo import _compat
+from set_game_demo.cards import THIRD, to_card
+
+# The number of states to search before settling for the best Game found so far.
+DEFAULT_MAX_NODES = 200000
+
+
+class Solver(object):
+    """
+    Finds the order of removals which takes the most _Sets_ from a _Deck_.
+
+    The first _Game_ searched is the greedy one, so the result is never worse than `SetGame.play_quiet()` (or
+    `SetGame.play_rules()`, with `rules=True`).
+    """
+
+    def __init__(self, deck, rules=False, max_nodes=DEFAULT_MAX_NODES):
+        """
+        Constructs a new instance of this class.
+
+        `deck (cards[])`: Every card of the deck, in the order they are dealt (e.g., `list(SetGame(seed=42).deck)`).
+
+        `rules (boolean)`: Whether to play like `SetGame.play_rules()` (refill to 12 cards after each _Set_) instead of
+            `SetGame.play_quiet()` (take _Sets_ until none are left, then deal 3 more). The default value is `False`.
+
+        `max_nodes (integer)`: The number of states to search before settling for the best _Game_ found so far. The
+            default value is `200000`.
+        """
+
+        self.deck = list(deck)
+        self.rules = rules
+        self.max_nodes = max_nodes
+
+        # The number of states searched, and whether the best Game is known to be the best possible.
+        self.nodes = 0
+        self.optimal = False
+
+        # third[i][j] is the position in the deck of the card which completes a Set with the i-th and j-th cards.
+        cards = [to_card(card) for card in self.deck]
+        where = dict((card, index) for index, card in enumerate(cards))
+
+        if len(where) != len(cards):
+            raise ValueError("A deck cannot hold the same card twice.")
+
+        self.__third = [[where.get(THIRD[card][other], -1) for other in cards] for card in cards]
+
+        # The most Sets which could still be taken from each state. Exact once a state has been searched in full.
+        self.__bounds = {}
+        self.__path = []
+        self.__best = -1
+        self.__best_path = []
+        self.__best_board = 0
+
+    def solve(self):
+        """
+        Runs the search.
+
+        `return (tuple(integer, sets[]))`: Returns a tuple where the first item is the number of Sets discovered. The
+            second item is the complete list of Sets, in the order they were taken.
+        """
+
+        self.nodes = 0
+        self.__bounds = {}
+        self.__path = []
+        self.__best = -1
+
+        dealt = min(12, len(self.deck))
+        self.__search(dealt, (1 << dealt) - 1)
+        self.optimal = self.nodes < self.max_nodes or self.__best == len(self.deck) // 3
+
+        sets = [[self.deck[i] for i in triple] for triple in self.__best_path]
+
+        return (len(sets), sets)
+
+    @property
+    def board(self):
+        """
+        `return (cards[])`: The cards left on the board at the end of the best _Game_, in the order they were dealt.
+        """
+
+        return [card for i, card in enumerate(self.deck) if self.__best_board >> i & 1]
+
+    def __search(self, dealt, board):
+        """
+        Searches every way to finish the _Game_ from a state.
+
+        `dealt (integer)`: The number of cards dealt so far.
+
+        `board (integer)`: A bitmask of the cards on the Board, by position in the deck.
+
+        `return (integer)`: The most Sets found from this state, or an upper bound on it if the search was cut short.
+        """
+
+        on_board = bin(board).count("1")
+        taken = (dealt - on_board) // 3
+        left = len(self.deck) - dealt
+        bound = self.__bounds.get((dealt, board), (on_board + left) // 3)
+
+        # Always finish the first (greedy) Game, even on a tiny budget.
+        if taken + bound <= self.__best or (self.nodes >= self.max_nodes and self.__best >= 0):
+            return bound
+
+        self.nodes += 1
+        sets = self.__sets(board)
+        best = -1
+
+        for triple in sets:
+            after = board & ~(1 << triple[0] | 1 << triple[1] | 1 << triple[2])
+            after_dealt = dealt
+
+            if self.rules and on_board <= 12 and left > 0:
+                after |= self.__dealing(dealt)
+                after_dealt += min(3, left)
+
+            self.__path.append(triple)
+            found = 1 + self.__search(after_dealt, after)
+            self.__path.pop()
+
+            best = max(best, found)
+
+            if best == bound:
+                # Every remaining card was taken; nothing can do better.
+                break
+
+        if not sets:
+            if left > 0:
+                best = self.__search(dealt + min(3, left), board | self.__dealing(dealt))
+            else:
+                best = 0
+
+                if taken > self.__best:
+                    self.__best = taken
+                    self.__best_path = list(self.__path)
+                    self.__best_board = board
+
+        # Anything that was skipped could not have beaten the best Game, so this is a bound even when it's not exact.
+        best = min(bound, max(best, self.__best - taken))
+        self.__bounds[(dealt, board)] = best
+
+        return best
+
+    def __dealing(self, dealt):
+        """
+        Works out which cards the next deal adds to the _Board_.
+
+        `dealt (integer)`: The number of cards dealt so far.
+
+        `return (integer)`: A bitmask of up to 3 cards, by position in the deck.
+        """
+
+        return ((1 << min(3, len(self.deck) - dealt)) - 1) << dealt
+
+    def __sets(self, board):
+        """
+        Lists every _Set_ on the _Board_, earliest (in deal order) first.
+
+        `board (integer)`: A bitmask of the cards on the Board, by position in the deck.
+
+        `return (tuple[])`: The deck positions of each Set, in ascending order.
+        """
+
+        positions = [i for i in _compat.range(len(self.deck)) if board >> i & 1]
+        third = self.__third
+        sets = []
+
+        for a, first in enumerate(positions):
+            row = third[first]
+
+            for second in positions[a + 1:]:
+                last = row[second]
+
+                if last > second and board >> last & 1:
+                    sets.append((first, second, last))
+
+        return sets
@@ -0,0 +1,283 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Immutable snapshots of a _Game_, for reading and exploring it from many threads at once.
+
+A `GameState` holds the order of the _Deck_, how many cards have been dealt, the cards on the _Board_, the _Sets_ taken
+so far and the number of stalls. Nothing about it can change: every move (`deal()`, `take()`, `play()`, `apply()`)
+returns a new state, which shares the _Deck_ with the old one, and leaves the old one as it was. A state can therefore
+be handed to any number of threads without copying it or locking it.
+
+    state = SetGame(seed=42, shared=True).snapshot().deal(12).settle()
+
+    for sset, future in state.futures():
+        print(sset, len(future.board))
+
+See `SetGame.snapshot()` and `SetGame.commit()` for how states are read from, and written back to, a running _Game_.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from set_game_demo.cards import THIRD, to_card
+from set_game_demo.events import DEAL, GAME_OVER, NO_SET_EXTRA_DEAL, SET_FOUND
+from set_game_demo.finders import DEFAULT_ENGINE, first_set, get_finder, has_set
+from set_game_demo.table import get_table
+
+
+class GameState(object):
+    """
+    An immutable snapshot of a _Game_.
+    """
+
+    __slots__ = ("cards", "cursor", "board", "sets", "stalls")
+
+    def __init__(self, cards, cursor=0, board=(), sets=(), stalls=0):
+        """
+        Constructs a new instance of this class.
+
+        `cards (cards[])`: Every card of the deck, in the order they are dealt.
+
+        `cursor (integer)`: The number of cards dealt so far. The default value is `0`.
+
+        `board (cards[])`: The cards on the board. The default value is `()`.
+
+        `sets (sets[])`: The Sets taken so far, in order. The default value is `()`.
+
+        `stalls (integer)`: The number of times that no Set could be found, and more cards had to be dealt. The default
+            value is `0`.
+        """
+
+        _assign(
+            self,
+            tuple(to_card(card) for card in cards),
+            cursor,
+            tuple(to_card(card) for card in board),
+            tuple(tuple(to_card(card) for card in sset) for sset in sets),
+            stalls,
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError("A GameState can't be changed; its moves return a new one.")
+
+    def __eq__(self, other):
+        if not isinstance(other, GameState):
+            return NotImplemented
+
+        return self.__fields() == other.__fields()  # pylint: disable=W0212
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash(self.__fields())
+
+    def __repr__(self):
+        return "GameState(board={!r}, deck={}, sets={}, stalls={})".format(
+            [int(card) for card in self.board], len(self.cards) - self.cursor, len(self.sets), self.stalls
+        )
+
+    @property
+    def deck(self):
+        """
+        `return (Card[])`: The cards left in the deck, in the order they will be dealt.
+        """
+
+        return self.cards[self.cursor:]
+
+    @property
+    def is_over(self):
+        """
+        `return (boolean)`: Whether the game is over: the deck is empty, and there is no Set on the board.
+        """
+
+        return self.cursor >= len(self.cards) and not has_set(self.board)
+
+    def deal(self, count=3):
+        """
+        Deals cards from the _Deck_ onto the _Board_.
+
+        `count (integer)`: The number of cards to deal. The default value is `3`.
+
+        `return (GameState)`: The new state. Raises an `IndexError` if the deck does not have that many cards left, or a
+            `ValueError` if the count is negative.
+        """
+
+        if count < 0:
+            raise ValueError("Cannot deal {} cards.".format(count))
+
+        stop = self.cursor + count
+
+        if stop > len(self.cards):
+            raise IndexError("Cannot deal {} cards; only {} are left.".format(count, len(self.cards) - self.cursor))
+
+        return _make(self.cards, stop, self.board + self.cards[self.cursor:stop], self.sets, self.stalls)
+
+    def take(self, sset):
+        """
+        Takes a _Set_ from the _Board_, without dealing any more cards.
+
+        `sset (cards[])`: The 3 cards of the Set.
+
+        `return (GameState)`: The new state. Raises a `ValueError` if the cards are not a Set on the board.
+        """
+
+        sset = tuple(to_card(card) for card in sset)
+
+        if len(sset) != 3 or len(set(sset)) != 3 or THIRD[sset[0]][sset[1]] != sset[2]:
+            raise ValueError("{!r} is not a Set.".format([int(card) for card in sset]))
+
+        if not all(card in self.board for card in sset):
+            raise ValueError("{!r} is not on the board.".format([int(card) for card in sset]))
+
+        board = tuple(card for card in self.board if card not in sset)
+
+        return _make(self.cards, self.cursor, board, self.sets + (sset,), self.stalls)
+
+    def play(self, sset):
+        """
+        Takes a _Set_, and deals by the rules (like `SetGame.play_rules()`): the _Board_ is refilled to 12 cards, and
+        then 3 more cards are dealt for as long as there is no _Set_ on it.
+
+        `sset (cards[])`: The 3 cards of the Set.
+
+        `return (GameState)`: The new state.
+        """
+
+        state = self.take(sset)
+
+        if len(state.board) < 12 and state.cursor < len(state.cards):
+            state = state.deal(3)
+
+        return state.settle()
+
+    def settle(self):
+        """
+        Deals 3 more cards for as long as there is no _Set_ on the _Board_ and the _Deck_ has cards left, counting
+        a stall each time.
+
+        `return (GameState)`: The new state (this one, if there is already a Set on the board).
+        """
+
+        state = self
+
+        while state.cursor < len(state.cards) and not has_set(state.board):
+            state = state.deal(3)
+            state = _make(state.cards, state.cursor, state.board, state.sets, state.stalls + 1)
+
+        return state
+
+    def apply(self, event):
+        """
+        Follows an event of `SetGame.play_iter()` or `SetGame.play_rules_iter()`.
+
+        `event (Event)`: The event.
+
+        `return (GameState)`: The new state.
+        """
+
+        cards = tuple(event.cards)
+
+        if event.kind == SET_FOUND:
+            board = tuple(card for card in self.board if card not in cards)
+            return _make(self.cards, self.cursor, board, self.sets + (cards,), self.stalls)
+
+        if event.kind == GAME_OVER:
+            return _make(self.cards, self.cursor, cards, self.sets, self.stalls)
+
+        stalls = self.stalls + (event.kind == NO_SET_EXTRA_DEAL)
+
+        if event.kind not in (DEAL, NO_SET_EXTRA_DEAL):
+            raise ValueError("Unknown event {!r}.".format(event.kind))
+
+        return _make(self.cards, self.cursor + len(cards), self.board + cards, self.sets, stalls)
+
+    def has_set(self):
+        """
+        Checks whether there is a _Set_ on the _Board_.
+
+        `return (boolean)`: Whether or not the board contains a Set.
+        """
+
+        return has_set(self.board)
+
+    def first_set(self):
+        """
+        Finds the first _Set_ on the _Board_ (the one `SetGame.find_sets()` would take first).
+
+        `return (tuple|None)`: A Set of 3 Cards, or `None` if there are no Sets on the board.
+        """
+
+        sset = first_set(self.board)
+
+        return None if sset is None else tuple(sset)
+
+    def find_sets(self, engine=DEFAULT_ENGINE):
+        """
+        Finds _Sets_ on the _Board_ like `SetGame.find_sets()`, but on a copy of it, so this state is left alone.
+
+        `engine (string)`: The name of the engine to search with. The default value is `pairs`.
+
+        `return (tuple(sets[], cards[]))`: The Sets which were found, and the cards which would be left over.
+        """
+
+        board = list(self.board)
+        sets = get_finder(engine)(board)
+
+        return (sets, board)
+
+    def sets_on_board(self):
+        """
+        Lists every _Set_ on the _Board_. Unlike `find_sets()`, _Sets_ may share cards.
+
+        `return (tuple[])`: Every Set, each a tuple in ascending card order.
+        """
+
+        return [tuple(sset) for sset in get_table().sets_on(self.board)]
+
+    def futures(self):
+        """
+        Lists the states which can follow this one: one for each _Set_ on the _Board_, taken and dealt by the rules
+        (see `play()`).
+
+        `return (tuple[])`: A list of `(set, state)` pairs, one per Set on the board.
+        """
+
+        return [(sset, self.play(sset)) for sset in self.sets_on_board()]
+
+    def __fields(self):
+        """
+        Lists everything which makes up this state, for comparing and hashing.
+
+        `return (tuple)`: The fields.
+        """
+
+        return (self.cursor, self.board, self.sets, self.stalls, self.cards)
+
+
+def _make(cards, cursor, board, sets, stalls):
+    """
+    Builds a state from fields which are already tuples of cards, without checking or copying them.
+
+    `return (GameState)`: The new state.
+    """
+
+    state = GameState.__new__(GameState)
+    _assign(state, cards, cursor, board, sets, stalls)
+
+    return state
+
+
+def _assign(state, cards, cursor, board, sets, stalls):
+    """
+    Fills in the fields of a new state, around its `__setattr__()`.
+
+    `return (void)`
+    """
+
+    for name, value in zip(GameState.__slots__, (cards, cursor, board, sets, stalls)):
+        object.__setattr__(state, name, value)
@@ -0,0 +1,303 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Opt-in counters and timers for the hot paths of a _Game_.
+
+Nothing is recorded unless a `Stats` object is active. Either use one as a context manager, which records everything
+that happens inside the block:
+
+    with Stats() as stats:
+        SetGame(seed=42).play_quiet()
+
+    print(stats.to_json())
+
+or pass `stats=True` to `SetGame`, which records that _Game_ in `game.stats`. When a `Stats` object is activated inside
+another, everything is recorded in both, so one object can collect the totals while another holds a single _Game_.
+
+When nothing is active, each instrumented call site costs a single check of `active_stats()`, made once per deal or
+search rather than once per card.
+
+These counters are recorded:
+
+* `deal.cards`: The number of cards dealt.
+* `find_sets.cards`: The number of cards on each _Board_ searched, added up.
+* `find_sets.sets`: The number of _Sets_ found.
+* `is_a_set.calls`: The number of groups of 3 cards checked by the brute-force (`combinations`) search. This is also
+  the number of triples it examined.
+* `is_a_set.rejected.<attribute>`: How many of those were rejected by each attribute, checking `color`, `shape`,
+  `shading` and then `number`.
+* `combinations.restarts`: How many times the brute-force search started over after removing a _Set_.
+
+And these timers, each with a number of calls and a total number of seconds:
+
+* `deal`: Dealing cards from the _Deck_.
+* `find_sets`: Removing every _Set_ from a _Board_ (`SetGame.find_sets()` and `SetGame.play_quiet()`).
+* `take_set`: Removing one _Set_ from a _Board_ (`SetGame.play_rules()`).
+
+Only one `Stats` object can be active at a time in each process, so a _Game_ with stats should not be played by more
+than one thread at once.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+import time
+from set_game_demo.cards import ATTRIBUTES, to_card
+
+# The most precise clock available. Python 2 does not have `perf_counter()`.
+_CLOCK = getattr(time, "perf_counter", time.time)
+
+_ACTIVE = None
+
+
+class Stats(object):
+    """
+    A set of named counters and timers.
+    """
+
+    def __init__(self):
+        """
+        Constructs a new instance of this class.
+        """
+
+        # Only imported once stats are wanted, to keep `import set_game_demo` quick.
+        import collections
+
+        self.counters = collections.Counter()
+
+        # The number of calls and the total number of seconds, keyed by timer name.
+        self.timers = {}
+
+        # The objects which were active before this one, innermost last.
+        self.__outer = []
+
+    def __enter__(self):
+        global _ACTIVE  # pylint: disable=W0603
+
+        self.__outer.append(_ACTIVE)
+        _ACTIVE = self
+
+        return self
+
+    def __exit__(self, *args):
+        global _ACTIVE  # pylint: disable=W0603
+
+        _ACTIVE = self.__outer.pop()
+
+        return False
+
+    def count(self, name, amount=1):
+        """
+        Adds to a counter.
+
+        `name (string)`: The name of the counter.
+
+        `amount (integer)`: The amount to add. The default value is `1`.
+
+        `return (void)`
+        """
+
+        self.counters[name] += amount
+        outer = self.__enclosing()
+
+        if outer is not None:
+            outer.count(name, amount)
+
+    def add_time(self, name, seconds, calls=1):
+        """
+        Adds to a timer.
+
+        `name (string)`: The name of the timer.
+
+        `seconds (float)`: The number of seconds to add.
+
+        `calls (integer)`: The number of calls to add. The default value is `1`.
+
+        `return (void)`
+        """
+
+        timer = self.timers.get(name)
+
+        if timer is None:
+            self.timers[name] = [calls, seconds]
+        else:
+            timer[0] += calls
+            timer[1] += seconds
+
+        outer = self.__enclosing()
+
+        if outer is not None:
+            outer.add_time(name, seconds, calls)
+
+    def time(self, name, function, *args):
+        """
+        Calls a function, and adds the time it took to a timer.
+
+        `name (string)`: The name of the timer.
+
+        `function (callable)`: The function to call.
+
+        `*args (mixed)`: The arguments to call it with.
+
+        `return (mixed)`: Whatever the function returns.
+        """
+
+        start = _CLOCK()
+
+        try:
+            return function(*args)
+        finally:
+            self.add_time(name, _CLOCK() - start)
+
+    def wrap(self, events):
+        """
+        Makes this object active while each item of an iterator is produced, but not while it is being used. Several
+        _Games_ can then be played in step, each with its own stats.
+
+        `events (iterator)`: The iterator to wrap (e.g., `SetGame.play_iter()`).
+
+        `return (generator)`: The same items.
+        """
+
+        while True:
+            with self:
+                event = next(events, None)
+
+            if event is None:
+                return
+
+            yield event
+
+    def is_a_set(self):
+        """
+        Builds a version of `SetGame.is_a_set()` which counts its calls, and which attribute rejected each group.
+
+        `return (callable)`: A function which accepts 3 cards, and returns whether or not they are a Set.
+        """
+
+        # Avoid a circular import; `SetGame` owns `is_a_set`.
+        from set_game_demo import SetGame
+
+        count = self.count
+
+        def is_a_set(card1, card2, card3):
+            count("is_a_set.calls")
+
+            if SetGame.is_a_set(card1, card2, card3):
+                return True
+
+            count("is_a_set.rejected." + _rejected_by(card1, card2, card3))
+
+            return False
+
+        return is_a_set
+
+    def merge(self, other):
+        """
+        Folds another set of stats into this one.
+
+        `other (Stats)`: The stats to add.
+
+        `return (Stats)`: This object.
+        """
+
+        for name, amount in other.counters.items():
+            self.count(name, amount)
+
+        for name, (calls, seconds) in other.timers.items():
+            self.add_time(name, seconds, calls)
+
+        return self
+
+    def clear(self):
+        """
+        Resets every counter and timer.
+
+        `return (void)`
+        """
+
+        self.counters.clear()
+        self.timers.clear()
+
+    def as_dict(self):
+        """
+        Converts these stats into plain types, ready for `json.dumps()`.
+
+        `return (dict)`: The counters, and the number of calls and seconds of each timer.
+        """
+
+        return {
+            "counters": dict(sorted(self.counters.items())),
+            "timers": dict(
+                (name, {"calls": calls, "seconds": seconds})
+                for name, (calls, seconds) in sorted(self.timers.items())
+            ),
+        }
+
+    def to_json(self, **kwargs):
+        """
+        Serializes these stats as JSON.
+
+        `**kwargs (mixed)`: Passed on to `json.dumps()` (e.g., `indent=2`).
+
+        `return (string)`: The JSON document.
+        """
+
+        import json
+
+        return json.dumps(self.as_dict(), sort_keys=True, **kwargs)
+
+    def __enclosing(self):
+        """
+        Finds the object which was active before this one, if this one is active.
+
+        `return (Stats|None)`: The enclosing object.
+        """
+
+        if self.__outer and self.__outer[-1] is not self:
+            return self.__outer[-1]
+
+        return None
+
+    def __getstate__(self):
+        # Only the numbers travel between processes.
+        return {"counters": self.counters, "timers": self.timers}
+
+    def __setstate__(self, state):
+        self.__init__()
+        self.counters.update(state["counters"])
+        self.timers.update(state["timers"])
+
+
+def active_stats():
+    """
+    Returns the `Stats` object which is recording, if any.
+
+    `return (Stats|None)`: The active object, or `None` when nothing is being recorded.
+    """
+
+    return _ACTIVE
+
+
+def _rejected_by(card1, card2, card3):
+    """
+    Works out the first attribute which stops 3 cards from being a _Set_.
+
+    `card1 (card)`: A card object, or a card ID.
+
+    `card2 (card)`: A card object, or a card ID.
+
+    `card3 (card)`: A card object, or a card ID.
+
+    `return (string)`: The name of the attribute, or `unknown` if none of them does.
+    """
+
+    cards = [to_card(card) if isinstance(card, int) else card for card in (card1, card2, card3)]
+
+    for attribute in ATTRIBUTES:
+        if len(set(card[attribute] for card in cards)) == 2:
+            return attribute
+
+    return "unknown"
@@ -0,0 +1,235 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Canonical forms of _Boards_ under the symmetries of the _Deck_.
+
+Think of each card as a point in a 4-dimensional space over the integers mod 3 (one coordinate per attribute). Three
+cards are a _Set_ exactly when they lie on a line, so any map of the _Deck_ which keeps lines as lines keeps _Sets_
+as _Sets_. Those maps are the affine maps: relabelling the values of an attribute, swapping attributes, and mixing
+attributes together linearly. There are `81 × 24261120` of them, so huge numbers of _Boards_ have exactly the same
+_Set_ structure.
+
+A _Board_'s canonical form picks one representative of its class:
+
+1. Any card may be the origin (it maps to card `0`).
+2. The first card chosen after it maps to card `1`, the next card which is not in the span of those so far maps to
+   card `3`, then `9`, then `27`. Every other card follows from those (its coordinates are preserved).
+3. Of every such choice, the one whose sorted card IDs are smallest is the canonical form.
+
+Once `k` cards have been chosen, the cards in their span have IDs below `3ᵏ`, and every other card's ID is at least
+`3ᵏ`. So the start of the sorted result is already fixed, and any choice whose start is worse than the best one can be
+dropped right away. Only some cards are considered as the origin, picked by a property which every symmetry keeps:
+how many pairs of cards on the _Board_ point at the card itself (its number of _Sets_) and at each card in line with
+it and another card on the _Board_.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+import six
+from set_game_demo.cards import DECK, THIRD, to_card
+
+# NEG[a] is the card `-a`, and ADD[a][b] is the card `a + b`, treating cards as vectors.
+NEG = tuple(THIRD[0][card] for card in six.moves.range(81))
+ADD = tuple(tuple(NEG[THIRD[card1][card2]] for card2 in six.moves.range(81)) for card1 in six.moves.range(81))
+
+# The card which each chosen card maps to, in turn.
+_WEIGHTS = (1, 3, 9, 27)
+
+# Larger than any card ID; marks the end of a partial result, which ranks after any card that could follow it.
+_END = 81
+
+
+def canonicalize(board):
+    """
+    Maps a _Board_ to the canonical representative of its class.
+
+    `board (cards[])`: A list (i.e., array) of distinct Cards.
+
+    `return (tuple(tuple, tuple))`: The canonical form (a sorted tuple of card IDs), and the canonical card ID of each
+        card on the Board, in board order.
+    """
+
+    cards = _card_ids(board)
+
+    if not cards:
+        return ((), ())
+
+    # Each branch is the board translated so that its origin is 0, plus the image of each vector in the span so far.
+    branches = [
+        ([ADD[card][NEG[origin]] for card in cards], {0: 0})
+        for origin in _origins(cards)
+    ]
+    prefix = (0,)
+
+    for weight in _WEIGHTS:
+        if len(prefix) == len(cards):
+            break
+
+        best = None
+        survivors = []
+
+        for vectors, span in branches:
+            outside = [vector for vector in vectors if vector not in span]
+
+            for chosen in outside:
+                # A vector outside the span lands in the span after taking away `chosen` once or twice, or not at
+                # all. Everything already in the span keeps its image, so only the new images need comparing.
+                minus = NEG[chosen]
+                images = []
+
+                for vector in outside:
+                    once = ADD[vector][minus]
+
+                    if once in span:
+                        images.append(weight + span[once])
+                    elif ADD[once][minus] in span:
+                        images.append(2 * weight + span[ADD[once][minus]])
+
+                images.sort()
+                images.append(_END)
+
+                if best is None or images < best:
+                    best = images
+                    survivors = [(vectors, span, chosen)]
+                elif images == best:
+                    survivors.append((vectors, span, chosen))
+
+        prefix += tuple(best[:-1])
+        branches = [(vectors, _extend(span, chosen, weight)) for vectors, span, chosen in survivors]
+
+    vectors, span = branches[0]
+
+    return (prefix, tuple(DECK[span[vector]] for vector in vectors))
+
+
+def _extend(span, chosen, weight):
+    """
+    Adds a vector to a span.
+
+    `span (dict)`: The image of each vector in the span so far.
+
+    `chosen (integer)`: The vector to add.
+
+    `weight (integer)`: The image of the vector to add.
+
+    `return (dict)`: The image of each vector in the larger span.
+    """
+
+    extended = dict(span)
+
+    for point, image in six.iteritems(span):
+        once = ADD[point][chosen]
+        extended[once] = image + weight
+        extended[ADD[once][chosen]] = image + 2 * weight
+
+    return extended
+
+
+def canonical_form(board):
+    """
+    Maps a _Board_ to the canonical representative of its class. Two _Boards_ have the same canonical form exactly
+    when some symmetry of the _Deck_ maps one onto the other.
+
+    `board (cards[])`: A list (i.e., array) of distinct Cards.
+
+    `return (tuple)`: The canonical form, as a sorted tuple of card IDs.
+    """
+
+    return canonicalize(board)[0]
+
+
+def fingerprint(board):
+    """
+    Summarizes the _Set_ structure of a _Board_ cheaply. Equivalent _Boards_ always have the same fingerprint, but
+    _Boards_ with the same fingerprint are not always equivalent; compare `canonical_form()` to be sure.
+
+    `board (cards[])`: A list (i.e., array) of distinct Cards.
+
+    `return (tuple)`: The number of cards, the number of Sets, and the sorted number of Sets through each card.
+    """
+
+    cards = _card_ids(board)
+    degrees = _degrees(cards)
+
+    return (len(cards), sum(degrees) // 3, tuple(sorted(degrees)))
+
+
+def equivalent(board1, board2):
+    """
+    Determines whether some symmetry of the _Deck_ maps one _Board_ onto another.
+
+    `board1 (cards[])`: A list (i.e., array) of distinct Cards.
+
+    `board2 (cards[])`: A list (i.e., array) of distinct Cards.
+
+    `return (boolean)`: Whether or not the Boards are equivalent.
+    """
+
+    return fingerprint(board1) == fingerprint(board2) and canonical_form(board1) == canonical_form(board2)
+
+
+def _card_ids(board):
+    """
+    Reads the card IDs of a _Board_.
+
+    `board (cards[])`: A list (i.e., array) of distinct Cards.
+
+    `return (Card[])`: The cards.
+    """
+
+    cards = [to_card(card) for card in board]
+
+    if len(set(cards)) != len(cards):
+        raise ValueError("A board cannot hold the same card twice.")
+
+    return cards
+
+
+def _degrees(cards):
+    """
+    Counts the _Sets_ on the _Board_ through each card.
+
+    `cards (Card[])`: The cards on the Board.
+
+    `return (integer[])`: The number of Sets through each card, in board order.
+    """
+
+    present = set(cards)
+
+    return [
+        sum(1 for other in cards if other != card and THIRD[card][other] in present) // 2
+        for card in cards
+    ]
+
+
+def _origins(cards):
+    """
+    Picks the cards which may map to card `0`.
+
+    Any two cards point at the card which would complete their _Set_. For each card, count how many pairs point at the
+    card itself, and at the third card in line with it and each other card on the _Board_. A symmetry keeps all of
+    those counts, so only the cards with the largest counts need to be tried.
+
+    `cards (Card[])`: The cards on the Board.
+
+    `return (Card[])`: The candidates.
+    """
+
+    pointed = [0] * 81
+
+    for i, card in enumerate(cards):
+        row = THIRD[card]
+
+        for other in cards[i + 1:]:
+            pointed[row[other]] += 1
+
+    keys = [
+        (pointed[card], sorted(pointed[THIRD[card][other]] for other in cards if other != card))
+        for card in cards
+    ]
+    best = max(keys)
+
+    return [card for card, key in zip(cards, keys) if key == best]
@@ -0,0 +1,156 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A lookup table of all 1080 _Sets_ in the _Deck_.
+
+The table is built the first time it is needed (or loaded from a file written by `SetTable.save()`), and is shared by
+everything in the process afterwards.
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+import struct
+from set_game_demo import _compat
+from set_game_demo.cards import DECK, THIRD
+
+# File header: a magic string, then the number of Sets that follow (3 bytes per Set).
+_MAGIC = b"SETTBL1\n"
+_HEADER = struct.Struct("<8sH")
+
+_TABLE = None
+
+
+class SetTable(object):
+    """
+    Every _Set_ in the _Deck_, and for each card, the 40 _Sets_ that contain it.
+    """
+
+    def __init__(self, sets):
+        """
+        Constructs a new instance of this class.
+
+        `sets (tuple[])`: Every Set, as a tuple of 3 card IDs in ascending order.
+        """
+
+        self.sets = tuple(sets)
+
+        partners = [[] for _ in _compat.range(81)]
+
+        for card1, card2, card3 in self.sets:
+            partners[card1].append((card2, card3))
+            partners[card2].append((card1, card3))
+            partners[card3].append((card1, card2))
+
+        # partners[card] lists the other two cards of each Set that `card` is part of.
+        self.partners = tuple(tuple(pairs) for pairs in partners)
+
+    def __len__(self):
+        return len(self.sets)
+
+    @classmethod
+    def build(cls):
+        """
+        Lists every _Set_ in the _Deck_.
+
+        `return (SetTable)`: A new table.
+        """
+
+        return cls(
+            (card1, card2, THIRD[card1][card2])
+            for card1 in _compat.range(81)
+            for card2 in _compat.range(card1 + 1, 81)
+            if THIRD[card1][card2] > card2
+        )
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a table written by `save()`.
+
+        `path (string)`: The file to read.
+
+        `return (SetTable)`: A new table.
+        """
+
+        import array
+
+        with open(path, "rb") as handle:
+            magic, count = _HEADER.unpack(handle.read(_HEADER.size))
+
+            if magic != _MAGIC:
+                raise ValueError("{} is not a Set table.".format(path))
+
+            cards = array.array("B")
+            cards.fromfile(handle, count * 3)
+
+        return cls(tuple(cards[i:i + 3]) for i in _compat.range(0, len(cards), 3))
+
+    def save(self, path):
+        """
+        Writes this table to a small binary file (about 3 KB).
+
+        `path (string)`: The file to write.
+
+        `return (void)`
+        """
+
+        import array
+
+        with open(path, "wb") as handle:
+            handle.write(_HEADER.pack(_MAGIC, len(self.sets)))
+            array.array("B", [card for triple in self.sets for card in triple]).tofile(handle)
+
+    def sets_on(self, cards):
+        """
+        Lists every _Set_ made up of the given cards. _Sets_ may share cards.
+
+        `cards (cards[])`: A list (i.e., array) of Cards.
+
+        `return (sets[])`: A list (i.e., array) of Sets, each in ascending card order.
+        """
+
+        present = [False] * 81
+
+        for card in cards:
+            present[card] = True
+
+        return [
+            [DECK[card], DECK[card2], DECK[card3]]
+            for card in sorted(cards)
+            for card2, card3 in self.partners[card]
+            if card < card2 and present[card2] and present[card3]
+        ]
+
+
+def get_table():
+    """
+    Returns the shared table, building it the first time.
+
+    `return (SetTable)`: The table.
+    """
+
+    global _TABLE  # pylint: disable=W0603
+
+    if _TABLE is None:
+        _TABLE = SetTable.build()
+
+    return _TABLE
+
+
+def load_table(path):
+    """
+    Replaces the shared table with one read from a file written by `SetTable.save()`.
+
+    `path (string)`: The file to read.
+
+    `return (SetTable)`: The table.
+    """
+
+    global _TABLE  # pylint: disable=W0603
+
+    _TABLE = SetTable.load(path)
+
+    return _TABLE
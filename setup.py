@@ -22,8 +22,11 @@ setup(
     author_email='ryan@ryanparman.com',
     url="https://github.com/skyzyx/set-game-demo",
     install_requires=requires,
+    extras_require={
+        'numpy': ['numpy>=1.8'],
+    },
     version=version,
-    packages=find_packages(exclude=['tests*']),
+    packages=find_packages(exclude=['benchmarks*', 'tests*']),
     description='Simple demo of the game of Set.',
     long_description=readme,
     keywords='set demo game',
@@ -44,7 +47,7 @@ setup(
     ],
     entry_points={
         'console_scripts': [
-            'set-game-demo=set_game_demo:main',
+            'set-game-demo=set_game_demo.cli:main',
         ],
     },
 )
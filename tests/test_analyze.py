@@ -0,0 +1,109 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import io
+import json
+import random
+import unittest
+import nose2
+from set_game_demo import SetGame
+from set_game_demo.analyze import analyze, read_records, write_binary
+from set_game_demo.cards import DECK
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.analyze module."""
+
+    def setUp(self):
+        """Deal some boards from a private random number generator."""
+        rng = random.Random(20)
+        self.boards = [[int(card) for card in rng.sample(DECK, size)] for size in (3, 12, 15, 21) for _ in range(10)]
+
+    def run_analyze(self, text, **kwargs):
+        """Analyze JSON lines, and read back the results."""
+        sink = io.StringIO()
+        totals = analyze(io.StringIO(text), sink, **kwargs)
+
+        return totals, [json.loads(line) for line in sink.getvalue().splitlines()]
+
+    def jsonl(self):
+        """The boards, as JSON lines."""
+        return u"".join(json.dumps(board) + u"\n" for board in self.boards)
+
+    # --------------------------------------------------------------------------
+    # Analyzing
+
+    def test_find(self):
+        totals, results = self.run_analyze(self.jsonl(), batch_size=7)
+
+        self.assertEqual(list(range(40)), [result["index"] for result in results])
+
+        for board, result in zip(self.boards, results):
+            expected_board = [DECK[card] for card in board]
+            expected = SetGame.find_sets(expected_board)
+
+            self.assertEqual([[int(card) for card in sset] for sset in expected], result["sets"])
+            self.assertEqual([int(card) for card in expected_board], result["leftover"])
+            self.assertEqual(bool(expected), result["has_set"])
+
+        self.assertEqual({"boards": 40, "with_sets": sum(r["has_set"] for r in results), "errors": 0}, totals)
+
+    def test_has(self):
+        _, results = self.run_analyze(self.jsonl(), mode="has")
+
+        self.assertEqual([SetGame.has_set([DECK[card] for card in board]) for board in self.boards],
+                         [result["has_set"] for result in results])
+        self.assertFalse("sets" in results[0])
+
+    def test_workers(self):
+        expected = self.run_analyze(self.jsonl())
+        self.assertEqual(expected, self.run_analyze(self.jsonl(), workers=2, batch_size=3))
+
+    def test_shapes_and_errors(self):
+        lines = [
+            json.dumps({"id": "a", "board": [DECK[0].as_dict(), 1, 2]}),
+            "",
+            "[0, 81]",
+            "not json",
+            json.dumps({"board": "0 1 2"}),
+        ]
+        totals, results = self.run_analyze(u"\n".join(lines) + u"\n")
+
+        self.assertEqual({"id": "a", "index": 0, "has_set": True, "sets": [[0, 1, 2]], "leftover": []}, results[0])
+        self.assertEqual([1, 2, 3], [result["index"] for result in results[1:]])
+        self.assertTrue(all("error" in result for result in results[1:]))
+        self.assertEqual({"boards": 4, "with_sets": 1, "errors": 3}, totals)
+
+        self.assertRaises(ValueError, analyze, io.StringIO(), io.StringIO(), fmt="xml")
+        self.assertRaises(ValueError, analyze, io.StringIO(), io.StringIO(), mode="all")
+
+    # --------------------------------------------------------------------------
+    # Binary format
+
+    def test_binary(self):
+        stream = io.BytesIO()
+        self.assertEqual(40, write_binary(self.boards, stream))
+        self.assertEqual(sum(1 + len(board) for board in self.boards), len(stream.getvalue()))
+
+        stream.seek(0)
+        sink = io.StringIO()
+        analyze(stream, sink, fmt="binary")
+
+        self.assertEqual(self.run_analyze(self.jsonl())[1], [json.loads(line) for line in sink.getvalue().splitlines()])
+
+        # A board cut short is an error in the stream itself.
+        truncated = io.BytesIO(stream.getvalue()[:-1])
+        self.assertRaises(ValueError, list, read_records(truncated, "binary"))
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
@@ -0,0 +1,66 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import itertools
+import unittest
+import nose2
+from set_game_demo import SetGame
+from set_game_demo.batch import is_a_set_batch, numpy
+from set_game_demo.cards import DECK, digits
+
+# Every group of 3 cards drawn from the first 27 cards of the deck.
+TRIPLES = list(itertools.combinations(range(27), 3))
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.batch module."""
+
+    def setUp(self):
+        """Work out the expected answers one group at a time."""
+        self.expected = [SetGame.is_a_set(DECK[a], DECK[b], DECK[c]) for a, b, c in TRIPLES]
+
+    # --------------------------------------------------------------------------
+    # Pure Python
+
+    def test_python_ids(self):
+        self.assertEqual(self.expected, is_a_set_batch(TRIPLES, use_numpy=False))
+
+    def test_python_digits(self):
+        triples = [[digits(card) for card in triple] for triple in TRIPLES]
+        self.assertEqual(self.expected, is_a_set_batch(triples, use_numpy=False))
+
+    # --------------------------------------------------------------------------
+    # NumPy
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed.")
+    def test_numpy_ids(self):
+        self.assertEqual(self.expected, is_a_set_batch(numpy.array(TRIPLES)).tolist())
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed.")
+    def test_numpy_digits(self):
+        triples = numpy.stack(digits(numpy.array(TRIPLES)), axis=-1)
+        self.assertEqual((len(TRIPLES), 3, 4), triples.shape)
+        self.assertEqual(self.expected, is_a_set_batch(triples).tolist())
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed.")
+    def test_numpy_shapes(self):
+        self.assertEqual(0, len(is_a_set_batch([])))
+        self.assertRaises(ValueError, is_a_set_batch, numpy.zeros((4, 2)))
+
+        # Negative IDs mustn't wrap around to other cards.
+        for bad in ([[0, 1, 2], [-1, 40, 80]], [[0, 1, 81]]):
+            self.assertRaises(ValueError, is_a_set_batch, numpy.array(bad))
+            self.assertRaises(ValueError, is_a_set_batch, bad, use_numpy=False)
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
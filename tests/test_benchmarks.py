@@ -0,0 +1,56 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import os
+import shutil
+import tempfile
+import unittest
+import nose2
+from benchmarks import suite
+from benchmarks.fixtures import CAP_SET, boards
+from set_game_demo import SetGame
+
+class Test(unittest.TestCase):
+    """Unit tests for the benchmarks package."""
+
+    # --------------------------------------------------------------------------
+    # Fixtures
+
+    def test_fixtures(self):
+        self.assertEqual(boards(12, 5), boards(12, 5))
+        self.assertEqual([], SetGame.find_sets(list(CAP_SET)))
+
+    # --------------------------------------------------------------------------
+    # Suite
+
+    def test_measure_and_compare(self):
+        results = suite.measure(scale=0.01, repeat=1, only="find_sets", min_time=0)
+        self.assertEqual(5, len(results))
+
+        directory = tempfile.mkdtemp()
+
+        try:
+            path = os.path.join(directory, "baseline.json")
+            suite.save(path, results)
+            baseline = suite.load(path)
+        finally:
+            shutil.rmtree(directory)
+
+        self.assertEqual([], suite.compare(results, baseline, 0.25))
+
+        slower = dict((name, value * 2) for name, value in results.items())
+        self.assertEqual(sorted(results), suite.compare(slower, baseline, 0.25))
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
@@ -0,0 +1,122 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import random
+import unittest
+import nose2
+from set_game_demo.board import BoardIndex, RulesBoard
+from set_game_demo.cards import DECK, THIRD
+from set_game_demo.finders import find_sets_combinations, first_set
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.board module."""
+
+    def setUp(self):
+        """Seed a private random number generator."""
+        self.rng = random.Random(4321)
+
+    # --------------------------------------------------------------------------
+    # Maintaining the index
+
+    def test_add_and_remove(self):
+        board = BoardIndex([DECK[0], DECK[1]])
+        self.assertFalse(board.has_set())
+        self.assertEqual([DECK[2]], board.completions())
+
+        board.add([DECK[2]])
+        self.assertTrue(board.has_set())
+        self.assertEqual([[DECK[0], DECK[1], DECK[2]]], board.sets())
+        self.assertEqual([], board.completions())
+
+        board.remove([DECK[1]])
+        self.assertFalse(board.has_set())
+        self.assertEqual(2, len(board))
+        self.assertTrue(DECK[2] in board)
+        self.assertFalse(DECK[1] in board)
+
+    def test_duplicates(self):
+        board = BoardIndex([DECK[0]])
+        self.assertRaises(ValueError, board.add, [DECK[0]])
+        self.assertRaises(ValueError, board.remove, [DECK[1]])
+
+    def test_sets_match_brute_force(self):
+        board = BoardIndex()
+        cards = self.rng.sample(DECK, 30)
+
+        for i in range(0, 30, 3):
+            board.add(cards[i:i + 3])
+            present = board.cards
+            expected = set(
+                frozenset((a, b, THIRD[a][b])) for a in present for b in present if a < b and THIRD[a][b] in board
+            )
+            self.assertEqual(expected, set(frozenset(s) for s in board.sets()))
+
+    # --------------------------------------------------------------------------
+    # Finding sets
+
+    def test_take_sets_matches_find_sets(self):
+        for _ in range(100):
+            cards = self.rng.sample(DECK, 18)
+            board = BoardIndex(cards)
+
+            self.assertEqual(find_sets_combinations(cards), board.take_sets())
+            self.assertEqual(cards, board.cards)
+
+    def test_take_set(self):
+        for _ in range(100):
+            cards = self.rng.sample(DECK, 15)
+            board = BoardIndex(cards)
+            expected = first_set(cards)
+
+            self.assertEqual(expected, board.take_set())
+            self.assertEqual(len(cards) - (3 if expected else 0), len(board))
+
+        self.assertIsNone(BoardIndex([DECK[0], DECK[1]]).take_set())
+
+    # --------------------------------------------------------------------------
+    # Playing by the rules
+
+    def test_rules_board_matches_first_set(self):
+        for _ in range(100):
+            deck = self.rng.sample(DECK, 81)
+            board = RulesBoard(deck[:12])
+            expected = deck[:12]
+            dealt = 12
+
+            while True:
+                sset = board.take_set()
+                self.assertEqual(first_set(expected), sset)
+
+                if sset is not None:
+                    expected = [card for card in expected if card not in sset]
+                elif dealt == 81:
+                    break
+
+                if dealt < 81 and (sset is None or len(expected) < 12):
+                    board.add(deck[dealt:dealt + 3])
+                    expected += deck[dealt:dealt + 3]
+                    dealt += 3
+
+                self.assertEqual(expected, board.cards)
+
+    def test_rules_board_take_sets(self):
+        cards = self.rng.sample(DECK, 21)
+        board = RulesBoard(cards)
+
+        self.assertEqual(find_sets_combinations(cards), board.take_sets())
+        self.assertEqual(cards, board.cards)
+        self.assertRaises(ValueError, board.add, [DECK[0], DECK[0]])
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
@@ -0,0 +1,151 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import os
+import random
+import shutil
+import tempfile
+import unittest
+import nose2
+from set_game_demo.cache import SetCache
+from set_game_demo.cards import DECK
+from set_game_demo.finders import find_sets_pairs
+from set_game_demo.hyper import HyperSetGame, SetSpace
+from set_game_demo.simulate import simulate
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.cache module."""
+
+    def setUp(self):
+        """Seed a private random number generator, and make a scratch directory."""
+        self.rng = random.Random(99)
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        shutil.rmtree(self.directory)
+
+    # --------------------------------------------------------------------------
+    # Finding sets
+
+    def test_matches_pairs(self):
+        cache = SetCache()
+
+        for size in (3, 12, 15, 21):
+            for _ in range(30):
+                board = self.rng.sample(DECK, size)
+
+                for _ in range(2):
+                    # The same cards in another order are a hit, but the Sets taken follow the new order.
+                    self.rng.shuffle(board)
+                    expected_board = list(board)
+                    expected = find_sets_pairs(expected_board)
+                    actual_board = list(board)
+
+                    self.assertEqual(expected, cache.find_sets(actual_board))
+                    self.assertEqual(expected_board, actual_board)
+
+        self.assertEqual(120, cache.misses)
+        self.assertEqual(120, cache.hits)
+        self.assertEqual(0.5, cache.stats()["hit_rate"])
+
+    def test_dicts_and_duplicates(self):
+        cache = SetCache()
+        board = [DECK[i].as_dict() for i in (0, 1, 2, 40, 80)]
+
+        self.assertEqual([[DECK[0].as_dict(), DECK[1].as_dict(), DECK[2].as_dict()]], cache.find_sets(board))
+        self.assertEqual([DECK[40].as_dict(), DECK[80].as_dict()], board)
+
+        board = [DECK[0], DECK[0], DECK[0], DECK[5]]
+        self.assertEqual(1, len(cache.find_sets(board)))
+        self.assertEqual([DECK[5]], board)
+
+    # --------------------------------------------------------------------------
+    # Eviction
+
+    def test_least_recently_used(self):
+        cache = SetCache(maxsize=2)
+        first, second, third = [DECK[0], DECK[1]], [DECK[2], DECK[3]], [DECK[4], DECK[5]]
+
+        cache.sets_on(first)
+        cache.sets_on(second)
+        cache.sets_on(first)
+        cache.sets_on(third)
+
+        self.assertEqual(1, cache.evictions)
+        self.assertEqual(2, len(cache))
+
+        # `second` was the least recently used.
+        cache.sets_on(first)
+        self.assertEqual(2, cache.hits)
+        cache.sets_on(second)
+        self.assertEqual(4, cache.misses)
+
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual({"hits": 0, "misses": 0, "evictions": 0, "hit_rate": 0.0, "size": 0, "table": 0},
+                         cache.stats())
+
+    # --------------------------------------------------------------------------
+    # Sharing
+
+    def test_dump_and_load(self):
+        path = os.path.join(self.directory, "cache.json")
+        boards = [self.rng.sample(DECK, 12) for _ in range(20)]
+        cache = SetCache()
+
+        for board in boards:
+            cache.sets_on(board)
+
+        cache.dump(path)
+
+        shared = SetCache(maxsize=0)
+        shared.load(path)
+        shared.clear()
+
+        self.assertEqual(20, shared.stats()["table"])
+
+        for board in boards:
+            self.assertEqual(cache.sets_on(board), shared.sets_on(board))
+
+        self.assertEqual(20, shared.hits)
+        self.assertEqual(0, shared.misses)
+
+        shared.sets_on(self.rng.sample(DECK, 12))
+        self.assertEqual(1, shared.misses)
+        self.assertEqual(0, shared.stats()["size"])
+
+    def test_simulate_with_table(self):
+        path = os.path.join(self.directory, "cache.json")
+        SetCache().dump(path)
+
+        expected = simulate(20, workers=1, seed=3).as_dict()
+        self.assertEqual(expected, simulate(20, workers=1, seed=3, engine="cached", cache_table=path).as_dict())
+
+    # --------------------------------------------------------------------------
+    # Other decks
+
+    def test_hyper(self):
+        space = SetSpace(2)
+        cache = SetCache(third=space.third)
+
+        for seed in range(20):
+            expected = HyperSetGame(2, seed=seed, board_size=6).play_quiet()
+            self.assertEqual(expected, HyperSetGame(2, seed=seed, board_size=6, cache=cache).play_quiet())
+
+        self.assertTrue(cache.hits > 0)
+        self.assertRaises(ValueError, cache.find_sets, [0, 0])
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
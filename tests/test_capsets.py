@@ -0,0 +1,91 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import nose2
+from set_game_demo import capsets
+from set_game_demo.capsets import count_caps, no_set_probabilities
+
+# The number of boards of each size with no Set on them, from 0 cards to 8.
+KNOWN = [1, 81, 3240, 84240, 1579500, 22441536, 247615056, 2144076480, 14587567020]
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.capsets module."""
+
+    def setUp(self):
+        """Make a scratch directory."""
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        shutil.rmtree(self.directory)
+
+    # --------------------------------------------------------------------------
+    # Counting
+
+    def test_counts(self):
+        sizes = []
+
+        self.assertEqual(KNOWN[:8], count_caps(7, progress=lambda size, count: sizes.append(size)))
+        self.assertEqual(list(range(8)), sizes)
+
+    def test_workers(self):
+        self.assertEqual(KNOWN[:7], count_caps(6, workers=2, chunk_size=1))
+
+    def test_probabilities(self):
+        probabilities = no_set_probabilities(KNOWN[:4])
+
+        self.assertEqual([1.0, 1.0, 1.0], probabilities[:3])
+
+        # Every 3 cards but the 1080 Sets.
+        self.assertAlmostEqual(1 - 1080 / 85320.0, probabilities[3])
+
+    # --------------------------------------------------------------------------
+    # Checkpoints
+
+    def test_resume(self):
+        path = os.path.join(self.directory, "caps.json")
+
+        self.assertEqual(KNOWN[:5], count_caps(4, checkpoint=path))
+        self.assertEqual(KNOWN[:7], count_caps(6, checkpoint=path))
+
+        # A smaller search only reads the checkpoint.
+        self.assertEqual(KNOWN[:4], count_caps(3, checkpoint=path))
+
+    def test_resume_in_the_middle(self):
+        path = os.path.join(self.directory, "caps.json")
+        count_caps(5, checkpoint=path)
+
+        # Stop after the first of the 3 classes of size 5.
+        with open(path) as handle:
+            state = json.load(handle)
+
+        state["next"] = dict(capsets._extend(state["classes"][:1]))
+        state["done"] = 1
+
+        with open(path, "w") as handle:
+            json.dump(state, handle)
+
+        self.assertEqual(KNOWN[:7], count_caps(6, checkpoint=path, chunk_size=1))
+
+    def test_keys(self):
+        cards = [0, 1, 3, 40, 80]
+        self.assertEqual(cards, capsets._unpack(capsets._pack(cards)))
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
@@ -0,0 +1,68 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import itertools
+import unittest
+import nose2
+from set_game_demo import SetGame
+from set_game_demo.cards import Card, DECK, THIRD, digits, encode, to_card
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.cards module."""
+
+    # --------------------------------------------------------------------------
+    # Encoding
+
+    def test_deck_order(self):
+        self.assertEqual(81, len(DECK))
+        self.assertEqual({"color": "red", "shape": "diamond", "shading": "solid", "number": "one"}, DECK[0].as_dict())
+        self.assertEqual({"color": "purple", "shape": "oval", "shading": "striped", "number": "three"},
+                         DECK[80].as_dict())
+
+    def test_dict_view(self):
+        card = encode(1, 2, 0, 1)
+        self.assertTrue(isinstance(card, Card))
+        self.assertEqual("green", card["color"])
+        self.assertEqual("oval", card["shape"])
+        self.assertEqual("solid", card["shading"])
+        self.assertEqual("two", card["number"])
+        self.assertEqual(None, card.get("texture"))
+        self.assertEqual(["color", "shape", "shading", "number"], card.keys())
+
+    def test_round_trip(self):
+        for card in DECK:
+            self.assertTrue(to_card(card.as_dict()) is card)
+            self.assertEqual(card, encode(*digits(card)))
+
+    def test_digits(self):
+        self.assertEqual((2, 1, 0, 2), digits(encode(2, 1, 0, 2)))
+
+    # --------------------------------------------------------------------------
+    # Set-detection
+
+    def test_third(self):
+        for card1, card2 in itertools.combinations(DECK, 2):
+            card3 = THIRD[card1][card2]
+            self.assertEqual(card3, THIRD[card2][card1])
+            self.assertTrue(SetGame.is_a_set(card1.as_dict(), card2.as_dict(), card3.as_dict()))
+
+    def test_is_a_set_matches_dicts(self):
+        for card1, card2, card3 in itertools.combinations(DECK[:27], 3):
+            self.assertEqual(
+                SetGame.is_a_set(card1.as_dict(), card2.as_dict(), card3.as_dict()),
+                SetGame.is_a_set(card1, card2, card3),
+            )
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
@@ -0,0 +1,58 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import unittest
+import nose2
+from set_game_demo.cli import build_parser, command_engine
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.cli module."""
+
+    def parse(self, *args):
+        """Parse command-line arguments."""
+        return build_parser().parse_args(args)
+
+    # --------------------------------------------------------------------------
+    # Flags
+
+    def test_single_game(self):
+        flags = self.parse()
+
+        self.assertEqual((None, False, "pairs"), (flags.command, flags.quiet, flags.engine))
+        self.assertEqual("bitboard", self.parse("-e", "bitboard").engine)
+        self.assertEqual("table", flags.format)
+        self.assertEqual("tsv", self.parse("-q", "-f", "tsv").format)
+
+    # --------------------------------------------------------------------------
+    # Sub-commands
+
+    def test_simulate(self):
+        flags = self.parse("simulate", "5")
+
+        self.assertEqual(("simulate", 5, "pairs"), (flags.command, flags.games, command_engine(flags)))
+        self.assertEqual("bitboard", command_engine(self.parse("-e", "bitboard", "simulate", "5")))
+        self.assertEqual("table", command_engine(self.parse("-e", "bitboard", "simulate", "5", "-e", "table")))
+
+    def test_analyze(self):
+        flags = self.parse("-f", "tsv", "-e", "bitboard", "analyze")
+
+        # The top-level flags are kept, and don't leak into the sub-command's own.
+        self.assertEqual(("tsv", "jsonl"), (flags.format, flags.input_format))
+        self.assertEqual("bitboard", command_engine(flags))
+
+        flags = self.parse("analyze", "boards.bin", "-f", "binary", "-e", "table")
+        self.assertEqual(("table", "binary", "table"), (flags.format, flags.input_format, command_engine(flags)))
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
@@ -0,0 +1,92 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import random
+import unittest
+import nose2
+from set_game_demo import SetGame
+from set_game_demo.cards import DECK
+from set_game_demo.deck import Deck, DeckSlice
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.deck module."""
+
+    # --------------------------------------------------------------------------
+    # Shuffling
+
+    def test_same_order_as_a_shuffled_list(self):
+        shuffled = list(DECK)
+        random.Random(7).shuffle(shuffled)
+
+        self.assertEqual(shuffled, list(Deck(DECK, random.Random(7))))
+
+    def test_typecode(self):
+        self.assertEqual("B", Deck(DECK, random.Random(1)).order.typecode)
+        self.assertEqual("H", Deck(list(range(729)), random.Random(1)).order.typecode)
+
+    # --------------------------------------------------------------------------
+    # Dealing
+
+    def test_deal(self):
+        deck = Deck(DECK, random.Random(2))
+        everything = list(deck)
+        first = deck.deal(12)
+        second = deck.deal(3)
+
+        self.assertIsInstance(first, DeckSlice)
+        self.assertEqual(everything[:12], first)
+        self.assertEqual(everything[12:15], second)
+        self.assertEqual(66, len(deck))
+        self.assertEqual(everything[15:], list(deck))
+        self.assertEqual(everything[15], deck.popleft())
+        self.assertEqual(65, len(deck))
+
+    def test_deal_too_many(self):
+        deck = Deck(DECK, random.Random(3))
+        deck.deal(80)
+
+        self.assertRaises(IndexError, deck.deal, 2)
+        self.assertEqual(1, len(deck.deal(1)))
+        self.assertRaises(IndexError, deck.popleft)
+
+    def test_deal_negative(self):
+        deck = Deck(DECK, random.Random(3))
+        deck.deal(12)
+
+        # Cards which were dealt never come back.
+        self.assertRaises(ValueError, deck.deal, -3)
+        self.assertEqual(69, len(deck))
+
+    def test_view(self):
+        deck = Deck(DECK, random.Random(4))
+        everything = list(deck)
+        cards = deck.deal(5)
+
+        self.assertEqual(everything[4], cards[-1])
+        self.assertEqual(everything[1:4], cards[1:4])
+        self.assertRaises(IndexError, lambda: cards[5])
+        self.assertEqual([int(card) for card in everything[:5]], list(cards.indexes))
+        self.assertNotEqual(cards, everything[:4])
+        self.assertRaises(TypeError, hash, cards)
+
+    def test_game_deal(self):
+        game = SetGame(seed=5)
+        everything = list(game.deck)
+
+        self.assertEqual(everything[:12], game.deal())
+        self.assertEqual(69, len(game.deck))
+        self.assertRaises(IndexError, game.deal, 70)
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
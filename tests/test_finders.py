@@ -0,0 +1,139 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import random
+import unittest
+import nose2
+from set_game_demo import SetGame
+from set_game_demo.cards import DECK
+from set_game_demo.finders import (
+    FINDERS, find_sets_bitboard, find_sets_combinations, find_sets_pairs, first_set, get_finder, has_set
+)
+
+# A 20-card board with no Sets on it (the largest possible).
+CAP_SET = [0, 1, 3, 4, 9, 10, 12, 13, 27, 28, 32, 35, 38, 47, 59, 65, 66, 67, 71, 77]
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.finders module."""
+
+    def setUp(self):
+        """Seed a private random number generator."""
+        self.rng = random.Random(1234)
+
+    def boards(self, size, count=50):
+        """Deal a number of random boards of the given size."""
+        for _ in range(count):
+            yield self.rng.sample(DECK, size)
+
+    # --------------------------------------------------------------------------
+    # Finding sets
+
+    def test_pairs_matches_combinations(self):
+        for size in (3, 6, 12, 15, 18, 21):
+            for board in self.boards(size):
+                expected_board = list(board)
+                expected = find_sets_combinations(expected_board)
+
+                self.assertEqual(expected, find_sets_pairs(board))
+                self.assertEqual(expected_board, board)
+
+    def test_engines_match_combinations(self):
+        for size in (12, 15, 18, 21):
+            for board in self.boards(size, 20):
+                expected_board = list(board)
+                expected = find_sets_combinations(expected_board)
+
+                for engine in FINDERS:
+                    actual_board = list(board)
+                    self.assertEqual(expected, get_finder(engine)(actual_board))
+                    self.assertEqual(expected_board, actual_board)
+
+    def test_unknown_engine(self):
+        self.assertRaises(ValueError, get_finder, "quantum")
+        self.assertRaises(ValueError, SetGame, engine="quantum")
+
+    def test_bitboard_with_duplicates(self):
+        board = [DECK[0], DECK[0], DECK[0], DECK[5]]
+        self.assertEqual(1, len(find_sets_bitboard(board)))
+        self.assertEqual([DECK[5]], board)
+
+    def test_pairs_with_dicts(self):
+        board = [DECK[i].as_dict() for i in (0, 1, 2, 40, 80)]
+        sets = find_sets_pairs(board)
+
+        self.assertEqual([[DECK[0].as_dict(), DECK[1].as_dict(), DECK[2].as_dict()]], sets)
+        self.assertEqual([DECK[40].as_dict(), DECK[80].as_dict()], board)
+
+    def test_pairs_with_duplicates(self):
+        board = [DECK[0].as_dict(), DECK[0].as_dict(), DECK[0].as_dict(), DECK[5]]
+        self.assertEqual(1, len(find_sets_pairs(board)))
+        self.assertEqual([DECK[5]], board)
+
+    def test_cap_set(self):
+        board = [DECK[i] for i in CAP_SET]
+        for engine in FINDERS:
+            self.assertEqual([], get_finder(engine)(board))
+            self.assertEqual(20, len(board))
+
+    # --------------------------------------------------------------------------
+    # Early exit
+
+    def test_first_set_matches_combinations(self):
+        for size in (0, 2, 3, 6, 9, 12, 15, 21):
+            for board in self.boards(size):
+                original = list(board)
+                expected = find_sets_combinations(list(board))
+
+                self.assertEqual(expected[0] if expected else None, first_set(board))
+                self.assertEqual(bool(expected), has_set(board))
+                self.assertEqual(original, board)
+
+    def test_first_set_on_cap_set(self):
+        board = [DECK[i] for i in CAP_SET]
+
+        self.assertIsNone(SetGame.first_set(board))
+        self.assertFalse(SetGame.has_set(board))
+
+        for card in DECK:
+            if card not in board:
+                self.assertTrue(SetGame.has_set(board + [card]))
+                self.assertIsNotNone(SetGame.first_set([card] + board))
+
+    def test_first_set_with_dicts_and_duplicates(self):
+        board = [DECK[i].as_dict() for i in (40, 0, 1, 80, 2)]
+        self.assertEqual([DECK[40].as_dict(), DECK[0].as_dict(), DECK[80].as_dict()], first_set(board))
+        self.assertTrue(has_set(board))
+
+        self.assertEqual([DECK[0]] * 3, first_set([DECK[5], DECK[0], DECK[0], DECK[0]]))
+        self.assertFalse(has_set([DECK[0], DECK[0], DECK[5]]))
+
+    def test_play_quiet_matches_combinations(self):
+        for seed in range(5):
+            expected = SetGame(seed=seed)
+            board = list(expected.deal(12))
+            while len(expected.deck) > 0:
+                expected.sets += find_sets_combinations(board)
+                board += expected.deal(3)
+            expected.sets += find_sets_combinations(board)
+
+            for engine in FINDERS:
+                game = SetGame(engine=engine, seed=seed)
+                discovered, sets = game.play_quiet()
+
+                self.assertEqual(len(expected.sets), discovered)
+                self.assertEqual(expected.sets, sets)
+                self.assertEqual(board, game.board)
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
@@ -0,0 +1,153 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import os
+import shutil
+import tempfile
+import unittest
+import nose2
+from set_game_demo import SetGame
+from set_game_demo.cards import DECK
+from set_game_demo.events import GAME_OVER
+from set_game_demo.gamelog import GameLog, GameLogWriter
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.gamelog module."""
+
+    def setUp(self):
+        """Make a scratch directory."""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "games.setlog")
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        shutil.rmtree(self.directory)
+
+    @staticmethod
+    def played(seed):
+        """Play a quiet game, and return its Sets and leftover cards as card IDs."""
+        game = SetGame(seed=seed)
+        _, sets = game.play_quiet()
+
+        return [[int(card) for card in sset] for sset in sets], [int(card) for card in game.board]
+
+    # --------------------------------------------------------------------------
+    # Writing and reading
+
+    def test_round_trip(self):
+        expected = [self.played(seed) for seed in range(20)]
+
+        with GameLogWriter(self.path) as writer:
+            for seed in range(10):
+                self.assertEqual(seed, writer.record(SetGame(seed=seed).play_iter()))
+
+            for sets, leftover in expected[10:]:
+                writer.append(sets, leftover)
+
+        with GameLog(self.path) as log:
+            self.assertEqual(20, len(log))
+            self.assertEqual(sum(len(sets) for sets, _ in expected), log.sets)
+            self.assertEqual(sum(len(leftover) for _, leftover in expected), log.leftover)
+
+            for game, (sets, leftover) in zip(log, expected):
+                self.assertEqual(len(sets), game.set_count)
+                self.assertEqual(sets, [list(sset) for sset in game.iter_sets()])
+                self.assertEqual(leftover, list(game.leftover))
+
+            self.assertEqual(expected[-1][1], list(log[-1].leftover))
+            self.assertEqual([tuple(sset) for sets, _ in expected for sset in sets], list(log.iter_sets()))
+            self.assertEqual([card for _, leftover in expected for card in leftover], list(log.leftover_cards()))
+
+            with self.assertRaises(IndexError):
+                log[20]  # pylint: disable=W0104
+
+    def test_empty_games(self):
+        with GameLogWriter(self.path) as writer:
+            writer.append([], [])
+            writer.append([[DECK[0], DECK[1], DECK[2]]], [{"color": "red", "shape": "oval", "shading": "solid",
+                                                          "number": "one"}])
+
+        with GameLog(self.path) as log:
+            self.assertEqual(0, log[0].set_count)
+            self.assertEqual([], list(log[0].leftover))
+            self.assertEqual([(0, 1, 2)], list(log[1].iter_sets()))
+            self.assertEqual(1, len(log[1].leftover))
+
+        with GameLogWriter(self.path):
+            pass
+
+        with GameLog(self.path) as log:
+            self.assertEqual(0, len(log))
+            self.assertEqual([], list(log.iter_sets()))
+
+    def test_views(self):
+        with GameLogWriter(self.path) as writer:
+            writer.record(SetGame(seed=1).play_iter())
+
+        log = GameLog(self.path)
+        game = log[0]
+
+        # A view of the mapped file, not a copy, which can still be read once the log is closed.
+        self.assertIsInstance(game.sets, memoryview)
+        expected = list(game.sets)
+        log.close()
+        log.close()
+
+        self.assertEqual(expected, list(game.sets))
+        self.assertRaises(ValueError, log.__getitem__, 0)
+        self.assertRaises(ValueError, log.set_cards)
+
+    # --------------------------------------------------------------------------
+    # Errors
+
+    def test_failed_game(self):
+        def failing():
+            for event in SetGame(seed=2).play_iter():
+                if event.kind == GAME_OVER:
+                    raise RuntimeError("interrupted")
+
+                yield event
+
+        with GameLogWriter(self.path) as writer:
+            writer.record(SetGame(seed=1).play_iter())
+            self.assertRaises(RuntimeError, writer.record, failing())
+            writer.record(SetGame(seed=3).play_iter())
+
+        # Nothing of the failed game is left behind.
+        with GameLog(self.path) as log:
+            self.assertEqual(
+                [self.played(1)[0], self.played(3)[0]],
+                [[list(sset) for sset in game.iter_sets()] for game in log]
+            )
+
+    def test_bad_input(self):
+        with GameLogWriter(self.path) as writer:
+            self.assertRaises(ValueError, writer.append, [[0, 1]], [])
+            self.assertRaises(ValueError, writer.append, [], [81])
+
+        with open(self.path, "rb") as handle:
+            data = handle.read()
+
+        with open(self.path, "wb") as handle:
+            handle.write(b"not a game log")
+
+        self.assertRaises(ValueError, GameLog, self.path)
+
+        with open(self.path, "wb") as handle:
+            handle.write(data[:-1])
+
+        self.assertRaises(ValueError, GameLog, self.path)
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
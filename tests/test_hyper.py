@@ -0,0 +1,107 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import itertools
+import random
+import unittest
+import nose2
+from set_game_demo import SetGame
+from set_game_demo.cards import DECK, digits
+from set_game_demo.hyper import HyperSetGame, SetSpace
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.hyper module."""
+
+    # --------------------------------------------------------------------------
+    # Cards
+
+    def test_encoding(self):
+        space = SetSpace(5)
+        cards = space.cards()
+
+        self.assertEqual(243, len(set(cards)))
+
+        for card in cards:
+            self.assertEqual(card, space.encode(space.decode(card)))
+
+        self.assertRaises(ValueError, space.encode, (0, 1, 2))
+        self.assertRaises(ValueError, space.encode, (0, 1, 2, 3, 0))
+        self.assertRaises(ValueError, SetSpace, 0)
+
+    def test_third(self):
+        space = SetSpace(3)
+
+        for card1, card2 in itertools.product(space.cards(), repeat=2):
+            expected = tuple((-a - b) % 3 for a, b in zip(space.decode(card1), space.decode(card2)))
+            self.assertEqual(expected, space.decode(space.third(card1, card2)))
+
+    def test_number_of_sets(self):
+        for dimension in (2, 3, 4, 5):
+            space = SetSpace(dimension)
+            cards = space.cards()
+            present = set(cards)
+            found = set(
+                frozenset((a, b, space.third(a, b))) for a, b in itertools.combinations(cards, 2)
+                if space.third(a, b) in present
+            )
+
+            self.assertEqual(space.size * (space.size - 1) // 6, len(found))
+
+    # --------------------------------------------------------------------------
+    # Finding sets
+
+    def test_matches_set_game(self):
+        space = SetSpace(4)
+        rng = random.Random(5)
+
+        for _ in range(50):
+            board = rng.sample(DECK, 15)
+            packed = [space.encode(digits(card)) for card in board]
+            expected = SetGame.find_sets(board)
+
+            self.assertEqual(
+                [[space.encode(digits(card)) for card in sset] for sset in expected],
+                space.find_sets(packed),
+            )
+            self.assertEqual([space.encode(digits(card)) for card in board], packed)
+
+    def test_large_board(self):
+        space = SetSpace(7)
+        board = random.Random(6).sample(space.cards(), 300)
+        original = set(board)
+        sets = space.find_sets(board)
+
+        self.assertTrue(len(sets) > 0)
+        self.assertFalse(space.has_set(board))
+        self.assertEqual(original, set(board) | set(card for sset in sets for card in sset))
+
+        for card1, card2, card3 in sets:
+            self.assertTrue(space.is_a_set(card1, card2, card3))
+
+        self.assertTrue(space.has_set(sets[0]))
+        self.assertRaises(ValueError, space.find_sets, [0, 0])
+
+    # --------------------------------------------------------------------------
+    # Playing
+
+    def test_play_quiet(self):
+        game = HyperSetGame(5, seed=3)
+        discovered, sets = game.play_quiet()
+
+        self.assertEqual(len(sets), discovered)
+        self.assertEqual(243, discovered * 3 + len(game.board))
+        self.assertEqual(sets, HyperSetGame(5, seed=3).play_quiet()[1])
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
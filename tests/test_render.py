@@ -0,0 +1,109 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import io
+import json
+import unittest
+import nose2
+from prettytable import PrettyTable
+from set_game_demo import SetGame
+from set_game_demo import render
+from set_game_demo.render import card_table, clear_tables, write_sets
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.render module."""
+
+    def setUp(self):
+        """Play a seeded game."""
+        _, self.sets = SetGame(seed=5).play_quiet()
+
+    def render(self, fmt, **kwargs):
+        """Write the Sets in a format, and return the output."""
+        out = io.StringIO()
+        self.assertEqual(len(self.sets), write_sets(self.sets, out, fmt, **kwargs))
+
+        return out.getvalue()
+
+    # --------------------------------------------------------------------------
+    # Formats
+
+    def test_table(self):
+        expected = u""
+
+        # What `set-game-demo --quiet` has always printed for each Set.
+        for i, sset in enumerate(self.sets):
+            table = PrettyTable(["Number", "Color", "Shape", "Shading"])
+
+            for card in sset:
+                table.add_row([card["number"], card["color"], card["shape"], card["shading"]])
+
+            expected += u"\nSet #{}\n{}\n".format(i + 1, table)
+
+        self.assertEqual(expected, self.render("table"))
+        self.assertEqual(expected, self.render("table", chunk_size=7))
+
+        # Dict-shaped cards, which aren't kept.
+        dicts = [card.as_dict() for card in self.sets[0]]
+        self.assertEqual(card_table(self.sets[0]), card_table(dicts))
+
+        # Only Sets are kept, not whole boards.
+        clear_tables()
+        board = [card for sset in self.sets[:4] for card in sset]
+        card_table(self.sets[0])
+        self.assertEqual(len(board) + 4, len(card_table(board).splitlines()))
+        self.assertEqual(1, len(render._TABLES))  # pylint: disable=W0212
+
+    def test_text(self):
+        lines = self.render("text").splitlines()
+
+        self.assertEqual(len(self.sets), len(lines))
+
+        for i, (sset, line) in enumerate(zip(self.sets, lines)):
+            label, names = line.split(": ")
+            self.assertEqual(u"Set #{}".format(i + 1), label)
+
+            for card, name in zip(sset, names.split(", ")):
+                self.assertEqual([card["number"], card["color"], card["shading"]], name.split()[:3])
+                self.assertTrue(name.split()[3].startswith(card["shape"]))
+
+    def test_tsv(self):
+        rows = [line.split(u"\t") for line in self.render("tsv", start=0).splitlines()]
+
+        self.assertEqual([u"set", u"number", u"color", u"shape", u"shading"], rows[0])
+        self.assertEqual(
+            [[str(i), card["number"], card["color"], card["shape"], card["shading"]]
+             for i, sset in enumerate(self.sets) for card in sset],
+            rows[1:]
+        )
+
+    def test_jsonl(self):
+        lines = [json.loads(line) for line in self.render("jsonl", chunk_size=1).splitlines()]
+
+        self.assertEqual(
+            [{"set": i + 1, "cards": [int(card) for card in sset]} for i, sset in enumerate(self.sets)],
+            lines
+        )
+
+    # --------------------------------------------------------------------------
+    # Errors
+
+    def test_nothing_to_write(self):
+        out = io.StringIO()
+
+        self.assertEqual(0, write_sets([], out, "jsonl"))
+        self.assertEqual(u"", out.getvalue())
+        self.assertRaises(ValueError, write_sets, self.sets, out, "xml")
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
@@ -10,9 +10,15 @@ Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
 """
 
 from __future__ import print_function
+import os
+import random
+import subprocess
+import sys
 import unittest
 import nose2
 from set_game_demo import SetGame
+from set_game_demo.events import DEAL, GAME_OVER, NO_SET_EXTRA_DEAL, SET_FOUND, Event
+from set_game_demo.finders import FINDERS
 
 class Test(unittest.TestCase):
     """Unit tests for the set_game_demo.SetGame class."""
@@ -63,6 +69,22 @@ class Test(unittest.TestCase):
     def test_deck(self):
         self.assertEqual(81, len(self.game.deck)) # Should be 3^4 (not 4^3)
 
+    # --------------------------------------------------------------------------
+    # Seeding
+
+    def test_seed(self):
+        self.assertEqual(list(SetGame(seed=42).deck), list(SetGame(seed=42).deck))
+        self.assertNotEqual(list(SetGame(seed=42).deck), list(SetGame(seed=43).deck))
+
+    def test_rng(self):
+        self.assertEqual(list(SetGame(seed=42).deck), list(SetGame(rng=random.Random(42)).deck))
+
+    def test_seed_every_engine(self):
+        expected = SetGame(seed=42).play_quiet()
+
+        for engine in FINDERS:
+            self.assertEqual(expected, SetGame(engine=engine, seed=42).play_quiet())
+
     # --------------------------------------------------------------------------
     # Dealing
 
@@ -377,10 +399,89 @@ class Test(unittest.TestCase):
         self.assertEqual(1, len(sets))  # Find 1 Set.
         self.assertEqual(3, len(board)) # Number of cards remaining on the Board.
 
+    def test_play_iter(self):
+        expected = SetGame(seed=7)
+        expected.play_quiet()
+
+        game = SetGame(seed=7)
+        events = list(game.play_iter())
+        kinds = [event.kind for event in events]
+
+        self.assertEqual(Event(DEAL, events[0].cards), events[0])
+        self.assertEqual(12, len(events[0].cards))
+        self.assertEqual(GAME_OVER, kinds[-1])
+        self.assertEqual(1, kinds.count(GAME_OVER))
+        self.assertEqual(expected.board, events[-1].cards)
+        self.assertEqual(expected.sets, [event.cards for event in events if event.kind == SET_FOUND])
+        self.assertEqual(expected.stalls, kinds.count(NO_SET_EXTRA_DEAL))
+        self.assertEqual(81, sum(len(event.cards) for event in events if event.kind in (DEAL, NO_SET_EXTRA_DEAL)))
+
+        # Nothing is accumulated.
+        self.assertEqual([], game.sets)
+
+    def test_play_rules(self):
+        for seed in range(20):
+            board = []
+
+            for event in SetGame(seed=seed).play_rules_iter():
+                if event.kind == SET_FOUND:
+                    self.assertTrue(SetGame.is_a_set(*event.cards))
+                    self.assertEqual(SetGame.first_set(board), event.cards)
+                    board = [card for card in board if card not in event.cards]
+                elif event.kind == DEAL:
+                    # Only refill a board which is short of 12 cards.
+                    self.assertTrue(len(board) < 12)
+                    board += event.cards
+                elif event.kind == NO_SET_EXTRA_DEAL:
+                    self.assertFalse(SetGame.has_set(board))
+                    board += event.cards
+                else:
+                    self.assertFalse(SetGame.has_set(board))
+                    self.assertEqual(board, event.cards)
+
+    def test_play_rules_every_engine(self):
+        expected = SetGame(seed=11)
+        discovered, sets = expected.play_rules()
+
+        self.assertEqual(len(sets), discovered)
+        self.assertEqual(81, 3 * discovered + len(expected.board))
+
+        events = list(SetGame(seed=11).play_rules_iter())
+
+        for engine in FINDERS:
+            self.assertEqual(events, list(SetGame(seed=11).play_rules_iter(engine)))
+
     def test_play_game(self):
         discovered, _ = self.game.play_quiet()
         self.assertTrue(discovered > 20 or discovered < 29)
 
+    # --------------------------------------------------------------------------
+    # Start-up
+
+    def test_lazy_imports(self):
+        # Only the modules loaded by `import set_game_demo` itself, not by the interpreter.
+        script = (
+            "import sys; before = set(sys.modules); import set_game_demo; "
+            "print(' '.join(sorted(set(sys.modules) - before)))"
+        )
+        loaded = set(self.run_python("-c", script).split())
+
+        self.assertIn("set_game_demo", loaded)
+
+        for module in ("argparse", "collections", "json", "prettytable", "six"):
+            self.assertNotIn(module, loaded)
+
+    def test_command_line(self):
+        self.assertIn("You discovered", self.run_python("-m", "set_game_demo", "--quiet"))
+
+    @staticmethod
+    def run_python(*args):
+        """Run a new Python process from the root of the repository, and return what it printed."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.check_output((sys.executable,) + args, cwd=root)
+
+        return output.decode("utf-8")
+
 # ------------------------------------------------------------------------------
 
 if __name__ == '__main__':
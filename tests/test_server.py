@@ -0,0 +1,147 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import itertools
+import sys
+import unittest
+import nose2
+from set_game_demo import SetGame
+from set_game_demo.cards import DECK
+
+if sys.version_info >= (3, 7):
+    import asyncio
+    from set_game_demo.server import GameServer, Session, Table
+else:  # pragma: no cover
+    GameServer = None
+
+@unittest.skipIf(GameServer is None, "The server requires Python 3.7 or newer.")
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.server module."""
+
+    def play(self, server, session):
+        """Claim the first Set on the board until the game is over. Returns the number of claims."""
+        claims = 0
+
+        while True:
+            reply = server.respond(session, "BOARD").split()
+
+            if reply == ["OVER"]:
+                return claims
+
+            sset = SetGame.first_set([DECK[int(card)] for card in reply[1:]])
+            claims += 1
+            self.assertEqual("SET {}".format(claims), server.respond(session, "CLAIM {} {} {}".format(*map(int, sset))))
+
+    # --------------------------------------------------------------------------
+    # Games
+
+    def test_table(self):
+        table = Table(0, seed=4)
+        player = table.join()
+        board = list(table.board)
+        sset = SetGame.first_set(board)
+        not_a_set = next(cards for cards in itertools.combinations(board, 3) if not SetGame.is_a_set(*cards))
+
+        self.assertEqual("invalid", table.claim(player, list(not_a_set)))
+        self.assertEqual("invalid", table.claim(player, [sset[0], sset[0], sset[0]]))
+        self.assertEqual(None, table.claim(player, sset))
+        self.assertEqual("taken", table.claim(player, sset))
+        self.assertEqual(1, table.scores[player])
+        self.assertTrue(SetGame.has_set(table.board))
+
+    def test_whole_game(self):
+        server = GameServer(seed=7)
+        session = Session()
+
+        self.assertEqual("GAME 0 0", server.respond(session, "NEW"))
+        claims = self.play(server, session)
+
+        table = server.tables[0]
+        self.assertEqual(81, 3 * claims + len(table.board))
+        self.assertFalse(SetGame.has_set(table.board))
+        self.assertEqual("SCORES 0:{}".format(claims), server.respond(session, "SCORES"))
+        self.assertEqual("OVER", server.respond(session, "CLAIM 0 1 2"))
+
+        # The game is forgotten once its last player leaves.
+        server.leave(session)
+        self.assertEqual({}, server.tables)
+
+    def test_players_race(self):
+        server = GameServer()
+        first, second = Session(), Session()
+
+        self.assertEqual("GAME 0 0", server.respond(first, "NEW 3"))
+        self.assertEqual("GAME 0 1", server.respond(second, "JOIN 0"))
+
+        sset = SetGame.first_set(server.tables[0].board)
+        claim = "CLAIM {} {} {}".format(*map(int, sset))
+
+        self.assertEqual("SET 1", server.respond(second, claim))
+        self.assertEqual("MISS taken", server.respond(first, claim))
+        self.assertEqual("SCORES 0:0 1:1", server.respond(first, "SCORES"))
+
+    def test_join_own_game(self):
+        server = GameServer()
+        first, second = Session(), Session()
+
+        # The only player: the game must not be forgotten.
+        self.assertEqual("GAME 0 0", server.respond(first, "NEW 3"))
+        self.assertEqual("GAME 0 0", server.respond(first, "JOIN 0"))
+        self.assertIn(0, server.tables)
+        self.assertTrue(server.respond(first, "BOARD").startswith("BOARD "))
+
+        # With another player: the same player ID, and the score is kept.
+        self.assertEqual("GAME 0 1", server.respond(second, "JOIN 0"))
+        sset = SetGame.first_set(server.tables[0].board)
+        self.assertEqual("SET 1", server.respond(second, "CLAIM {} {} {}".format(*map(int, sset))))
+        self.assertEqual("GAME 0 1", server.respond(second, "JOIN 0"))
+        self.assertEqual("SCORES 0:0 1:1", server.respond(second, "SCORES"))
+        self.assertEqual(2, server.tables[0].connected)
+
+    def test_errors(self):
+        server = GameServer()
+        session = Session()
+
+        for line in ("", "HELLO", "BOARD", "JOIN 5", "JOIN x", "NEW 1 2"):
+            self.assertTrue(server.respond(session, line).startswith("ERROR"), line)
+
+        server.respond(session, "NEW")
+
+        for line in ("CLAIM 1 2", "CLAIM 1 2 81", "CLAIM a b c"):
+            self.assertTrue(server.respond(session, line).startswith("ERROR"), line)
+
+    # --------------------------------------------------------------------------
+    # Networking
+
+    def test_connection(self):
+        async def talk():
+            server = await GameServer(seed=1).start("127.0.0.1", 0)
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+
+            # Commands may be sent in pieces, or several at once.
+            writer.write(b"NE")
+            writer.write(b"W\nSCO")
+            writer.write(b"RES\nQUIT\n")
+            replies = (await reader.read()).decode("ascii").splitlines()
+
+            writer.close()
+            server.close()
+            await server.wait_closed()
+
+            return replies
+
+        self.assertEqual(["GAME 0 0", "SCORES 0:0", "BYE"], asyncio.run(talk()))
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
@@ -0,0 +1,61 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import unittest
+import nose2
+from set_game_demo.simulate import Summary, simulate
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.simulate module."""
+
+    # --------------------------------------------------------------------------
+    # Simulating
+
+    def test_simulate(self):
+        summary = simulate(50, workers=1, seed=7, chunk_size=20)
+
+        self.assertEqual(50, summary.games)
+        self.assertEqual(50, sum(summary.sets.values()))
+        self.assertEqual(50, sum(summary.leftover.values()))
+        self.assertEqual(50, sum(summary.stalls.values()))
+
+        # Every card ends up in a Set or left on the board.
+        for game_sets, count in summary.sets.items():
+            self.assertTrue(count > 0)
+            self.assertTrue(81 - game_sets * 3 in summary.leftover)
+
+    def test_reproducible(self):
+        expected = simulate(30, workers=1, seed=11, chunk_size=10).as_dict()
+
+        self.assertEqual(expected, simulate(30, workers=1, seed=11, chunk_size=10).as_dict())
+        self.assertEqual(expected, simulate(30, workers=2, seed=11, chunk_size=10).as_dict())
+
+    def test_worker_error(self):
+        # Raised by the workers, which stop playing the rest of the games.
+        self.assertRaises(ValueError, simulate, 1000, workers=2, seed=1, engine="nope", chunk_size=1)
+
+    # --------------------------------------------------------------------------
+    # Summaries
+
+    def test_merge(self):
+        summary = Summary()
+        summary.merge(simulate(5, workers=1, seed=1))
+        summary.merge(simulate(5, workers=1, seed=2))
+
+        self.assertEqual(10, summary.games)
+        self.assertEqual(0.0, Summary.mean(Summary().sets))
+        self.assertEqual(10, summary.as_dict()["games"])
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
@@ -0,0 +1,117 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import unittest
+import nose2
+from set_game_demo import SetGame
+from set_game_demo.cards import DECK
+from set_game_demo.finders import has_set
+from set_game_demo.solver import Solver
+
+# A 20-card board with no Sets on it (the largest possible).
+CAP_SET = [0, 1, 3, 4, 9, 10, 12, 13, 27, 28, 32, 35, 38, 47, 59, 65, 66, 67, 71, 77]
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.solver module."""
+
+    def replay(self, deck, sets, rules=False):
+        """Check that the Sets can be taken in order, by the rules of the game. Returns the cards left over."""
+        board = list(deck[:12])
+        dealt = 12
+
+        for sset in sets:
+            while not all(card in board for card in sset):
+                # Only deal when there is no Set to take.
+                self.assertFalse(has_set(board))
+                self.assertTrue(dealt < len(deck))
+                board += deck[dealt:dealt + 3]
+                dealt += 3
+
+            self.assertTrue(SetGame.is_a_set(*sset))
+            board = [card for card in board if card not in sset]
+
+            if rules and len(board) < 12 and dealt < len(deck):
+                board += deck[dealt:dealt + 3]
+                dealt += 3
+
+        return board + list(deck[dealt:])
+
+    def exhaustive(self, deck, dealt, board):
+        """The most Sets that can be taken, without any pruning."""
+        sets = [sset for sset in Solver(deck)._Solver__sets(board)]
+
+        if not sets:
+            if dealt == len(deck):
+                return 0
+            return self.exhaustive(deck, dealt + 3, board | 7 << dealt)
+
+        return max(
+            1 + self.exhaustive(deck, dealt, board & ~(1 << a | 1 << b | 1 << c))
+            for a, b, c in sets
+        )
+
+    # --------------------------------------------------------------------------
+    # Searching
+
+    def test_greedy_first(self):
+        for seed in range(5):
+            expected = SetGame(seed=seed).play_quiet()
+            self.assertEqual(expected, Solver(list(SetGame(seed=seed).deck), max_nodes=1).solve())
+
+            expected = SetGame(seed=seed).play_rules()
+            self.assertEqual(expected, Solver(list(SetGame(seed=seed).deck), rules=True, max_nodes=1).solve())
+
+    def test_never_worse_than_greedy(self):
+        for seed in range(5):
+            for rules in (False, True):
+                deck = list(SetGame(seed=seed).deck)
+                greedy, _ = Solver(deck, rules=rules, max_nodes=1).solve()
+                solver = Solver(deck, rules=rules)
+                discovered, sets = solver.solve()
+
+                self.assertTrue(solver.optimal)
+                self.assertTrue(discovered >= greedy)
+                self.assertEqual(discovered, len(sets))
+                self.assertEqual(sorted(solver.board), sorted(self.replay(deck, sets, rules)))
+
+    def test_matches_exhaustive_search(self):
+        for seed in range(10):
+            deck = list(SetGame(seed=seed).deck)[:27]
+            discovered, _ = Solver(deck).solve()
+
+            self.assertEqual(self.exhaustive(deck, 12, (1 << 12) - 1), discovered)
+
+    def test_cap_set(self):
+        solver = Solver([DECK[i] for i in CAP_SET] + [DECK[2]])
+        self.assertEqual((0, []), Solver([DECK[i] for i in CAP_SET]).solve())
+        self.assertEqual(1, solver.solve()[0])
+        self.assertEqual(18, len(solver.board))
+
+        self.assertRaises(ValueError, Solver, [DECK[0], DECK[0]])
+
+    # --------------------------------------------------------------------------
+    # Playing
+
+    def test_solve(self):
+        game = SetGame(seed=3)
+        discovered, sets = game.solve()
+
+        self.assertEqual(len(sets), discovered)
+        self.assertEqual(game.sets, sets)
+        self.assertEqual(81, 3 * discovered + len(game.board))
+        self.assertEqual(0, len(game.deck))
+        self.assertTrue(discovered >= SetGame(seed=3).play_quiet()[0])
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
@@ -0,0 +1,175 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import threading
+import unittest
+import nose2
+from set_game_demo import SetGame
+from set_game_demo.events import GAME_OVER, SET_FOUND
+from set_game_demo.state import GameState
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.state module."""
+
+    def assertConsistent(self, state):
+        """Check that every card is either in the deck, on the board or in a Set, exactly once."""
+        taken = [card for sset in state.sets for card in sset]
+
+        self.assertEqual(state.cursor, len(state.board) + len(taken))
+        self.assertEqual(sorted(state.cards[:state.cursor]), sorted(list(state.board) + taken))
+
+        for sset in state.sets:
+            self.assertTrue(SetGame.is_a_set(*sset))
+
+    # --------------------------------------------------------------------------
+    # States
+
+    def test_immutable(self):
+        state = SetGame(seed=5).snapshot().deal(12)
+        board = state.board
+        sset = state.first_set()
+
+        self.assertRaises(AttributeError, setattr, state, "cursor", 0)
+        self.assertEqual(state.take(sset), state.take(sset))
+        self.assertEqual(hash(state.take(sset)), hash(state.take(sset)))
+
+        # Searching and moving leave the state alone.
+        sets, leftover = state.find_sets()
+        self.assertEqual(SetGame.find_sets(list(board)), sets)
+        self.assertEqual(len(board), len(leftover) + 3 * len(sets))
+        state.play(sset)
+        state.futures()
+        self.assertEqual(board, state.board)
+        self.assertEqual((), state.sets)
+        self.assertEqual(12, state.cursor)
+
+        self.assertRaises(ValueError, state.take, sset[:2] + (sset[0],))
+        self.assertRaises(ValueError, state.take, [0, 1, 2] if 0 not in board else [78, 79, 80])
+        self.assertRaises(IndexError, state.deal, 70)
+        self.assertRaises(ValueError, state.deal, -3)
+
+    def test_apply(self):
+        for iterate in ("play_iter", "play_rules_iter"):
+            game = SetGame(seed=5)
+            state = game.snapshot()
+
+            for event in getattr(game, iterate)():
+                state = state.apply(event)
+                self.assertConsistent(state)
+
+            self.assertTrue(state.is_over)
+            self.assertEqual(game.board, list(state.board))
+
+    def test_play(self):
+        # Playing the first Set each time is the same game as `play_rules()`.
+        game = SetGame(seed=5)
+        state = game.snapshot().deal(12).settle()
+
+        while not state.is_over:
+            state = state.play(state.first_set())
+
+        self.assertEqual(game.play_rules(), (len(state.sets), [list(sset) for sset in state.sets]))
+        self.assertEqual(game.stalls, state.stalls)
+
+    def test_futures(self):
+        state = SetGame(seed=5).snapshot().deal(12).settle()
+        futures = state.futures()
+
+        self.assertEqual(len(state.sets_on_board()), len(futures))
+
+        for sset, future in futures:
+            self.assertEqual((sset,), future.sets)
+            self.assertConsistent(future)
+            self.assertTrue(future.has_set() or future.is_over)
+
+    # --------------------------------------------------------------------------
+    # Sharing
+
+    def test_readers(self):
+        game = SetGame(seed=5, shared=True)
+        seen = []
+        done = threading.Event()
+
+        def read():
+            while not done.is_set():
+                seen.append(game.snapshot())
+
+        reader = threading.Thread(target=read)
+        reader.start()
+
+        try:
+            for event in game.play_rules_iter():
+                if event.kind == SET_FOUND:
+                    game.sets.append(event.cards)
+        finally:
+            done.set()
+            reader.join()
+
+        for state in seen:
+            self.assertConsistent(state)
+
+        final = game.snapshot()
+        self.assertTrue(final.is_over)
+        self.assertEqual(game.sets, [list(sset) for sset in final.sets])
+        self.assertEqual(SetGame(seed=5).play_rules()[1], game.sets)
+
+    def test_solvers(self):
+        game = SetGame(seed=7, shared=True)
+        events = game.play_rules_iter()
+        next(events)
+        start = game.snapshot()
+        results = {}
+
+        def explore(sset, future):
+            while not future.is_over:
+                future = future.play(future.first_set())
+
+            results[sset] = future
+
+        threads = [threading.Thread(target=explore, args=pair) for pair in start.futures()]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(start.futures()), len(results))
+        best = max(results.values(), key=lambda state: len(state.sets))
+
+        # Only the first solver to commit against the starting state wins.
+        self.assertTrue(game.commit(best, expected=start))
+        self.assertFalse(game.commit(start.futures()[0][1], expected=start))
+        self.assertEqual(best, game.snapshot())
+        self.assertEqual([list(sset) for sset in best.sets], game.sets)
+        self.assertEqual(len(best.cards), game.deck.cursor)
+
+        self.assertRaises(ValueError, game.commit, SetGame(seed=8).snapshot())
+
+    def test_not_shared(self):
+        game = SetGame(seed=5)
+
+        self.assertEqual(None, game.lock)
+        game.play_quiet()
+
+        state = game.snapshot()
+        self.assertEqual(GameState(state.cards, 81, game.board, game.sets, game.stalls), state)
+        self.assertTrue(state.is_over)
+
+        for event in SetGame(seed=5, shared=True).play_iter():
+            if event.kind == GAME_OVER:
+                self.assertEqual(game.board, event.cards)
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
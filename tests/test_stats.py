@@ -0,0 +1,100 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import json
+import pickle
+import unittest
+import nose2
+from set_game_demo import SetGame
+from set_game_demo.cards import DECK
+from set_game_demo.simulate import simulate
+from set_game_demo.stats import Stats, active_stats
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.stats module."""
+
+    # --------------------------------------------------------------------------
+    # Recording
+
+    def test_disabled(self):
+        game = SetGame(seed=5)
+
+        self.assertEqual(None, game.stats)
+        self.assertEqual(None, active_stats())
+        self.assertEqual(SetGame(seed=5).play_quiet(), game.play_quiet())
+
+    def test_game(self):
+        expected = SetGame(seed=5, engine="combinations").play_quiet()
+        game = SetGame(seed=5, engine="combinations", stats=True)
+
+        self.assertEqual(expected, game.play_quiet())
+        self.assertEqual(None, active_stats())
+
+        counters = game.stats.counters
+        rejected = sum(counters["is_a_set.rejected." + name] for name in ("color", "shape", "shading", "number"))
+
+        self.assertEqual(81, counters["deal.cards"])
+        self.assertEqual(expected[0], counters["find_sets.sets"])
+        self.assertEqual(expected[0], counters["combinations.restarts"])
+        self.assertEqual(counters["is_a_set.calls"], rejected + expected[0])
+        self.assertEqual(24, game.stats.timers["deal"][0])
+
+    def test_rejections(self):
+        with Stats() as stats:
+            SetGame.find_sets([DECK[0], DECK[1], DECK[5]], "combinations")
+            SetGame.find_sets([card.as_dict() for card in (DECK[0], DECK[28], DECK[9])], "combinations")
+
+        self.assertEqual(2, stats.counters["is_a_set.calls"])
+        self.assertEqual(1, stats.counters["is_a_set.rejected.shading"])
+        self.assertEqual(1, stats.counters["is_a_set.rejected.color"])
+
+    def test_nested(self):
+        with Stats() as total:
+            games = [SetGame(seed=seed, stats=True) for seed in range(3)]
+
+            # Interleave the games; each only records its own steps.
+            events = [game.play_rules_iter() for game in games]
+
+            for items in zip(*events):
+                pass
+
+        self.assertEqual(243, total.counters["deal.cards"])
+        self.assertEqual([81] * 3, [game.stats.counters["deal.cards"] for game in games])
+        self.assertEqual(sum(game.stats.timers["take_set"][0] for game in games), total.timers["take_set"][0])
+
+    # --------------------------------------------------------------------------
+    # Exporting
+
+    def test_export(self):
+        stats = Stats()
+        stats.count("a", 2)
+        stats.add_time("b", 0.5)
+
+        other = pickle.loads(pickle.dumps(stats)).merge(stats)
+
+        self.assertEqual({"counters": {"a": 4}, "timers": {"b": {"calls": 2, "seconds": 1.0}}}, other.as_dict())
+        self.assertEqual(other.as_dict(), json.loads(other.to_json()))
+
+        other.clear()
+        self.assertEqual({"counters": {}, "timers": {}}, other.as_dict())
+
+    def test_simulate(self):
+        plain = simulate(30, workers=1, seed=2, chunk_size=10).as_dict()
+        summary = simulate(30, workers=1, seed=2, chunk_size=10, stats=True).as_dict()
+
+        self.assertEqual(81 * 30, summary.pop("stats")["counters"]["deal.cards"])
+        self.assertEqual(plain, summary)
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
@@ -0,0 +1,100 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import itertools
+import random
+import unittest
+import nose2
+from set_game_demo.cards import DECK, THIRD
+from set_game_demo.symmetry import canonical_form, canonicalize, equivalent, fingerprint
+
+# A 20-card board with no Sets on it (the largest possible).
+CAP_SET = [0, 1, 3, 4, 9, 10, 12, 13, 27, 28, 32, 35, 38, 47, 59, 65, 66, 67, 71, 77]
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.symmetry module."""
+
+    def setUp(self):
+        """Seed a private random number generator."""
+        self.rng = random.Random(17)
+
+    def affine_map(self):
+        """A random symmetry of the deck: an invertible linear map of the attributes, then a shift of each value."""
+        while True:
+            matrix = [[self.rng.randrange(3) for _ in range(4)] for _ in range(4)]
+            images = set()
+
+            for card in range(81):
+                images.add(tuple(sum(row[j] * (card // 3 ** j % 3) for j in range(4)) % 3 for row in matrix))
+
+            if len(images) == 81:
+                break
+
+        shift = [self.rng.randrange(3) for _ in range(4)]
+
+        def mapping(card):
+            values = [(sum(row[j] * (card // 3 ** j % 3) for j in range(4)) + shift[i]) % 3
+                      for i, row in enumerate(matrix)]
+            return DECK[sum(value * 3 ** i for i, value in enumerate(values))]
+
+        return mapping
+
+    # --------------------------------------------------------------------------
+    # Canonical forms
+
+    def test_invariant_under_symmetries(self):
+        for size in (1, 3, 6, 12, 15):
+            for _ in range(15):
+                board = self.rng.sample(DECK, size)
+                mapping = self.affine_map()
+                image = [mapping(card) for card in board]
+                self.rng.shuffle(image)
+
+                self.assertEqual(canonical_form(board), canonical_form(image))
+                self.assertTrue(equivalent(board, image))
+                self.assertEqual(fingerprint(board), fingerprint(image))
+
+    def test_images_keep_sets(self):
+        for _ in range(20):
+            board = self.rng.sample(DECK, 12)
+            form, images = canonicalize(board)
+
+            self.assertEqual(form, tuple(sorted(images)))
+
+            for i, j in itertools.combinations(range(12), 2):
+                if THIRD[board[i]][board[j]] in board:
+                    self.assertEqual(THIRD[images[i]][images[j]], images[board.index(THIRD[board[i]][board[j]])])
+                else:
+                    self.assertFalse(THIRD[images[i]][images[j]] in images)
+
+    def test_small_boards(self):
+        self.assertEqual(((), ()), canonicalize([]))
+
+        # Every Set is alike, and so is every 3 cards which are not a Set.
+        self.assertEqual(set([(0, 1, 2)]), set(canonical_form(sset) for sset in [(0, 1, 2), (5, 40, 75), (13, 40, 67)]))
+        self.assertEqual(set([(0, 1, 3)]), set(canonical_form(cards) for cards in [(0, 1, 3), (5, 40, 76), (7, 8, 80)]))
+        self.assertFalse(equivalent([0, 1, 2], [0, 1, 3]))
+
+    def test_cap_set(self):
+        self.assertEqual(tuple(CAP_SET), canonical_form([DECK[card] for card in reversed(CAP_SET)]))
+        self.assertEqual((20, 0, (0,) * 20), fingerprint(CAP_SET))
+
+    def test_cards(self):
+        board = [DECK[card] for card in (0, 1, 2, 40)]
+
+        self.assertEqual(canonical_form(board), canonical_form([card.as_dict() for card in board]))
+        self.assertRaises(ValueError, canonical_form, [DECK[0], DECK[1], DECK[0]])
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()
@@ -0,0 +1,80 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A simple demo of the game of "Set".
+
+Copyright (c) 2016 [Ryan Parman](https://github.com/skyzyx).
+
+<http://opensource.org/licenses/Apache2.0>
+"""
+
+from __future__ import print_function
+import os
+import random
+import shutil
+import tempfile
+import unittest
+import nose2
+from set_game_demo import SetGame
+from set_game_demo.board import BoardIndex
+from set_game_demo.cards import DECK
+from set_game_demo.table import SetTable, get_table
+
+class Test(unittest.TestCase):
+    """Unit tests for the set_game_demo.table module."""
+
+    def setUp(self):
+        """Create a scratch directory."""
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        shutil.rmtree(self.directory)
+
+    # --------------------------------------------------------------------------
+    # Building
+
+    def test_build(self):
+        table = get_table()
+        self.assertTrue(table is get_table())
+        self.assertEqual(1080, len(table))
+        self.assertEqual(1080, len(set(table.sets)))
+
+        for card1, card2, card3 in table.sets:
+            self.assertTrue(card1 < card2 < card3)
+            self.assertTrue(SetGame.is_a_set(DECK[card1], DECK[card2], DECK[card3]))
+
+        for partners in table.partners:
+            self.assertEqual(40, len(partners))
+
+    def test_save_and_load(self):
+        path = os.path.join(self.directory, "sets.bin")
+        get_table().save(path)
+
+        self.assertEqual(get_table().sets, SetTable.load(path).sets)
+
+    def test_load_garbage(self):
+        path = os.path.join(self.directory, "garbage.bin")
+
+        with open(path, "wb") as handle:
+            handle.write(b"\0" * 64)
+
+        self.assertRaises(ValueError, SetTable.load, path)
+
+    # --------------------------------------------------------------------------
+    # Board queries
+
+    def test_sets_on(self):
+        rng = random.Random(99)
+
+        for _ in range(50):
+            cards = rng.sample(DECK, 15)
+            expected = sorted(sorted(s) for s in BoardIndex(cards).sets())
+
+            self.assertEqual(expected, sorted(get_table().sets_on(cards)))
+
+# ------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    nose2.main()